@@ -183,13 +183,9 @@ if FASTAPI_AVAILABLE:
         checker = get_health_checker()
         health = checker.perform_health_check()
 
-        return {
-            "status": health.status,
-            "healthy": health.healthy,
-            "checks": health.checks,
-            "metrics": health.metrics,
-            "timestamp": datetime.utcnow().isoformat(),
-        }
+        # the payload is plain JSON types already; returning a JSONResponse
+        # skips FastAPI's recursive jsonable_encoder pass on every poll
+        return JSONResponse(content=health.to_dict())
 
     @app.post("/scans", response_model=ScanResponse)
     async def create_scan(
@@ -208,7 +204,7 @@ if FASTAPI_AVAILABLE:
                     status_code=404, detail=f"Template not found: {request.template}"
                 )
 
-            request.standards = template.standards
+            request.standards = list(template.standards)
             request.mode = template.mode
             request.max_pages = template.max_pages
             request.max_depth = template.max_depth
@@ -16,7 +16,9 @@ SEVERITY_ORDER: Dict[str, int] = {
     "pass": 4,
 }
 
-@dataclass
+# slots: a scan can produce thousands of these, and the GUI keeps them for
+# the results view
+@dataclass(slots=True)
 class FindingDetail:
 
     severity: str
@@ -3,7 +3,7 @@ from __future__ import annotations
 import time
 from collections import deque
 from threading import Lock
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
 from ..core.exceptions import RateLimitError
 from ..utils.logging_config import get_logger
@@ -20,61 +20,63 @@ class RateLimiter:
         self.rate = requests_per_second
         self.burst_size = burst_size or int(requests_per_second * 2)
         self.tokens = float(self.burst_size)
-        self.last_update = time.time()
+        self.last_update = time.monotonic()
         self.lock = Lock()
     
     def acquire(self, tokens: int = 1, blocking: bool = True, timeout: Optional[float] = None) -> bool:
 
-        start_time = time.time()
         max_timeout = min(timeout, 300.0) if timeout is not None else 300.0
-        
-        while True:
-            if time.time() - start_time > max_timeout:
-                logger.warning(f"Rate limiter acquire timed out after {max_timeout}s")
-                return False
+
+        with self.lock:
+            now = time.monotonic()
+            elapsed = now - self.last_update
+            self.tokens = min(
+                self.burst_size,
+                self.tokens + elapsed * self.rate
+            )
+            self.last_update = now
             
-            with self.lock:
-                now = time.time()
-                elapsed = now - self.last_update
-                self.tokens = min(
-                    self.burst_size,
-                    self.tokens + elapsed * self.rate
+            if self.tokens >= tokens:
+                self.tokens -= tokens
+                return True
+            
+            wait_time = (tokens - self.tokens) / self.rate
+            if not blocking:
+                raise RateLimitError(
+                    f"Rate limit exceeded. Try again in {wait_time:.2f} seconds",
+                    retry_after=int(wait_time) + 1
                 )
-                self.last_update = now
-                
-                if self.tokens >= tokens:
-                    self.tokens -= tokens
-                    return True
-                
-                if not blocking:
-                    wait_time = (tokens - self.tokens) / self.rate
-                    raise RateLimitError(
-                        f"Rate limit exceeded. Try again in {wait_time:.2f} seconds",
-                        retry_after=int(wait_time) + 1
-                    )
-                
-                if timeout and (time.time() - start_time) >= timeout:
-                    return False
             
-            time.sleep(0.1)
+            if wait_time > max_timeout:
+                logger.warning(f"Rate limiter acquire would wait {wait_time:.2f}s, over {max_timeout}s")
+                return False
+
+            # the tokens are taken now, leaving the bucket in debt, so
+            # callers queue up in order and each sleeps exactly until its
+            # share has refilled
+            self.tokens -= tokens
+
+        time.sleep(wait_time)
+        return True
     
     def reset(self) -> None:
         with self.lock:
             self.tokens = float(self.burst_size)
-            self.last_update = time.time()
+            self.last_update = time.monotonic()
 
 class SlidingWindowRateLimiter:
     
     def __init__(self, max_requests: int, window_seconds: int = 60):
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self.requests: deque = deque()
+        # never holds more than max_requests timestamps, oldest on the left
+        self.requests: deque = deque(maxlen=max_requests)
         self.lock = Lock()
     
     def is_allowed(self, identifier: str = "default") -> bool:
 
         with self.lock:
-            now = time.time()
+            now = time.monotonic()
             cutoff = now - self.window_seconds
             
             while self.requests and self.requests[0] < cutoff:
@@ -92,7 +94,7 @@ class SlidingWindowRateLimiter:
                 return 0
             
             oldest = self.requests[0]
-            wait_time = self.window_seconds - (time.time() - oldest)
+            wait_time = self.window_seconds - (time.monotonic() - oldest)
             return max(0, int(wait_time) + 1)
 
 class MultiTierRateLimiter:
@@ -121,28 +123,37 @@ class MultiTierRateLimiter:
 
 class DomainRateLimiter:
     
+    # power of two, so a domain's shard is picked with a mask
+    _SHARD_COUNT = 16
+    
     def __init__(self, requests_per_second: float = 5.0):
         self.rate = requests_per_second
-        self.limiters: Dict[str, RateLimiter] = {}
-        self.lock = Lock()
+        # domains are spread over shards that each have their own lock, so
+        # threads scanning different domains rarely wait on each other
+        self._shards: List[Tuple[Dict[str, RateLimiter], Lock]] = [
+            ({}, Lock()) for _ in range(self._SHARD_COUNT)
+        ]
     
     def get_limiter(self, domain: str) -> RateLimiter:
-        with self.lock:
-            if domain not in self.limiters:
-                self.limiters[domain] = RateLimiter(self.rate)
-            return self.limiters[domain]
+        limiters, lock = self._shards[hash(domain) & (self._SHARD_COUNT - 1)]
+        with lock:
+            limiter = limiters.get(domain)
+            if limiter is None:
+                limiter = limiters[domain] = RateLimiter(self.rate)
+            return limiter
     
     def acquire(self, domain: str, blocking: bool = True, timeout: Optional[float] = None) -> bool:
         limiter = self.get_limiter(domain)
         return limiter.acquire(blocking=blocking, timeout=timeout)
     
     def cleanup_old_limiters(self, max_age_seconds: int = 3600) -> None:
-        with self.lock:
-            now = time.time()
-            to_remove = [
-                domain for domain, limiter in self.limiters.items()
-                if now - limiter.last_update > max_age_seconds
-            ]
-            for domain in to_remove:
-                del self.limiters[domain]
-                logger.debug(f"Removed rate limiter for domain: {domain}")
+        for limiters, lock in self._shards:
+            with lock:
+                now = time.monotonic()
+                to_remove = [
+                    domain for domain, limiter in limiters.items()
+                    if now - limiter.last_update > max_age_seconds
+                ]
+                for domain in to_remove:
+                    del limiters[domain]
+                    logger.debug(f"Removed rate limiter for domain: {domain}")
@@ -5,6 +5,14 @@ from typing import List, Optional
 from urllib.parse import urlparse
 from ..core.exceptions import ValidationError
 
+_URL_PREFIXES = ("http://", "https://")
+
+_DOMAIN_RE = re.compile(
+    r'^(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)*'
+    r'[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?$'
+)
+_IPV4_RE = re.compile(r'^\d+\.\d+\.\d+\.\d+$')
+
 class URLValidator:
     ALLOWED_SCHEMES = {"http", "https"}
     MAX_URL_LENGTH = 2048
@@ -22,7 +30,7 @@ class URLValidator:
                 details={"url_length": len(url)}
             )
         
-        if not url.startswith(("http://", "https://")):
+        if not url.startswith(_URL_PREFIXES):
             url = "https://" + url
         
         try:
@@ -50,14 +58,9 @@ class URLValidator:
         if parsed.netloc.startswith(".") or parsed.netloc.endswith("."):
             raise ValidationError("Invalid domain format")
         
-        domain_pattern = re.compile(
-            r'^(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)*'
-            r'[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?$'
-        )
-        
         hostname = parsed.hostname or parsed.netloc.split(":")[0]
-        if not re.match(r'^\d+\.\d+\.\d+\.\d+$', hostname):
-            if not domain_pattern.match(hostname):
+        if not _IPV4_RE.match(hostname):
+            if not _DOMAIN_RE.match(hostname):
                 raise ValidationError(
                     "Invalid domain name format",
                     details={"hostname": hostname}
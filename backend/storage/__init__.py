@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from .database import ScanDatabase
+from .database import ScanDatabase, ScanRow
 from .cache import Cache, FileCache, LRUCache, cached
 
 __all__ = [
@@ -8,5 +8,6 @@ __all__ = [
     "FileCache",
     "LRUCache",
     "ScanDatabase",
+    "ScanRow",
     "cached",
 ]
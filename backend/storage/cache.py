@@ -17,11 +17,14 @@ class Cache:
         self.default_ttl = default_ttl
     
     def get(self, key: str) -> Optional[Any]:
-        if key not in self._cache:
+        # expiries are monotonic deadlines, so a hit is one dict probe and
+        # a float compare
+        try:
+            value, expiry = self._cache[key]
+        except KeyError:
             return None
         
-        value, expiry = self._cache[key]
-        if time.time() > expiry:
+        if time.monotonic() > expiry:
             del self._cache[key]
             return None
         
@@ -29,7 +32,7 @@ class Cache:
     
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         ttl = ttl if ttl is not None else self.default_ttl
-        expiry = time.time() + ttl
+        expiry = time.monotonic() + ttl
         self._cache[key] = (value, expiry)
     
     def delete(self, key: str) -> bool:
@@ -42,7 +45,7 @@ class Cache:
         self._cache.clear()
     
     def cleanup_expired(self) -> int:
-        now = time.time()
+        now = time.monotonic()
         expired = [k for k, (_, expiry) in self._cache.items() if now > expiry]
         for key in expired:
             del self._cache[key]
@@ -56,11 +59,33 @@ class FileCache:
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.default_ttl = default_ttl
+        # cache file -> expiry. Built from disk on first clear/cleanup and
+        # kept in sync by set/get/delete, so sweeps don't re-list and re-read
+        # the directory. Entries written by other processes after the index
+        # is built are not tracked.
+        self._index: Optional[Dict[Path, float]] = None
     
     def _get_cache_path(self, key: str) -> Path:
         key_hash = hashlib.sha256(key.encode()).hexdigest()
         return self.cache_dir / f"{key_hash}.cache"
     
+    def _get_index(self) -> Dict[Path, float]:
+        if self._index is None:
+            index: Dict[Path, float] = {}
+            for cache_file in self.cache_dir.glob("*.cache"):
+                try:
+                    with open(cache_file, 'r', encoding='utf-8') as f:
+                        index[cache_file] = float(json.load(f)['expiry'])
+                except Exception:
+                    # unreadable entries are treated as already expired
+                    index[cache_file] = 0.0
+            self._index = index
+        return self._index
+    
+    def _forget(self, cache_path: Path) -> None:
+        if self._index is not None:
+            self._index.pop(cache_path, None)
+    
     def get(self, key: str) -> Optional[Any]:
         cache_path = self._get_cache_path(key)
         
@@ -73,6 +98,7 @@ class FileCache:
             
             if time.time() > data['expiry']:
                 cache_path.unlink()
+                self._forget(cache_path)
                 return None
             
             return data['value']
@@ -97,35 +123,33 @@ class FileCache:
             logger.warning(f"Failed to serialize cache data: {e}")
         except Exception as e:
             logger.warning(f"Failed to write cache file: {e}")
+        else:
+            if self._index is not None:
+                self._index[cache_path] = data['expiry']
     
     def delete(self, key: str) -> bool:
         cache_path = self._get_cache_path(key)
+        self._forget(cache_path)
         if cache_path.exists():
             cache_path.unlink()
             return True
         return False
     
     def clear(self) -> None:
-        for cache_file in self.cache_dir.glob("*.cache"):
-            cache_file.unlink()
+        for cache_file in self._get_index():
+            cache_file.unlink(missing_ok=True)
+        self._index = {}
     
     def cleanup_expired(self) -> int:
-        count = 0
+        index = self._get_index()
         now = time.time()
+        expired = [path for path, expiry in index.items() if now > expiry]
         
-        for cache_file in self.cache_dir.glob("*.cache"):
-            try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                if now > data['expiry']:
-                    cache_file.unlink()
-                    count += 1
-            except Exception:
-                cache_file.unlink()
-                count += 1
+        for cache_file in expired:
+            cache_file.unlink(missing_ok=True)
+            del index[cache_file]
         
-        return count
+        return len(expired)
 
 class LRUCache:
     def __init__(self, max_size: int = 1000):
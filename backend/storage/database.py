@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import json
 import sqlite3
+import threading
+from collections import OrderedDict, namedtuple
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
 from contextlib import contextmanager
 
 from ..core.exceptions import DatabaseError
@@ -14,11 +16,63 @@ from ..utils.logging_config import get_logger
 
 logger = get_logger("database")
 
+_READ_CACHE_SIZE = 500
+
+# columns a caller may project with get_scans(columns=...); anything else is
+# rejected so the names can be placed in the SELECT safely
+_SCAN_COLUMNS = frozenset({
+    "id", "scan_id", "url", "mode", "standards", "start_time", "end_time",
+    "duration_seconds", "status", "score", "critical_count", "high_count",
+    "medium_count", "low_count", "pages_scanned", "results_json",
+    "error_message", "created_at",
+})
+
+# a history listing row as returned by get_scan_rows, with missing values
+# already replaced by their display defaults; (start_time, id) is the row's
+# page cursor
+ScanRow = namedtuple("ScanRow", "scan_id url start_time status score pages_scanned id")
+
+_SCAN_ROW_SELECT = """
+    SELECT scan_id,
+           COALESCE(NULLIF(url, ''), 'Unknown'),
+           COALESCE(NULLIF(start_time, ''), 'Unknown'),
+           COALESCE(NULLIF(status, ''), 'unknown'),
+           CAST(COALESCE(score, 0) AS REAL),
+           COALESCE(pages_scanned, 0),
+           id
+    FROM scans
+"""
+
+
+def _select_list(columns: Optional[Tuple[str, ...]]) -> str:
+    if columns is None:
+        return "*"
+    unknown = set(columns) - _SCAN_COLUMNS
+    if unknown or not columns:
+        raise ValueError(f"Unknown scan columns: {sorted(unknown)}")
+    return ", ".join(columns)
+
 
 class ScanDatabase:
-    def __init__(self, db_path: Path | str):
+    def __init__(self, db_path: Path | str, cache_reads: bool = False):
+        """Open (and create if needed) the scan database at ``db_path``.
+
+        With ``cache_reads`` the list and statistics queries are memoized
+        until the data changes: writes through this instance bump a version
+        counter, and SQLite's ``PRAGMA data_version`` on a long-lived
+        connection catches commits from other connections and processes.
+        Cached results are shared between callers and must not be mutated.
+        """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._cache_reads = cache_reads
+        self._read_cache: OrderedDict[Hashable, Tuple[Tuple[int, int], Any]] = OrderedDict()
+        self._read_cache_lock = threading.Lock()
+        self._write_version = 0
+        # only used for PRAGMA data_version, which changes whenever another
+        # connection commits; opened on the first cached read
+        self._version_conn: Optional[sqlite3.Connection] = None
+        self._version_lock = threading.Lock()
         self._init_database()
 
     @contextmanager
@@ -87,11 +141,62 @@ class ScanDatabase:
                 CREATE INDEX IF NOT EXISTS idx_scans_url ON scans(url);
                 CREATE INDEX IF NOT EXISTS idx_scans_status ON scans(status);
                 CREATE INDEX IF NOT EXISTS idx_scans_start_time ON scans(start_time);
+                CREATE INDEX IF NOT EXISTS idx_scans_status_start_time
+                    ON scans(status, start_time DESC);
+                CREATE INDEX IF NOT EXISTS idx_scans_url_start_time
+                    ON scans(url, start_time DESC);
+                -- covers the history and dashboard projections, so their
+                -- newest-first reads never touch the table rows; id breaks
+                -- start_time ties in the same order the page cursor uses
+                CREATE INDEX IF NOT EXISTS idx_scans_start_time_listing
+                    ON scans(start_time DESC, id DESC, scan_id, url, status,
+                             score, pages_scanned, standards);
                 CREATE INDEX IF NOT EXISTS idx_findings_scan_id ON findings(scan_id);
                 CREATE INDEX IF NOT EXISTS idx_findings_severity ON findings(severity);
                 """
             )
 
+    def _mark_written(self) -> None:
+        # called after the write has committed, so a read that starts later
+        # can't cache pre-write rows under the new version
+        with self._read_cache_lock:
+            self._write_version += 1
+
+    def _data_version(self) -> Tuple[int, int]:
+        with self._version_lock:
+            if self._version_conn is None:
+                self._version_conn = sqlite3.connect(
+                    str(self.db_path), check_same_thread=False
+                )
+            (data_version,) = self._version_conn.execute("PRAGMA data_version").fetchone()
+        return (self._write_version, data_version)
+
+    def _cached_read(self, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        if not self._cache_reads:
+            return fetch()
+
+        # the version is taken before querying, so a write that lands while
+        # the query runs leaves the entry already stale
+        version = self._data_version()
+        with self._read_cache_lock:
+            entry = self._read_cache.get(key)
+            if entry is not None and entry[0] == version:
+                self._read_cache.move_to_end(key)
+                return entry[1]
+
+        result = fetch()
+        with self._read_cache_lock:
+            self._read_cache[key] = (version, result)
+            self._read_cache.move_to_end(key)
+            while len(self._read_cache) > _READ_CACHE_SIZE:
+                self._read_cache.popitem(last=False)
+        return result
+
+    def invalidate_cache(self) -> None:
+        """Drop memoized reads so the next call goes to SQLite."""
+        with self._read_cache_lock:
+            self._read_cache.clear()
+
     def create_scan(
         self,
         scan_id: str,
@@ -110,6 +215,59 @@ class ScanDatabase:
                 """,
                 (scan_id, url, mode, standards_json, start_time, "running"),
             )
+        self._mark_written()
+
+    def create_scans_bulk(
+        self, scans: List[Tuple[str, str, str, Optional[List[str]]]]
+    ) -> int:
+        """Insert ``(scan_id, url, mode, standards)`` rows as running scans.
+
+        Same columns as ``create_scan``, but one ``executemany`` and one
+        commit for the whole batch; every row gets the same start time.
+        Returns the number of rows inserted.
+        """
+        start_time = datetime.now(timezone.utc).isoformat()
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                """
+                INSERT INTO scans (scan_id, url, mode, standards, start_time, status)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    (scan_id, url, mode, json.dumps(standards or []), start_time, "running")
+                    for scan_id, url, mode, standards in scans
+                ),
+            )
+            inserted = cursor.rowcount
+        self._mark_written()
+        return inserted
+
+    def record_failed_scan(
+        self,
+        scan_id: str,
+        url: str,
+        mode: str,
+        standards: Optional[List[str]],
+        error_message: str,
+    ) -> None:
+        """Mark ``scan_id`` as failed, creating its row if it doesn't exist yet."""
+        start_time = datetime.now(timezone.utc).isoformat()
+
+        with self._get_connection() as conn:
+            conn.execute(
+                """
+                INSERT OR IGNORE INTO scans (scan_id, url, mode, standards, start_time, status)
+                VALUES (?, ?, ?, ?, ?, 'failed')
+                """,
+                (scan_id, url, mode, json.dumps(standards or []), start_time),
+            )
+            conn.execute(
+                "UPDATE scans SET status = 'failed', error_message = ? WHERE scan_id = ?",
+                (error_message, scan_id),
+            )
+        self._mark_written()
 
     def update_scan(
         self,
@@ -187,7 +345,9 @@ class ScanDatabase:
                 f"UPDATE scans SET {', '.join(set_clauses)} WHERE scan_id = ?",
                 params,
             )
-            return cursor.rowcount > 0
+            updated = cursor.rowcount > 0
+        self._mark_written()
+        return updated
 
     def add_finding(
         self,
@@ -212,7 +372,105 @@ class ScanDatabase:
                 """,
                 (scan_id, severity, category, message, location, standards_value),
             )
-            return int(cursor.lastrowid)
+            finding_id = int(cursor.lastrowid)
+        self._mark_written()
+        return finding_id
+
+    def save_completed_scan(
+        self,
+        scan_id: str,
+        url: str,
+        mode: str,
+        standards: Optional[List[str]],
+        *,
+        end_time: str,
+        duration: float,
+        score: int,
+        counts: Dict[str, int],
+        pages_scanned: int,
+        results: Dict[str, Any],
+        findings: List[Tuple[str, str, Optional[str], Optional[str], Optional[List[str] | str]]],
+    ) -> None:
+        """Store a finished scan and its findings in a single transaction.
+
+        Equivalent to ``create_scan`` + ``update_scan`` + one ``add_finding``
+        per ``(severity, message, category, location, standards)`` tuple, but
+        with one commit instead of one per statement.
+        """
+        start_time = datetime.now(timezone.utc).isoformat()
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                INSERT INTO scans (
+                    scan_id, url, mode, standards, start_time, end_time,
+                    duration_seconds, status, score, critical_count, high_count,
+                    medium_count, low_count, pages_scanned, results_json
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    scan_id,
+                    url,
+                    mode,
+                    json.dumps(standards or []),
+                    start_time,
+                    end_time,
+                    duration,
+                    "completed",
+                    score,
+                    counts.get("critical", 0),
+                    counts.get("high", 0),
+                    counts.get("medium", 0),
+                    counts.get("low", 0),
+                    pages_scanned,
+                    json.dumps(results),
+                ),
+            )
+            self._insert_findings(cursor, scan_id, findings)
+        self._mark_written()
+
+    def _insert_findings(
+        self,
+        cursor: sqlite3.Cursor,
+        scan_id: str,
+        findings: List[Tuple[str, str, Optional[str], Optional[str], Optional[List[str] | str]]],
+    ) -> None:
+        cursor.executemany(
+            """
+            INSERT INTO findings (scan_id, severity, category, message, location, standards)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (
+                (
+                    scan_id,
+                    severity,
+                    category,
+                    message,
+                    location,
+                    json.dumps(standards) if isinstance(standards, list) else standards,
+                )
+                for severity, message, category, location, standards in findings
+            ),
+        )
+
+    def add_findings_bulk(
+        self,
+        scan_id: str,
+        findings: List[Tuple[str, str, Optional[str], Optional[str], Optional[List[str] | str]]],
+    ) -> int:
+        """Insert ``(severity, message, category, location, standards)`` rows.
+
+        Same columns as ``add_finding``, but one ``executemany`` and one
+        commit for the whole batch. Returns the number of rows inserted.
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            self._insert_findings(cursor, scan_id, findings)
+            inserted = cursor.rowcount
+        self._mark_written()
+        return inserted
 
     def get_scan(self, scan_id: str) -> Optional[Dict[str, Any]]:
         with self._get_connection() as conn:
@@ -231,8 +489,38 @@ class ScanDatabase:
         offset: int = 0,
         url: Optional[str] = None,
         status: Optional[str] = None,
+        before: Optional[Tuple[str, int]] = None,
+        columns: Optional[Tuple[str, ...]] = None,
     ) -> List[Dict[str, Any]]:
-        query = "SELECT * FROM scans WHERE 1=1"
+        """Return scans newest-first.
+
+        Pass the ``(start_time, id)`` of the last row seen as ``before`` to
+        page through history by key instead of ``offset``, which avoids
+        walking and discarding every skipped row on deep pages; the id keeps
+        scans that share a start_time from being skipped. ``columns`` limits
+        the row dicts to those columns, so list views don't read the large
+        ``results_json`` blob.
+        """
+        if columns is not None:
+            columns = tuple(columns)
+        if before is not None:
+            before = tuple(before)
+        select = _select_list(columns)
+        return self._cached_read(
+            ("scans", limit, offset, url, status, before, columns),
+            lambda: self._fetch_scans(limit, offset, url, status, before, select),
+        )
+
+    def _fetch_scans(
+        self,
+        limit: int,
+        offset: int,
+        url: Optional[str],
+        status: Optional[str],
+        before: Optional[Tuple[str, int]],
+        select: str,
+    ) -> List[Dict[str, Any]]:
+        query = f"SELECT {select} FROM scans WHERE 1=1"
         params = []
 
         if url:
@@ -243,7 +531,11 @@ class ScanDatabase:
             query += " AND status = ?"
             params.append(status)
 
-        query += " ORDER BY start_time DESC LIMIT ? OFFSET ?"
+        if before:
+            query += " AND (start_time, id) < (?, ?)"
+            params.extend(before)
+
+        query += " ORDER BY start_time DESC, id DESC LIMIT ? OFFSET ?"
         params.extend([limit, offset])
 
         with self._get_connection() as conn:
@@ -251,6 +543,37 @@ class ScanDatabase:
             cursor.execute(query, params)
             return [dict(row) for row in cursor.fetchall()]
 
+    def get_scan_rows(
+        self, limit: int = 100, before: Optional[Tuple[str, int]] = None
+    ) -> List[ScanRow]:
+        """Return newest-first ``ScanRow`` tuples for list views.
+
+        ``before`` is the ``(start_time, id)`` of the last row seen, as for
+        ``get_scans``.
+        """
+        if before is not None:
+            before = tuple(before)
+        return self._cached_read(
+            ("scan_rows", limit, before),
+            lambda: self._fetch_scan_rows(limit, before),
+        )
+
+    def _fetch_scan_rows(
+        self, limit: int, before: Optional[Tuple[str, int]]
+    ) -> List[ScanRow]:
+        query = _SCAN_ROW_SELECT
+        params = []
+        if before:
+            query += " WHERE (start_time, id) < (?, ?)"
+            params.extend(before)
+        query += " ORDER BY start_time DESC, id DESC LIMIT ?"
+        params.append(limit)
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            return [ScanRow._make(row) for row in cursor.fetchall()]
+
     def get_findings(self, scan_id: str) -> List[Dict[str, Any]]:
         with self._get_connection() as conn:
             cursor = conn.cursor()
@@ -270,52 +593,83 @@ class ScanDatabase:
             if deleted:
                 logger.info(f"Deleted scan: {scan_id}")
 
-            return deleted
+        self._mark_written()
+        return deleted
 
-    def get_statistics(self) -> Dict[str, Any]:
+    def reset(self) -> None:
+        """Delete every scan with its findings and metadata, keeping the schema."""
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-
-            cursor.execute("SELECT COUNT(*) as total FROM scans")
-            total_scans = cursor.fetchone()["total"]
-
-            cursor.execute(
-                "SELECT COUNT(*) as total FROM scans WHERE status = 'completed'"
+            conn.executescript(
+                "DELETE FROM findings; DELETE FROM scan_metadata; DELETE FROM scans;"
             )
-            completed_scans = cursor.fetchone()["total"]
+            logger.info("Database reset")
+
+        self._mark_written()
+
+    def _fetch_statistics(self, cursor: sqlite3.Cursor) -> Dict[str, Any]:
+        cursor.execute(
+            """
+            SELECT
+                COUNT(*) AS total_scans,
+                SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) AS completed_scans,
+                SUM(CASE WHEN status = 'failed' THEN 1 ELSE 0 END) AS failed_scans,
+                AVG(score) AS avg_score,
+                SUM(critical_count) AS total_critical,
+                SUM(high_count) AS total_high,
+                SUM(medium_count) AS total_medium,
+                SUM(low_count) AS total_low,
+                SUM(CASE WHEN scan_id GLOB 'demo-*' THEN 1 ELSE 0 END) AS demo_scans
+            FROM scans
+            """
+        )
+        row = cursor.fetchone()
+
+        return {
+            "total_scans": row["total_scans"],
+            "completed_scans": row["completed_scans"] or 0,
+            "failed_scans": row["failed_scans"] or 0,
+            "average_score": round(row["avg_score"] or 0, 2),
+            "total_critical_findings": row["total_critical"] or 0,
+            "total_high_findings": row["total_high"] or 0,
+            "total_medium_findings": row["total_medium"] or 0,
+            "total_low_findings": row["total_low"] or 0,
+            "has_demo_data": bool(row["demo_scans"]),
+        }
 
-            cursor.execute(
-                "SELECT COUNT(*) as total FROM scans WHERE status = 'failed'"
-            )
-            failed_scans = cursor.fetchone()["total"]
+    def get_statistics(self) -> Dict[str, Any]:
+        return self._cached_read(("statistics",), self._read_statistics)
 
+    def _read_statistics(self) -> Dict[str, Any]:
+        with self._get_connection() as conn:
+            return self._fetch_statistics(conn.cursor())
+
+    def get_dashboard_snapshot(
+        self, limit: int = 100, columns: Optional[Tuple[str, ...]] = None
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """Return ``(get_statistics(), get_scans(limit))`` from one connection.
+
+        The dashboard needs both on every refresh; scans are newest first, so
+        the recent-activity rows are just the head of the list.
+        """
+        if columns is not None:
+            columns = tuple(columns)
+        select = _select_list(columns)
+        return self._cached_read(
+            ("dashboard_snapshot", limit, columns),
+            lambda: self._read_dashboard_snapshot(limit, select),
+        )
+
+    def _read_dashboard_snapshot(
+        self, limit: int, select: str
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            stats = self._fetch_statistics(cursor)
             cursor.execute(
-                "SELECT AVG(score) as avg_score FROM scans WHERE score IS NOT NULL"
+                f"SELECT {select} FROM scans ORDER BY start_time DESC, id DESC LIMIT ?",
+                (limit,),
             )
-            avg_score = cursor.fetchone()["avg_score"] or 0
-
-            cursor.execute("SELECT SUM(critical_count) as total FROM scans")
-            total_critical = cursor.fetchone()["total"] or 0
-
-            cursor.execute("SELECT SUM(high_count) as total FROM scans")
-            total_high = cursor.fetchone()["total"] or 0
-
-            cursor.execute("SELECT SUM(medium_count) as total FROM scans")
-            total_medium = cursor.fetchone()["total"] or 0
-
-            cursor.execute("SELECT SUM(low_count) as total FROM scans")
-            total_low = cursor.fetchone()["total"] or 0
-
-            return {
-                "total_scans": total_scans,
-                "completed_scans": completed_scans,
-                "failed_scans": failed_scans,
-                "average_score": round(avg_score, 2),
-                "total_critical_findings": total_critical,
-                "total_high_findings": total_high,
-                "total_medium_findings": total_medium,
-                "total_low_findings": total_low,
-            }
+            return stats, [dict(row) for row in cursor.fetchall()]
 
     def vacuum(self) -> None:
         with self._get_connection() as conn:
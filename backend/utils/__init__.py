@@ -1,9 +1,35 @@
 from __future__ import annotations
 
+from typing import Any
+
 from .config import get_config, AppConfig
 from .logging_config import setup_logging, get_logger
-from .monitoring import get_metrics_collector, get_health_checker
-from .scan_templates import get_template_manager, ScanTemplate
+
+# monitoring pulls in psutil and scan_templates pulls in pydantic; defer both
+# until first attribute access (PEP 562) so logging/config-only consumers
+# don't pay for them.
+_LAZY_ATTRS = {
+    "get_metrics_collector": ".monitoring",
+    "get_health_checker": ".monitoring",
+    "get_template_manager": ".scan_templates",
+    "ScanTemplate": ".scan_templates",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 
 __all__ = [
     "AppConfig",
@@ -23,6 +23,8 @@ except (
 
 logger = logging.getLogger("shieldeye.config")
 
+_TRUTHY = frozenset({"true", "1", "yes", "on"})
+
 
 class ScannerConfig(BaseModel):
 
@@ -138,84 +140,86 @@ class Config(BaseSettings):
         report = dict(values.get("report") or {})
 
         def _to_bool(raw: str) -> bool:
-            return raw.lower() in ("true", "1", "yes")
+            return raw.lower() in _TRUTHY
+
+        env = os.environ.get
 
-        timeout_env = os.getenv("SHIELDEYE_TIMEOUT")
+        timeout_env = env("SHIELDEYE_TIMEOUT")
         if timeout_env is not None:
             scanner["default_timeout"] = int(timeout_env)
             values.setdefault("timeout_seconds", int(timeout_env))
 
-        if max_pages := os.getenv("SHIELDEYE_MAX_PAGES"):
+        if max_pages := env("SHIELDEYE_MAX_PAGES"):
             scanner["default_max_pages_full"] = int(max_pages)
 
-        if max_depth := os.getenv("SHIELDEYE_MAX_DEPTH"):
+        if max_depth := env("SHIELDEYE_MAX_DEPTH"):
             scanner["default_max_depth_full"] = int(max_depth)
 
-        if verify_ssl_env := os.getenv("SHIELDEYE_VERIFY_SSL"):
+        if verify_ssl_env := env("SHIELDEYE_VERIFY_SSL"):
             parsed_verify_ssl = _to_bool(verify_ssl_env)
             scanner["verify_ssl"] = parsed_verify_ssl
             values.setdefault("verify_ssl", parsed_verify_ssl)
 
-        if user_agent := os.getenv("SHIELDEYE_USER_AGENT"):
+        if user_agent := env("SHIELDEYE_USER_AGENT"):
             scanner["user_agent"] = user_agent
 
-        if db_path := os.getenv("SHIELDEYE_DB_PATH"):
+        if db_path := env("SHIELDEYE_DB_PATH"):
             database["db_path"] = Path(db_path)
 
-        if db_url := os.getenv("SHIELDEYE_DB_URL"):
+        if db_url := env("SHIELDEYE_DB_URL"):
             values["database_url"] = db_url
 
-        if redis_url := os.getenv("SHIELDEYE_REDIS_URL"):
+        if redis_url := env("SHIELDEYE_REDIS_URL"):
             values["redis_url"] = redis_url
 
-        if log_level := os.getenv("SHIELDEYE_LOG_LEVEL"):
+        if log_level := env("SHIELDEYE_LOG_LEVEL"):
             logging_cfg["level"] = log_level.upper()
 
-        if log_dir := os.getenv("SHIELDEYE_LOG_DIR"):
+        if log_dir := env("SHIELDEYE_LOG_DIR"):
             logging_cfg["log_dir"] = Path(log_dir)
 
-        if structured := os.getenv("SHIELDEYE_STRUCTURED_LOGS"):
+        if structured := env("SHIELDEYE_STRUCTURED_LOGS"):
             logging_cfg["structured"] = _to_bool(structured)
 
-        if rate_limit := os.getenv("SHIELDEYE_RATE_LIMIT"):
+        if rate_limit := env("SHIELDEYE_RATE_LIMIT"):
             security["enable_rate_limiting"] = _to_bool(rate_limit)
 
-        if reports_dir := os.getenv("SHIELDEYE_REPORTS_DIR"):
+        if reports_dir := env("SHIELDEYE_REPORTS_DIR"):
             report["reports_dir"] = Path(reports_dir)
 
-        if allow_insecure_targets := os.getenv("SHIELDEYE_ALLOW_INSECURE_TARGETS"):
+        if allow_insecure_targets := env("SHIELDEYE_ALLOW_INSECURE_TARGETS"):
             values["allow_insecure_targets"] = _to_bool(allow_insecure_targets)
-        if prometheus_export := os.getenv("SHIELDEYE_ENABLE_PROMETHEUS_EXPORT"):
+        if prometheus_export := env("SHIELDEYE_ENABLE_PROMETHEUS_EXPORT"):
             values["enable_prometheus_export"] = _to_bool(prometheus_export)
-        if otel := os.getenv("SHIELDEYE_ENABLE_OPENTELEMETRY"):
+        if otel := env("SHIELDEYE_ENABLE_OPENTELEMETRY"):
             values["enable_opentelemetry"] = _to_bool(otel)
-        if interactive_remediation := os.getenv(
+        if interactive_remediation := env(
             "SHIELDEYE_ENABLE_INTERACTIVE_REMEDIATION"
         ):
             values["enable_interactive_remediation"] = _to_bool(interactive_remediation)
-        if enable_policy_management := os.getenv("SHIELDEYE_ENABLE_POLICY_MANAGEMENT"):
+        if enable_policy_management := env("SHIELDEYE_ENABLE_POLICY_MANAGEMENT"):
             values["enable_policy_management"] = _to_bool(enable_policy_management)
-        if enable_realtime_monitoring := os.getenv(
+        if enable_realtime_monitoring := env(
             "SHIELDEYE_ENABLE_REALTIME_MONITORING"
         ):
             values["enable_realtime_monitoring"] = _to_bool(enable_realtime_monitoring)
-        if alert_window_seconds := os.getenv("SHIELDEYE_ALERT_WINDOW_SECONDS"):
+        if alert_window_seconds := env("SHIELDEYE_ALERT_WINDOW_SECONDS"):
             values["alert_evaluation_window_seconds"] = int(alert_window_seconds)
-        if enable_grc_export := os.getenv("ENABLE_GRC_EXPORT"):
+        if enable_grc_export := env("ENABLE_GRC_EXPORT"):
             values["enable_grc_export"] = _to_bool(enable_grc_export)
-        if shieldeye_enable_grc_export := os.getenv("SHIELDEYE_ENABLE_GRC_EXPORT"):
+        if shieldeye_enable_grc_export := env("SHIELDEYE_ENABLE_GRC_EXPORT"):
             values["enable_grc_export"] = _to_bool(shieldeye_enable_grc_export)
-        if grc_platform := os.getenv("GRC_PLATFORM"):
+        if grc_platform := env("GRC_PLATFORM"):
             values["grc_platform"] = grc_platform.strip().lower()
-        if shieldeye_grc_platform := os.getenv("SHIELDEYE_GRC_PLATFORM"):
+        if shieldeye_grc_platform := env("SHIELDEYE_GRC_PLATFORM"):
             values["grc_platform"] = shieldeye_grc_platform.strip().lower()
-        if grc_webhook_url := os.getenv("GRC_WEBHOOK_URL"):
+        if grc_webhook_url := env("GRC_WEBHOOK_URL"):
             values["grc_webhook_url"] = grc_webhook_url
-        if shieldeye_grc_webhook_url := os.getenv("SHIELDEYE_GRC_WEBHOOK_URL"):
+        if shieldeye_grc_webhook_url := env("SHIELDEYE_GRC_WEBHOOK_URL"):
             values["grc_webhook_url"] = shieldeye_grc_webhook_url
-        if enable_ml := os.getenv("ENABLE_ML_CORRELATION"):
+        if enable_ml := env("ENABLE_ML_CORRELATION"):
             values["enable_ml_correlation"] = _to_bool(enable_ml)
-        if ml_threshold := os.getenv("ML_CORRELATION_CONFIDENCE_THRESHOLD"):
+        if ml_threshold := env("ML_CORRELATION_CONFIDENCE_THRESHOLD"):
             values["ml_correlation_confidence_threshold"] = float(ml_threshold)
 
         values["scanner"] = scanner
@@ -6,13 +6,27 @@ import sys
 from pathlib import Path
 from typing import Any, Dict
 import json
-from datetime import datetime
+import time
 
 class StructuredFormatter(logging.Formatter):
     
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # (epoch second, "YYYY-MM-DDTHH:MM:SS") for the last formatted record;
+        # kept as one tuple so concurrent handlers never see a torn pair.
+        self._second_cache: tuple[int, str] = (-1, "")
+    
+    def _format_timestamp(self, created: float) -> str:
+        second = int(created)
+        cached_second, prefix = self._second_cache
+        if second != cached_second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._second_cache = (second, prefix)
+        return f"{prefix}.{int((created - second) * 1e6):06d}Z"
+    
     def format(self, record: logging.LogRecord) -> str:
         log_data: Dict[str, Any] = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": self._format_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
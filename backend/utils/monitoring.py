@@ -1,30 +1,56 @@
 from __future__ import annotations
 
+import threading
 import time
+import numpy as np
 import psutil
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, Optional
-from collections import deque
+from collections import Counter, OrderedDict
 
 from ..utils.logging_config import get_logger
 
 logger = get_logger("monitoring")
 
-@dataclass
+# shared by all HealthChecker instances; threads are only spawned on first use
+_health_check_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="health-check")
+
+MAX_HEALTHY_ERRORS = 100
+MIN_HEALTHY_SUCCESS_RATE = 50
+MAX_HEALTHY_ACTIVE_SCANS = 10
+
+_APP_CHECK_SPECS = (
+    ("no_excessive_errors", lambda s: s["total_errors"] < MAX_HEALTHY_ERRORS),
+    ("reasonable_success_rate", lambda s: s["success_rate"] >= MIN_HEALTHY_SUCCESS_RATE),
+    ("active_scans_ok", lambda s: s["active_scans"] < MAX_HEALTHY_ACTIVE_SCANS),
+)
+
+@dataclass(slots=True)
 class HealthStatus:
     healthy: bool
     status: str
     checks: Dict[str, bool] = field(default_factory=dict)
     metrics: Dict[str, Any] = field(default_factory=dict)
     timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "healthy": self.healthy,
+            "checks": self.checks,
+            "metrics": self.metrics,
+            "timestamp": self.timestamp,
+        }
 
-@dataclass
+@dataclass(slots=True)
 class ScanMetrics:
     scan_id: str
     url: str
-    start_time: float
-    end_time: Optional[float] = None
+    # time.monotonic_ns() readings; only meaningful relative to each other
+    start_time: int
+    end_time: Optional[int] = None
     duration: Optional[float] = None
     pages_scanned: int = 0
     requests_made: int = 0
@@ -35,31 +61,44 @@ class ScanMetrics:
 class MetricsCollector:
     def __init__(self, max_history: int = 1000):
         self.max_history = max_history
-        self.scan_metrics: Dict[str, ScanMetrics] = {}
-        self.request_times: deque = deque(maxlen=max_history)
-        self.error_counts: Dict[str, int] = {}
+        self._active_scans: Dict[str, ScanMetrics] = {}
+        # finished scans, oldest first; capped at max_history
+        self._completed_scans: OrderedDict[str, ScanMetrics] = OrderedDict()
+        # ring buffer of the last max_history request durations (seconds)
+        self._request_times = np.empty(max_history, dtype=np.float64)
+        self._request_times_head = 0
+        self._request_times_count = 0
+        self._request_time_sum = 0.0
+        self.error_counts: Counter[str] = Counter()
+        self._total_errors = 0
         self.total_scans = 0
         self.successful_scans = 0
         self.failed_scans = 0
+        # wall-clock start for display; uptime is measured on the monotonic clock
         self.start_time = time.time()
+        self._start_monotonic_ns = time.monotonic_ns()
     
     def start_scan(self, scan_id: str, url: str) -> None:
-        self.scan_metrics[scan_id] = ScanMetrics(
+        self._active_scans[scan_id] = ScanMetrics(
             scan_id=scan_id,
             url=url,
-            start_time=time.time(),
+            start_time=time.monotonic_ns(),
         )
         self.total_scans += 1
         logger.debug(f"Started tracking metrics for scan: {scan_id}")
     
     def end_scan(self, scan_id: str, status: str = "completed") -> None:
-        if scan_id not in self.scan_metrics:
+        metrics = self._active_scans.pop(scan_id, None)
+        if metrics is None:
             logger.warning(f"Scan {scan_id} not found in metrics")
             return
         
-        metrics = self.scan_metrics[scan_id]
-        metrics.end_time = time.time()
-        metrics.duration = metrics.end_time - metrics.start_time
+        self._completed_scans[scan_id] = metrics
+        while len(self._completed_scans) > self.max_history:
+            self._completed_scans.popitem(last=False)
+        
+        metrics.end_time = time.monotonic_ns()
+        metrics.duration = (metrics.end_time - metrics.start_time) / 1e9
         metrics.status = status
         
         if status == "completed":
@@ -70,10 +109,18 @@ class MetricsCollector:
         logger.debug(f"Ended tracking for scan {scan_id}: {status} in {metrics.duration:.2f}s")
     
     def record_request(self, duration: float) -> None:
-        self.request_times.append(duration)
+        head = self._request_times_head
+        if self._request_times_count == self.max_history:
+            self._request_time_sum -= float(self._request_times[head])
+        else:
+            self._request_times_count += 1
+        self._request_times[head] = duration
+        self._request_times_head = (head + 1) % self.max_history
+        self._request_time_sum += duration
     
     def record_error(self, error_type: str) -> None:
-        self.error_counts[error_type] = self.error_counts.get(error_type, 0) + 1
+        self.error_counts[error_type] += 1
+        self._total_errors += 1
     
     def update_scan_metrics(
         self,
@@ -83,11 +130,10 @@ class MetricsCollector:
         errors_count: Optional[int] = None,
         findings_count: Optional[int] = None,
     ) -> None:
-        if scan_id not in self.scan_metrics:
+        metrics = self.get_scan_metrics(scan_id)
+        if metrics is None:
             return
         
-        metrics = self.scan_metrics[scan_id]
-        
         if pages_scanned is not None:
             metrics.pages_scanned = pages_scanned
         if requests_made is not None:
@@ -98,21 +144,27 @@ class MetricsCollector:
             metrics.findings_count = findings_count
     
     def get_scan_metrics(self, scan_id: str) -> Optional[ScanMetrics]:
-        return self.scan_metrics.get(scan_id)
+        metrics = self._active_scans.get(scan_id)
+        if metrics is None:
+            metrics = self._completed_scans.get(scan_id)
+        return metrics
     
-    def get_summary(self) -> Dict[str, Any]:
-        uptime = time.time() - self.start_time
+    def get_summary(self, include_breakdown: bool = True) -> Dict[str, Any]:
+        uptime = (time.monotonic_ns() - self._start_monotonic_ns) / 1e9
         
         avg_request_time = 0.0
-        if self.request_times:
-            avg_request_time = sum(self.request_times) / len(self.request_times)
+        p50_request_time = 0.0
+        p95_request_time = 0.0
+        count = self._request_times_count
+        if count:
+            avg_request_time = self._request_time_sum / count
+            p50_request_time, p95_request_time = (
+                float(v) for v in np.percentile(self._request_times[:count], (50, 95))
+            )
         
-        active_scans = sum(
-            1 for m in self.scan_metrics.values()
-            if m.status == "running"
-        )
+        active_scans = len(self._active_scans)
         
-        return {
+        summary = {
             "uptime_seconds": uptime,
             "total_scans": self.total_scans,
             "successful_scans": self.successful_scans,
@@ -123,32 +175,114 @@ class MetricsCollector:
                 if self.total_scans > 0 else 0
             ),
             "average_request_time_ms": avg_request_time * 1000,
-            "total_errors": sum(self.error_counts.values()),
-            "error_breakdown": dict(self.error_counts),
+            "p50_request_time_ms": p50_request_time * 1000,
+            "p95_request_time_ms": p95_request_time * 1000,
+            "total_errors": self._total_errors,
+        }
+        if include_breakdown:
+            summary["error_breakdown"] = dict(self.error_counts)
+        return summary
+
+class _SystemSampler:
+    """Samples host CPU/memory/disk on a daemon thread.
+
+    Health checks read the latest snapshot instead of blocking on psutil.
+    The sampling interval tightens under CPU pressure and backs off when
+    the host is idle.
+    """
+
+    def __init__(
+        self,
+        interval: float = 1.0,
+        min_interval: float = 0.5,
+        max_interval: float = 5.0,
+    ):
+        self.interval = interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._stop_event = threading.Event()
+    
+    def _sample(self, cpu_interval: Optional[float] = None) -> Dict[str, Any]:
+        memory = psutil.virtual_memory()
+        disk = psutil.disk_usage('/')
+        return {
+            "cpu_percent": psutil.cpu_percent(interval=cpu_interval),
+            "memory_percent": memory.percent,
+            "memory_available_mb": memory.available / (1024 * 1024),
+            "disk_percent": disk.percent,
+            "disk_free_gb": disk.free / (1024 * 1024 * 1024),
         }
+    
+    def _next_interval(self, cpu_percent: float) -> float:
+        if cpu_percent > 80:
+            return self.min_interval
+        if cpu_percent < 20:
+            return self.max_interval
+        return self.interval
+    
+    def _run(self) -> None:
+        # cpu_percent(interval=None) reports usage since the previous call
+        # made on the same thread, so it is primed here, on the sampler
+        # thread, and the first sample waits one interval after that
+        psutil.cpu_percent(interval=None)
+        delay = self.interval
+        while not self._stop_event.wait(delay):
+            delay = self.interval
+            try:
+                # single reference assignment, so readers never see a
+                # partially built snapshot
+                snapshot = self._sample()
+                self._snapshot = snapshot
+                delay = self._next_interval(snapshot["cpu_percent"])
+            except Exception as e:
+                logger.warning(f"System resource sampling failed: {e}")
+    
+    def start(self) -> None:
+        with self._start_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop_event.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="system-sampler", daemon=True
+            )
+            self._thread.start()
+    
+    def stop(self) -> None:
+        self._stop_event.set()
+    
+    def latest(self) -> Dict[str, Any]:
+        if self._thread is None:
+            self.start()
+        snapshot = self._snapshot
+        if snapshot is None:
+            # only until the sampler thread's first tick: take one short
+            # blocking sample so the first reading is meaningful
+            snapshot = self._sample(cpu_interval=0.1)
+            self._snapshot = snapshot
+        return snapshot
+
+_system_sampler = _SystemSampler()
 
 class HealthChecker:
-    def __init__(self, metrics_collector: Optional[MetricsCollector] = None):
+    def __init__(
+        self,
+        metrics_collector: Optional[MetricsCollector] = None,
+        sampler: Optional[_SystemSampler] = None,
+    ):
         self.metrics = metrics_collector
+        self.sampler = sampler or _system_sampler
     
     def check_system_resources(self) -> tuple[bool, Dict[str, Any]]:
         try:
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
+            metrics = dict(self.sampler.latest())
             
             checks = {
-                "cpu_ok": cpu_percent < 90,
-                "memory_ok": memory.percent < 90,
-                "disk_ok": disk.percent < 90,
-            }
-            
-            metrics = {
-                "cpu_percent": cpu_percent,
-                "memory_percent": memory.percent,
-                "memory_available_mb": memory.available / (1024 * 1024),
-                "disk_percent": disk.percent,
-                "disk_free_gb": disk.free / (1024 * 1024 * 1024),
+                "cpu_ok": metrics["cpu_percent"] < 90,
+                "memory_ok": metrics["memory_percent"] < 90,
+                "disk_ok": metrics["disk_percent"] < 90,
             }
             
             healthy = all(checks.values())
@@ -159,29 +293,28 @@ class HealthChecker:
             return False, {"error": str(e)}
     
     def check_application_health(self) -> tuple[bool, Dict[str, Any]]:
-        checks = {}
-        metrics = {}
+        if not self.metrics:
+            return True, {"checks": {}, "metrics": {}}
         
-        if self.metrics:
-            summary = self.metrics.get_summary()
-            metrics.update(summary)
-            
-            checks["no_excessive_errors"] = summary["total_errors"] < 100
-            checks["reasonable_success_rate"] = summary["success_rate"] >= 50
-            checks["active_scans_ok"] = summary["active_scans"] < 10
+        summary = self.metrics.get_summary()
+        # built per call: concurrent health checks share this checker
+        checks = {name: predicate(summary) for name, predicate in _APP_CHECK_SPECS}
+        healthy = all(checks.values())
         
-        healthy = all(checks.values()) if checks else True
-        return healthy, {"checks": checks, "metrics": metrics}
+        return healthy, {"checks": checks, "metrics": summary}
     
     def perform_health_check(self) -> HealthStatus:
         all_checks = {}
         all_metrics = {}
         
-        system_healthy, system_data = self.check_system_resources()
+        system_future = _health_check_pool.submit(self.check_system_resources)
+        app_future = _health_check_pool.submit(self.check_application_health)
+        
+        system_healthy, system_data = system_future.result()
         all_checks.update(system_data.get("checks", {}))
         all_metrics.update(system_data.get("metrics", {}))
         
-        app_healthy, app_data = self.check_application_health()
+        app_healthy, app_data = app_future.result()
         all_checks.update(app_data.get("checks", {}))
         all_metrics.update(app_data.get("metrics", {}))
         
@@ -209,5 +342,10 @@ def get_metrics_collector() -> MetricsCollector:
         _global_metrics_collector = MetricsCollector()
     return _global_metrics_collector
 
+_global_health_checker: Optional[HealthChecker] = None
+
 def get_health_checker() -> HealthChecker:
-    return HealthChecker(get_metrics_collector())
+    global _global_health_checker
+    if _global_health_checker is None:
+        _global_health_checker = HealthChecker(get_metrics_collector())
+    return _global_health_checker
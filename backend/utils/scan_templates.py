@@ -1,21 +1,58 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 from dataclasses import field
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+import hashlib
 import json
+import mmap
+import os
 from pathlib import Path
 import logging
 from pydantic import Field
 from pydantic.dataclasses import dataclass
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional: template persistence falls back to the stdlib json
+    # module.
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger("shieldeye.templates")
 
 
-@dataclass
+def _dump_json(data: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _load_json(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# below this size a plain read is cheaper than setting up a mapping
+_MMAP_MIN_SIZE = 64 * 1024
+
+
+def _read_json_file(path: Path) -> Any:
+    if orjson is None or path.stat().st_size < _MMAP_MIN_SIZE:
+        return _load_json(path.read_bytes())
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+
+@dataclass(frozen=True, slots=True)
 class ScanTemplate:
     name: str
     description: str
-    standards: List[str]
+    standards: Tuple[str, ...]
     mode: str
     max_pages: int
     max_depth: int
@@ -23,7 +60,7 @@ class ScanTemplate:
     verify_ssl: bool
     allow_insecure: bool = Field(default=False)
     checks_enabled: Dict[str, bool] = field(default_factory=dict)
-    tags: List[str] = field(default_factory=list)
+    tags: Tuple[str, ...] = field(default_factory=tuple)
 
     def __post_init__(self):
         if self.allow_insecure:
@@ -31,13 +68,13 @@ class ScanTemplate:
                 "allow_insecure enabled for template '%s'; TLS certificate verification is disabled",
                 self.name,
             )
-            self.verify_ssl = False
+            object.__setattr__(self, "verify_ssl", False)
 
     def to_dict(self) -> Dict:
         return {
             "name": self.name,
             "description": self.description,
-            "standards": self.standards,
+            "standards": list(self.standards),
             "mode": self.mode,
             "max_pages": self.max_pages,
             "max_depth": self.max_depth,
@@ -45,7 +82,7 @@ class ScanTemplate:
             "verify_ssl": self.verify_ssl,
             "allow_insecure": self.allow_insecure,
             "checks_enabled": self.checks_enabled,
-            "tags": self.tags,
+            "tags": list(self.tags),
         }
 
     @classmethod
@@ -53,9 +90,19 @@ class ScanTemplate:
         return cls(**data)
 
 
+def _build_tag_index(
+    templates: Iterable[Tuple[str, ScanTemplate]],
+) -> Dict[str, List[str]]:
+    index: Dict[str, List[str]] = {}
+    for key, template in templates:
+        for tag in template.tags:
+            index.setdefault(tag, []).append(key)
+    return index
+
+
 class ScanTemplateManager:
 
-    BUILTIN_TEMPLATES = {
+    BUILTIN_TEMPLATES: Mapping[str, ScanTemplate] = MappingProxyType({
         "quick_gdpr": ScanTemplate(
             name="Quick GDPR Compliance",
             description="Fast GDPR compliance check for websites",
@@ -265,13 +312,28 @@ class ScanTemplateManager:
             checks_enabled={"ssl": True, "headers": True, "availability": True},
             tags=["monitoring", "continuous", "lightweight"],
         ),
-    }
+    })
+
+    _BUILTIN_TUPLE: Tuple[ScanTemplate, ...] = tuple(BUILTIN_TEMPLATES.values())
+    _BUILTIN_ORDER: Mapping[str, int] = MappingProxyType(
+        {key: position for position, key in enumerate(BUILTIN_TEMPLATES)}
+    )
+    _BUILTIN_TAG_INDEX: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+        {
+            tag: tuple(keys)
+            for tag, keys in _build_tag_index(BUILTIN_TEMPLATES.items()).items()
+        }
+    )
 
     def __init__(self, templates_file: Optional[Path] = None):
         self.templates_file = (
             templates_file or Path.home() / ".shieldeye" / "templates.json"
         )
         self.custom_templates: Dict[str, ScanTemplate] = {}
+        self._custom_tag_index: Dict[str, List[str]] = {}
+        self._last_saved_hash: Optional[bytes] = None
+        self._save_suspended = 0
+        self._save_dirty = False
         self._load_templates()
 
     def _load_templates(self) -> None:
@@ -279,23 +341,48 @@ class ScanTemplateManager:
             return
 
         try:
-            with open(self.templates_file, "r") as f:
-                data = json.load(f)
-                for name, template_data in data.items():
-                    self.custom_templates[name] = ScanTemplate.from_dict(template_data)
+            data = _read_json_file(self.templates_file)
+            for name, template_data in data.items():
+                self.custom_templates[name] = ScanTemplate.from_dict(template_data)
+            self._custom_tag_index = _build_tag_index(self.custom_templates.items())
             logger.info(f"Loaded {len(self.custom_templates)} custom templates")
         except Exception as e:
             logger.error(f"Failed to load templates: {e}")
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defer template persistence until the outermost batch exits."""
+        self._save_suspended += 1
+        try:
+            yield
+        finally:
+            self._save_suspended -= 1
+            if not self._save_suspended and self._save_dirty:
+                self._save_dirty = False
+                self._save_templates()
+
     def _save_templates(self) -> None:
+        if self._save_suspended:
+            self._save_dirty = True
+            return
+
         try:
-            self.templates_file.parent.mkdir(parents=True, exist_ok=True)
             data = {
                 name: template.to_dict()
                 for name, template in self.custom_templates.items()
             }
-            with open(self.templates_file, "w") as f:
-                json.dump(data, f, indent=2)
+            data_bytes = _dump_json(data)
+            data_hash = hashlib.blake2b(data_bytes, digest_size=8).digest()
+            if data_hash == self._last_saved_hash:
+                return
+
+            # write-then-rename so a crash mid-write never truncates the
+            # existing templates file
+            self.templates_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.templates_file.with_name(self.templates_file.name + ".tmp")
+            tmp_path.write_bytes(data_bytes)
+            os.replace(tmp_path, self.templates_file)
+            self._last_saved_hash = data_hash
         except Exception as e:
             logger.error(f"Failed to save templates: {e}")
 
@@ -307,25 +394,61 @@ class ScanTemplateManager:
     def list_templates(
         self, include_builtin: bool = True, tags: Optional[List[str]] = None
     ) -> List[ScanTemplate]:
+        if not tags:
+            templates = list(self._BUILTIN_TUPLE) if include_builtin else []
+            templates.extend(self.custom_templates.values())
+            return templates
+
         templates = []
 
         if include_builtin:
-            templates.extend(self.BUILTIN_TEMPLATES.values())
-
-        templates.extend(self.custom_templates.values())
+            builtin_keys = set().union(
+                *(self._BUILTIN_TAG_INDEX.get(tag, ()) for tag in tags)
+            )
+            templates.extend(
+                self.BUILTIN_TEMPLATES[key]
+                for key in sorted(builtin_keys, key=self._BUILTIN_ORDER.__getitem__)
+            )
 
-        if tags:
-            templates = [t for t in templates if any(tag in t.tags for tag in tags)]
+        custom_keys = set().union(
+            *(self._custom_tag_index.get(tag, ()) for tag in tags)
+        )
+        if custom_keys:
+            templates.extend(
+                template
+                for key, template in self.custom_templates.items()
+                if key in custom_keys
+            )
 
         return templates
 
+    def _unindex_custom(self, name: str) -> None:
+        template = self.custom_templates.get(name)
+        if template is None:
+            return
+        for tag in template.tags:
+            keys = self._custom_tag_index.get(tag)
+            if keys and name in keys:
+                keys.remove(name)
+                if not keys:
+                    del self._custom_tag_index[tag]
+
     def create_template(self, template: ScanTemplate) -> None:
+        self._unindex_custom(template.name)
         self.custom_templates[template.name] = template
+        for tag in template.tags:
+            self._custom_tag_index.setdefault(tag, []).append(template.name)
         self._save_templates()
         logger.info(f"Created template: {template.name}")
 
+    def create_templates(self, templates: Iterable[ScanTemplate]) -> None:
+        with self.batch():
+            for template in templates:
+                self.create_template(template)
+
     def delete_template(self, name: str) -> bool:
         if name in self.custom_templates:
+            self._unindex_custom(name)
             del self.custom_templates[name]
             self._save_templates()
             logger.info(f"Deleted template: {name}")
@@ -352,6 +475,10 @@ class ScanTemplateManager:
         self.create_template(template)
         return template
 
+    def import_templates(self, input_paths: Iterable[Path]) -> List[ScanTemplate]:
+        with self.batch():
+            return [self.import_template(path) for path in input_paths]
+
 
 _template_manager: Optional[ScanTemplateManager] = None
 
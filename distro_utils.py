@@ -1,32 +1,48 @@
-import platform
 import os
+import re
+import sys
+from functools import lru_cache
 from typing import Literal
 
 DistroType = Literal['fedora', 'rhel', 'arch', 'unknown']
 
+_OS_RELEASE_DISTRO_RE = re.compile(
+    rb'\b(fedora|rhel|red hat|centos|rocky|almalinux|arch)\b', re.IGNORECASE
+)
+
+_RHEL_FAMILY = frozenset({b'rhel', b'red hat', b'centos', b'rocky', b'almalinux'})
+
+_DISTRO_NAMES = {
+    'fedora': 'Fedora',
+    'rhel': 'RHEL/CentOS',
+    'arch': 'Arch Linux',
+    'unknown': 'Unknown'
+}
+
+@lru_cache(maxsize=1)
 def detect_distro() -> DistroType:
 
-    if not platform.system().lower() == 'linux':
+    if not sys.platform.startswith('linux'):
         return 'unknown'
-    
+
     if os.path.exists('/etc/os-release'):
-        with open('/etc/os-release', 'r') as f:
-            content = f.read().lower()
-            
-            if 'fedora' in content:
+        with open('/etc/os-release', 'rb') as f:
+            found = {m.lower() for m in _OS_RELEASE_DISTRO_RE.findall(f.read())}
+
+            if b'fedora' in found:
                 return 'fedora'
-            elif any(distro in content for distro in ['rhel', 'red hat', 'centos', 'rocky', 'almalinux']):
+            elif found & _RHEL_FAMILY:
                 return 'rhel'
-            elif 'arch' in content:
+            elif b'arch' in found:
                 return 'arch'
-    
+
     if os.path.exists('/etc/fedora-release'):
         return 'fedora'
     elif os.path.exists('/etc/redhat-release'):
         return 'rhel'
     elif os.path.exists('/etc/arch-release'):
         return 'arch'
-    
+
     return 'unknown'
 
 def is_fedora_based() -> bool:
@@ -40,10 +56,4 @@ def is_arch_based() -> bool:
 
 def get_distro_name() -> str:
 
-    distro = detect_distro()
-    return {
-        'fedora': 'Fedora',
-        'rhel': 'RHEL/CentOS',
-        'arch': 'Arch Linux',
-        'unknown': 'Unknown'
-    }.get(distro, 'Unknown')
+    return _DISTRO_NAMES.get(detect_distro(), 'Unknown')
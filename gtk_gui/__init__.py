@@ -1,4 +1,10 @@
 
-from .src.app import ShieldEyeApplication
+# resolved on first access, so importing a gtk_gui submodule (as the scan
+# worker process does) doesn't pull in GTK
+def __getattr__(name):
+    if name == "ShieldEyeApplication":
+        from .src.app import ShieldEyeApplication
+        return ShieldEyeApplication
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = ['ShieldEyeApplication']
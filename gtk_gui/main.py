@@ -1,17 +1,20 @@
 
 import sys
 import os
-import gi
-
-gi.require_version('Gtk', '4.0')
-gi.require_version('Adw', '1')
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from src.app import ShieldEyeApplication
-
 def main():
 
+    # GTK is only imported here: scan worker processes re-run this module
+    # as __mp_main__ and must not load it
+    import gi
+    gi.require_version('Gtk', '4.0')
+    gi.require_version('Adw', '1')
+    gi.require_version('PangoCairo', '1.0')
+
+    from src.app import ShieldEyeApplication
+
     app = ShieldEyeApplication()
     return app.run(sys.argv)
 
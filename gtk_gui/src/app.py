@@ -2,6 +2,7 @@
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
+gi.require_version('PangoCairo', '1.0')
 
 from gi.repository import Adw, Gio
 from .ui.window import MainWindow
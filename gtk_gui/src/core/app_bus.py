@@ -0,0 +1,13 @@
+
+from gi.repository import GObject
+
+class AppBus(GObject.Object):
+    """Application-wide notifications the views subscribe to.
+
+    ``scans-changed`` is emitted on the main thread after the scan data has
+    changed, at most once per batch of writes.
+    """
+
+    __gsignals__ = {
+        "scans-changed": (GObject.SignalFlags.RUN_FIRST, None, ()),
+    }
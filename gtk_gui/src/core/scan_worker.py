@@ -0,0 +1,45 @@
+"""Scan job run in the GUI's worker process.
+
+The scan runs outside the GUI process, so its CPU work never competes
+with the main loop for the GIL. The worker is started with the spawn
+context, which re-runs the launching script as ``__mp_main__``; the GUI
+entry points only import GTK inside ``main()``, and this module only
+imports backend code, so the worker never loads GTK.
+"""
+
+from backend.core.scanner import Scanner
+from backend.core.backend import analyze_scan_results
+
+
+def run_scan_job(url, standards, mode, progress_queue, result_queue):
+    """Scan ``url`` and analyse the results.
+
+    Progress goes to ``progress_queue`` as ``(fraction, message)`` tuples.
+    One ``(ok, payload, scan_id)`` tuple is put on ``result_queue``:
+    ``payload`` is ``(results, analysis)`` on success and the error message
+    otherwise. ``scan_id`` is ``None`` if the scan failed before it had one.
+    """
+    scan_id = None
+    try:
+        scanner = Scanner(url, standards, mode)
+
+        progress_queue.put((0.3, "Scanning target..."))
+        results = scanner.run_scan()
+        scan_id = results.get("scan_id")
+
+        progress_queue.put((0.7, "Analyzing results..."))
+        analysis = analyze_scan_results(results)
+    except Exception as e:
+        result_queue.put((False, str(e), scan_id))
+    else:
+        result_queue.put((True, (results, analysis), scan_id))
+
+
+def stored_findings(findings):
+    """Findings written to the database: everything but exact ``"pass"``."""
+    return [f for f in findings if f.severity != "pass"]
+
+
+def shown_findings(findings):
+    """Findings shown in the results view: non-empty, not any-case ``pass``."""
+    return [f for f in findings if (severity := f.severity) and severity.lower() != "pass"]
@@ -2,6 +2,7 @@
 from .sidebar import Sidebar
 from .metric_card import MetricCard
 from .scan_item import ScanItem
+from .finding_row import FindingRow
 from .risk_bar import RiskBar
 from .compliance_chart import ComplianceChart
 from .circular_progress import CircularProgress
@@ -16,6 +17,7 @@ __all__ = [
     'ComplianceChart',
     'EmptyState',
     'EmptyStatePresets',
+    'FindingRow',
     'InlineNotification',
     'LoadingSpinner',
     'MetricCard',
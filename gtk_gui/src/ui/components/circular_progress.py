@@ -12,6 +12,23 @@ class CircularProgress(Gtk.DrawingArea):
         
         self.percentage = percentage
         self.label = label
+        
+        self._percent_font = cairo.ToyFontFace(
+            "Sans", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_BOLD
+        )
+        self._label_font = cairo.ToyFontFace(
+            "Sans", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_NORMAL
+        )
+        self._extents_cache = {}
+    
+    def _text_extents(self, cr, font, text):
+
+        key = (font is self._percent_font, text)
+        extents = self._extents_cache.get(key)
+        if extents is None:
+            extents = cr.text_extents(text)
+            self._extents_cache[key] = extents
+        return extents
     
     def _draw_progress(self, area, cr, width, height, user_data=None):
 
@@ -53,11 +70,11 @@ class CircularProgress(Gtk.DrawingArea):
             cr.stroke()
         
         cr.set_source_rgb(0.973, 0.980, 0.988)
-        cr.select_font_face("Sans", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_BOLD)
+        cr.set_font_face(self._percent_font)
         cr.set_font_size(38)
         
         text = f"{int(self.percentage)}%"
-        text_extents = cr.text_extents(text)
+        text_extents = self._text_extents(cr, self._percent_font, text)
         text_x = center_x - text_extents.width / 2 - text_extents.x_bearing
         text_y = center_y - 4
         
@@ -66,10 +83,10 @@ class CircularProgress(Gtk.DrawingArea):
         
         if self.label:
             cr.set_source_rgb(0.392, 0.455, 0.545)
-            cr.select_font_face("Sans", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_NORMAL)
+            cr.set_font_face(self._label_font)
             cr.set_font_size(11)
             
-            label_extents = cr.text_extents(self.label)
+            label_extents = self._text_extents(cr, self._label_font, self.label)
             label_x = center_x - label_extents.width / 2 - label_extents.x_bearing
             label_y = center_y + 22
             
@@ -78,6 +95,8 @@ class CircularProgress(Gtk.DrawingArea):
     
     def update(self, percentage, label=None):
 
+        if percentage == self.percentage and (not label or label == self.label):
+            return
         self.percentage = percentage
         if label:
             self.label = label
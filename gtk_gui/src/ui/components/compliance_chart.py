@@ -20,18 +20,39 @@ class ComplianceChart(Gtk.DrawingArea):
             ("12-26", 32),
             ("12-27", 38),
         ]
+        
+        self._margin = 40
+        # one unit-height gradient shared by every bar, mapped onto the plot
+        # area with a pattern matrix so all bars can be filled in one call
+        self._bar_gradient = cairo.LinearGradient(0, 0, 0, 1)
+        self._bar_gradient.add_color_stop_rgb(0, 0.23, 0.51, 0.96)
+        self._bar_gradient.add_color_stop_rgb(1, 0.15, 0.39, 0.92)
+        self._layout_size = None
+        self._gradient_matrix = cairo.Matrix()
+        self._bar_layout = []
+        self._grid_rows = []
+        self.connect("resize", self._on_resize)
     
-    def _draw_chart(self, area, cr, width, height, user_data=None):
+    def _on_resize(self, area, width, height):
 
+        self._compute_layout(width, height)
+    
+    def _compute_layout(self, width, height):
+
+        self._layout_size = (width, height)
+        self._bar_layout = []
         
-        if not self.data:
-            return
-        
-        margin = 40
+        margin = self._margin
         chart_width = width - 2 * margin
         chart_height = height - 2 * margin
+        self._grid_rows = [margin + (chart_height / 4) * i for i in range(5)]
+        span = max(chart_height, 1.0)
+        self._gradient_matrix = cairo.Matrix(yy=1.0 / span, y0=-margin / span)
         
-        max_value = max(val for _, val in self.data) if self.data else 1
+        if not self.data:
+            return
+        
+        max_value = max(val for _, val in self.data) or 1
         
         bar_width = chart_width / len(self.data) * 0.6
         bar_spacing = chart_width / len(self.data)
@@ -41,25 +62,37 @@ class ComplianceChart(Gtk.DrawingArea):
             
             x = margin + i * bar_spacing + (bar_spacing - bar_width) / 2
             y = height - margin - bar_height
-            
-            pattern = cairo.LinearGradient(x, y, x, y + bar_height)
-            pattern.add_color_stop_rgb(0, 0.23, 0.51, 0.96)
-            pattern.add_color_stop_rgb(1, 0.15, 0.39, 0.92)
-            
-            cr.set_source(pattern)
-            radius = 6
+            self._bar_layout.append((x, y, bar_width, bar_height, label))
+    
+    def _draw_chart(self, area, cr, width, height, user_data=None):
+
+        if not self.data:
+            return
+        
+        if self._layout_size != (width, height):
+            self._compute_layout(width, height)
+        
+        margin = self._margin
+        radius = 6
+        
+        self._bar_gradient.set_matrix(self._gradient_matrix)
+        cr.set_source(self._bar_gradient)
+        
+        for x, y, bar_width, bar_height, _ in self._bar_layout:
             cr.new_sub_path()
             cr.arc(x + radius, y + radius, radius, math.pi, 3*math.pi/2)
             cr.arc(x + bar_width - radius, y + radius, radius, 3*math.pi/2, 0)
             cr.line_to(x + bar_width, y + bar_height)
             cr.line_to(x, y + bar_height)
             cr.close_path()
-            cr.fill()
-            
-            cr.set_source_rgb(0.61, 0.64, 0.69)
-            cr.select_font_face("Sans", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_NORMAL)
-            cr.set_font_size(12)
-            
+        
+        cr.fill()
+        
+        cr.set_source_rgb(0.61, 0.64, 0.69)
+        cr.select_font_face("Sans", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_NORMAL)
+        cr.set_font_size(12)
+        
+        for x, _, bar_width, _, label in self._bar_layout:
             text_extents = cr.text_extents(label)
             text_x = x + (bar_width - text_extents.width) / 2
             text_y = height - margin + 24
@@ -70,8 +103,7 @@ class ComplianceChart(Gtk.DrawingArea):
         cr.set_source_rgba(0.22, 0.25, 0.32, 0.5)
         cr.set_line_width(1)
         
-        for i in range(5):
-            y = margin + (chart_height / 4) * i
+        for y in self._grid_rows:
             cr.move_to(margin, y)
             cr.line_to(width - margin, y)
             cr.stroke()
@@ -79,4 +111,6 @@ class ComplianceChart(Gtk.DrawingArea):
     def update_data(self, data):
 
         self.data = data
+        if self._layout_size is not None:
+            self._compute_layout(*self._layout_size)
         self.queue_draw()
@@ -1,6 +1,10 @@
 
 from gi.repository import Gtk
 
+from ...utils.text_attrs import text_attrs
+
+from ...utils.icon_cache import emoji_image
+
 class EmptyState(Gtk.Box):
 
     def __init__(self, icon="📭", title="No data yet", description="", action_label=None, action_callback=None):
@@ -10,17 +14,17 @@ class EmptyState(Gtk.Box):
         self.set_vexpand(True)
         self.add_css_class("empty-state")
         
-        icon_label = Gtk.Label()
-        icon_label.set_markup(f'<span size="48000">{icon}</span>')
-        self.append(icon_label)
+        self.append(emoji_image(icon, 48000))
         
         title_label = Gtk.Label()
-        title_label.set_markup(f'<span size="14000" weight="600" color="#E2E8F0">{title}</span>')
+        title_label.set_text(title)
+        title_label.set_attributes(text_attrs(size=14000, weight=600, color="#E2E8F0"))
         self.append(title_label)
         
         if description:
             desc_label = Gtk.Label()
-            desc_label.set_markup(f'<span size="11000" color="#64748B">{description}</span>')
+            desc_label.set_text(description)
+            desc_label.set_attributes(text_attrs(size=11000, color="#64748B"))
             desc_label.set_wrap(True)
             desc_label.set_max_width_chars(40)
             desc_label.set_justify(Gtk.Justification.CENTER)
@@ -29,7 +33,6 @@ class EmptyState(Gtk.Box):
         if action_label and action_callback:
             button = Gtk.Button(label=action_label)
             button.add_css_class("btn-primary")
-            button.set_margin_top(8)
             button.connect("clicked", action_callback)
             self.append(button)
 
@@ -0,0 +1,74 @@
+
+from gi.repository import Gtk
+
+from ...utils.text_attrs import text_attrs
+
+_DEFAULT_SEVERITY_CSS = "metric-label"
+
+# severity -> (badge text, CSS class), so a row resolves both in one lookup
+_SEVERITY_STYLES = {
+    sev: (sev.upper(), f"severity-{sev}")
+    for sev in ("critical", "high", "medium", "low")
+}
+_SEVERITY_STYLES[""] = ("INFO", _DEFAULT_SEVERITY_CSS)
+
+class FindingRow(Gtk.Box):
+
+    def __init__(self, finding=None):
+        super().__init__(spacing=10)
+        self.add_css_class("finding-row")
+
+        self._severity_css = None
+        self._build_ui()
+        if finding is not None:
+            self.update(finding)
+
+    def _build_ui(self):
+
+        self.sev_label = Gtk.Label()
+        self.append(self.sev_label)
+
+        text_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2)
+
+        self.msg_label = Gtk.Label()
+        self.msg_label.set_halign(Gtk.Align.START)
+        self.msg_label.set_wrap(True)
+        self.msg_label.set_xalign(0.0)
+        self.msg_label.set_attributes(text_attrs(size=10500))
+        text_box.append(self.msg_label)
+
+        self.meta_label = Gtk.Label()
+        self.meta_label.set_halign(Gtk.Align.START)
+        self.meta_label.add_css_class("metric-label")
+        self.meta_label.set_visible(False)
+        text_box.append(self.meta_label)
+
+        self.append(text_box)
+
+    def update(self, finding):
+
+        # rows are rebound by the findings list; only what differs from the
+        # previous finding shown in this row is written
+        sev = (finding.severity or "").lower()
+        severity_text, severity_css = (
+            _SEVERITY_STYLES.get(sev) or (sev.upper(), _DEFAULT_SEVERITY_CSS)
+        )
+        self._set_label_text(self.sev_label, severity_text)
+
+        if severity_css != self._severity_css:
+            if self._severity_css is not None:
+                self.sev_label.remove_css_class(self._severity_css)
+            self.sev_label.add_css_class(severity_css)
+            self._severity_css = severity_css
+
+        self._set_label_text(self.msg_label, finding.message or "")
+
+        meta = " • ".join(part for part in (finding.category, finding.location) if part)
+        self._set_label_text(self.meta_label, meta)
+        if self.meta_label.get_visible() != bool(meta):
+            self.meta_label.set_visible(bool(meta))
+
+    def _set_label_text(self, label, text):
+
+        if label.get_text() != text:
+            label.set_text(text)
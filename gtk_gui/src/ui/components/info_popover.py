@@ -0,0 +1,41 @@
+
+from gi.repository import Gtk
+
+def build_info_popover(parent, text, use_markup=False):
+
+    popover = Gtk.Popover()
+    popover.set_has_arrow(True)
+    popover.set_parent(parent)
+    popover.set_autohide(True)
+
+    box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
+    box.set_margin_top(8)
+    box.set_margin_bottom(8)
+    box.set_margin_start(10)
+    box.set_margin_end(10)
+
+    label = Gtk.Label()
+    label.set_wrap(True)
+    label.set_xalign(0.0)
+    if use_markup:
+        label.set_markup(text)
+    else:
+        label.set_text(text)
+    box.append(label)
+
+    popover.set_child(box)
+    return popover, label
+
+def connect_info_popover(button, text, use_markup=False):
+
+    # most info buttons are never clicked, so the popover is only built on
+    # the first click and then reused
+    popover = None
+
+    def _on_info_clicked(_button):
+        nonlocal popover
+        if popover is None:
+            popover, _label = build_info_popover(button, text, use_markup)
+        popover.popup()
+
+    return button.connect("clicked", _on_info_clicked)
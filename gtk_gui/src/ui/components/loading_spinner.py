@@ -1,6 +1,8 @@
 
 from gi.repository import Gtk
 
+from ...utils.text_attrs import text_attrs
+
 class LoadingSpinner(Gtk.Box):
 
     def __init__(self, text="Loading..."):
@@ -14,7 +16,8 @@ class LoadingSpinner(Gtk.Box):
         self.append(self.spinner)
         
         self.label = Gtk.Label()
-        self.label.set_markup(f'<span size="12000" weight="500" color="#94A3B8">{text}</span>')
+        self.label.set_text(text)
+        self.label.set_attributes(text_attrs(size=12000, weight=500, color="#94A3B8"))
         self.append(self.label)
         
         self.add_css_class("pulse")
@@ -22,7 +25,7 @@ class LoadingSpinner(Gtk.Box):
     def start(self, text=None):
 
         if text:
-            self.label.set_markup(f'<span size="12000" weight="500" color="#94A3B8">{text}</span>')
+            self.label.set_text(text)
         self.spinner.start()
         self.set_visible(True)
     
@@ -33,4 +36,4 @@ class LoadingSpinner(Gtk.Box):
     
     def update_text(self, text):
 
-        self.label.set_markup(f'<span size="12000" weight="500" color="#94A3B8">{text}</span>')
+        self.label.set_text(text)
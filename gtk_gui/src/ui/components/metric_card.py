@@ -1,6 +1,9 @@
 
 from gi.repository import Gtk
 
+from ...utils.text_attrs import text_attrs
+from .info_popover import build_info_popover
+
 class MetricCard(Gtk.Box):
 
     def __init__(self, label, value="0", subtitle=""):
@@ -12,24 +15,27 @@ class MetricCard(Gtk.Box):
         self.set_tooltip_text(f"{label}: {subtitle}")
         
         self.label_widget = Gtk.Label()
-        self.label_widget.set_markup(f'<span size="9500" weight="600" letter_spacing="150" color="#64748B">{label}</span>')
+        self.label_widget.set_text(label)
+        self.label_widget.set_attributes(text_attrs(size=9500, weight=600, color="#64748B", letter_spacing=150))
         self.label_widget.set_halign(Gtk.Align.START)
         self.append(self.label_widget)
         
-        spacer = Gtk.Box()
-        spacer.set_vexpand(True)
-        self.append(spacer)
-        
         self.value_widget = Gtk.Label()
-        self.value_widget.set_markup(f'<span size="32000" weight="800" letter_spacing="-500" color="#60A5FA">{value}</span>')
+        self.value_widget.set_text(str(value))
+        self.value_widget.set_attributes(text_attrs(size=32000, weight=800, color="#60A5FA", letter_spacing=-500))
         self.value_widget.set_halign(Gtk.Align.START)
+        # takes the card's spare height and sits at its bottom, so the value
+        # stays pinned above the subtitle without a spacer widget
+        self.value_widget.set_vexpand(True)
+        self.value_widget.set_valign(Gtk.Align.END)
         self.append(self.value_widget)
         
         subtitle_box = Gtk.Box(spacing=6)
         subtitle_box.set_halign(Gtk.Align.START)
         
         self.subtitle_widget = Gtk.Label()
-        self.subtitle_widget.set_markup(f'<span size="10500" color="#9CA3AF">{subtitle}</span>')
+        self.subtitle_widget.set_text(subtitle)
+        self.subtitle_widget.set_attributes(text_attrs(size=10500, color="#9CA3AF"))
         subtitle_box.append(self.subtitle_widget)
 
         self.info_button = Gtk.Button()
@@ -38,44 +44,66 @@ class MetricCard(Gtk.Box):
         self.info_button.set_valign(Gtk.Align.CENTER)
 
         info_label = Gtk.Label()
-        info_label.set_markup('<span size="9000" color="#64748B">ⓘ</span>')
+        info_label.set_text("ⓘ")
+        info_label.set_attributes(text_attrs(size=9000, color="#64748B"))
         self.info_button.set_child(info_label)
         self.info_button.set_visible(False)
         subtitle_box.append(self.info_button)
         
         self.append(subtitle_box)
+
+        self._value_text = str(value)
+        self._value_color = "#60A5FA"
+        self._subtitle = None
+
+        self._info_text = None
+        self._info_popover = None
+        self._info_popover_label = None
+        self._info_handler_id = None
     
     def update(self, value, subtitle=None, color="#60A5FA"):
 
-        self.value_widget.set_markup(f'<span size="32000" weight="800" letter_spacing="-500" color="{color}">{value}</span>')
-        if subtitle:
-            self.subtitle_widget.set_markup(f'<span size="10500" color="#9CA3AF">{subtitle}</span>')
+        value_text = str(value)
+        if value_text != self._value_text:
+            self.value_widget.set_text(value_text)
+            self._value_text = value_text
+        if color != self._value_color:
+            self.value_widget.set_attributes(
+                text_attrs(size=32000, weight=800, letter_spacing=-500, color=color)
+            )
+            self._value_color = color
+        if subtitle and subtitle != self._subtitle:
+            self._subtitle = subtitle
+            self.subtitle_widget.set_text(subtitle)
             self.set_tooltip_text(f"{subtitle}")
 
     def set_info(self, tooltip_text: str) -> None:
 
-        from gi.repository import Gtk as _Gtk
-
-        popover = _Gtk.Popover()
-        popover.set_has_arrow(True)
-        popover.set_parent(self.info_button)
-        popover.set_autohide(True)
-
-        box = _Gtk.Box(orientation=_Gtk.Orientation.VERTICAL, spacing=6)
-        box.set_margin_top(8)
-        box.set_margin_bottom(8)
-        box.set_margin_start(10)
-        box.set_margin_end(10)
+        # the popover is built on first click and reused; repeated calls only
+        # swap its text instead of stacking popovers and click handlers
+        self._info_text = tooltip_text
+        if self._info_popover_label is not None:
+            self._info_popover_label.set_text(tooltip_text)
+        if self._info_handler_id is None:
+            self._info_handler_id = self.info_button.connect("clicked", self._on_info_clicked)
+        self.info_button.set_visible(True)
 
-        label = _Gtk.Label(label=tooltip_text)
-        label.set_wrap(True)
-        label.set_xalign(0.0)
-        box.append(label)
+    def clear_info(self) -> None:
 
-        popover.set_child(box)
+        if self._info_handler_id is not None:
+            self.info_button.disconnect(self._info_handler_id)
+            self._info_handler_id = None
+        if self._info_popover is not None:
+            self._info_popover.unparent()
+            self._info_popover = None
+            self._info_popover_label = None
+        self._info_text = None
+        self.info_button.set_visible(False)
 
-        def _on_info_clicked(_button, this_popover=popover):
-            this_popover.popup()
+    def _on_info_clicked(self, _button):
 
-        self.info_button.connect("clicked", _on_info_clicked)
-        self.info_button.set_visible(True)
+        if self._info_popover is None:
+            self._info_popover, self._info_popover_label = build_info_popover(
+                self.info_button, self._info_text
+            )
+        self._info_popover.popup()
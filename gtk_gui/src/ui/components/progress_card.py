@@ -1,5 +1,13 @@
 
-from gi.repository import Gtk
+from gi.repository import Gtk, GLib
+
+from ...utils.text_attrs import text_attrs
+
+# progress updates arriving faster than this are coalesced into one redraw
+_UPDATE_INTERVAL_MS = 33
+
+# percentage label colour for <30%, 30-69% and >=70%
+_PERCENT_TIER_COLORS = ("#3B82F6", "#60A5FA", "#10B981")
 
 class ProgressCard(Gtk.Box):
 
@@ -10,23 +18,24 @@ class ProgressCard(Gtk.Box):
         self.set_size_request(-1, 160)
         
         self.title_label = Gtk.Label()
-        self.title_label.set_markup(f'<span size="13000" weight="600" color="#E2E8F0">{title}</span>')
+        self.title_label.set_text(title)
+        self.title_label.set_attributes(text_attrs(size=13000, weight=600, color="#E2E8F0"))
         self.title_label.set_halign(Gtk.Align.START)
         self.append(self.title_label)
         
         info_box = Gtk.Box(spacing=12)
         
         self.percentage_label = Gtk.Label()
-        self.percentage_label.set_markup('<span size="32000" weight="800" color="#3B82F6">0%</span>')
+        self.percentage_label.set_text("0%")
+        self.percentage_label.set_attributes(text_attrs(size=32000, weight=800, color="#3B82F6"))
         info_box.append(self.percentage_label)
         
-        separator = Gtk.Separator(orientation=Gtk.Orientation.VERTICAL)
-        separator.set_margin_top(8)
-        separator.set_margin_bottom(8)
-        info_box.append(separator)
-        
+        # the divider is drawn as a CSS border on the status label rather
+        # than by a separate Gtk.Separator
         self.status_label = Gtk.Label()
-        self.status_label.set_markup('<span size="11000" color="#94A3B8">Initializing...</span>')
+        self.status_label.add_css_class("progress-card-status")
+        self.status_label.set_text("Initializing...")
+        self.status_label.set_attributes(text_attrs(size=11000, color="#94A3B8"))
         self.status_label.set_halign(Gtk.Align.START)
         self.status_label.set_hexpand(True)
         self.status_label.set_wrap(True)
@@ -40,40 +49,72 @@ class ProgressCard(Gtk.Box):
         self.append(self.progress_bar)
         
         self.time_label = Gtk.Label()
-        self.time_label.set_markup('<span size="9500" color="#64748B">Estimated time remaining: calculating...</span>')
+        self.time_label.set_text("Estimated time remaining: calculating...")
+        self.time_label.set_attributes(text_attrs(size=9500, color="#64748B"))
         self.time_label.set_halign(Gtk.Align.START)
         self.append(self.time_label)
+
+        self._pending = None
+        self._flush_source_id = None
+
+        self._tier_attrs = tuple(
+            text_attrs(size=32000, weight=800, color=color) for color in _PERCENT_TIER_COLORS
+        )
     
     def update(self, percentage, status_text=None, time_remaining=None):
 
+        if self._pending is not None:
+            _percentage, pending_status, pending_time = self._pending
+            if status_text is None:
+                status_text = pending_status
+            if time_remaining is None:
+                time_remaining = pending_time
+        self._pending = (percentage, status_text, time_remaining)
+
+        if self._flush_source_id is None:
+            self._flush_source_id = GLib.timeout_add(_UPDATE_INTERVAL_MS, self._flush)
+
+    def _flush(self):
+
+        self._flush_source_id = None
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            self._apply(*pending)
+        return GLib.SOURCE_REMOVE
+
+    def _cancel_pending(self):
+
+        if self._flush_source_id is not None:
+            GLib.source_remove(self._flush_source_id)
+            self._flush_source_id = None
+        self._pending = None
+
+    def _apply(self, percentage, status_text=None, time_remaining=None):
+
         fraction = min(max(percentage / 100.0, 0.0), 1.0)
         self.progress_bar.set_fraction(fraction)
         
-        if percentage < 30:
-            color = "#3B82F6"
-        elif percentage < 70:
-            color = "#60A5FA"
-        else:
-            color = "#10B981"
-        
-        self.percentage_label.set_markup(f'<span size="32000" weight="800" color="{color}">{int(percentage)}%</span>')
+        tier = (percentage >= 30) + (percentage >= 70)
+        self.percentage_label.set_text(f"{int(percentage)}%")
+        self.percentage_label.set_attributes(self._tier_attrs[tier])
         
         if status_text:
-            self.status_label.set_markup(f'<span size="11000" color="#94A3B8">{status_text}</span>')
+            self.status_label.set_text(status_text)
+            self.status_label.set_attributes(text_attrs(size=11000, color="#94A3B8"))
         
         if time_remaining is not None:
             if time_remaining < 60:
                 time_str = f"{int(time_remaining)}s"
             else:
-                mins = int(time_remaining / 60)
-                secs = int(time_remaining % 60)
+                mins, secs = divmod(int(time_remaining), 60)
                 time_str = f"{mins}m {secs}s"
             
-            self.time_label.set_markup(f'<span size="9500" color="#64748B">Time remaining: ~{time_str}</span>')
+            self.time_label.set_text(f"Time remaining: ~{time_str}")
+            self.time_label.set_attributes(text_attrs(size=9500, color="#64748B"))
     
     def set_title(self, title):
 
-        self.title_label.set_markup(f'<span size="13000" weight="600" color="#E2E8F0">{title}</span>')
+        self.title_label.set_text(title)
     
     def pulse(self):
 
@@ -81,13 +122,21 @@ class ProgressCard(Gtk.Box):
     
     def complete(self, message="Complete!"):
 
+        self._cancel_pending()
         self.progress_bar.set_fraction(1.0)
-        self.percentage_label.set_markup('<span size="32000" weight="800" color="#10B981">100%</span>')
-        self.status_label.set_markup(f'<span size="11000" color="#10B981">✓ {message}</span>')
-        self.time_label.set_markup('<span size="9500" color="#10B981">Completed successfully</span>')
+        self.percentage_label.set_text("100%")
+        self.percentage_label.set_attributes(text_attrs(size=32000, weight=800, color="#10B981"))
+        self.status_label.set_text(f"✓ {message}")
+        self.status_label.set_attributes(text_attrs(size=11000, color="#10B981"))
+        self.time_label.set_text("Completed successfully")
+        self.time_label.set_attributes(text_attrs(size=9500, color="#10B981"))
     
     def error(self, message="An error occurred"):
 
-        self.percentage_label.set_markup('<span size="32000" weight="800" color="#EF4444">✗</span>')
-        self.status_label.set_markup(f'<span size="11000" color="#EF4444">{message}</span>')
-        self.time_label.set_markup('<span size="9500" color="#EF4444">Scan failed</span>')
+        self._cancel_pending()
+        self.percentage_label.set_text("✗")
+        self.percentage_label.set_attributes(text_attrs(size=32000, weight=800, color="#EF4444"))
+        self.status_label.set_text(message)
+        self.status_label.set_attributes(text_attrs(size=11000, color="#EF4444"))
+        self.time_label.set_text("Scan failed")
+        self.time_label.set_attributes(text_attrs(size=9500, color="#EF4444"))
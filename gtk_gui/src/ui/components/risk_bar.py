@@ -1,59 +1,115 @@
 
-from gi.repository import Gtk
+from gi.repository import Gtk, Pango, PangoCairo
+import cairo
+import math
 
-class RiskBar(Gtk.Box):
+from ...utils.text_attrs import hex_to_rgb, text_attrs
+
+# gradient stops per severity, matching the .progress-* rules in styles.py
+_SEVERITY_GRADIENTS = {
+    "critical": ("#EF4444", "#DC2626"),
+    "high": ("#F59E0B", "#D97706"),
+    "medium": ("#F59E0B", "#EAB308"),
+    "low": ("#10B981", "#059669"),
+}
+
+_LABEL_COLOR = "#F1F5F9"
+_COUNT_COLOR = "#9CA3AF"
+_TRACK_RGBA = (55 / 255, 65 / 255, 81 / 255, 0.5)
+
+_HEADER_SPACING = 8
+_BAR_HEIGHT = 6
+
+def _cairo_rgb(color):
+
+    return tuple(c / 255 for c in hex_to_rgb(color))
+
+class RiskBar(Gtk.DrawingArea):
+
+    def __init__(self, label, count=0, color="#38BDF8", severity=None):
+        super().__init__()
+        self.add_css_class("risk-bar")
+        self.set_hexpand(True)
 
-    def __init__(self, label, count=0, color="#38BDF8"):
-        super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-        self.set_margin_top(8)
-        self.set_margin_bottom(8)
-        
         self.label_text = label
         self.color = color
-        
-        header = Gtk.Box(spacing=8)
-        
-        self.label_widget = Gtk.Label(label=label)
-        self.label_widget.set_halign(Gtk.Align.START)
-        self.label_widget.set_hexpand(True)
-        self.label_widget.set_markup(f"<b>{label}</b>")
-        header.append(self.label_widget)
-        
-        self.count_label = Gtk.Label(label=str(count))
-        self.count_label.add_css_class("metric-label")
-        self.count_label.set_markup(f"<b>{count}</b>")
-        header.append(self.count_label)
-        
-        self.append(header)
-        
-        progress_container = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
-        progress_container.set_size_request(-1, 6)
-        
-        self.progress = Gtk.ProgressBar()
-        self.progress.set_fraction(0.0)
-        self.progress.set_show_text(False)
-        self.progress.set_hexpand(True)
-        self.progress.set_valign(Gtk.Align.CENTER)
-        
-        if "Critical" in label:
-            self.progress.add_css_class("progress-critical")
-        elif "High" in label:
-            self.progress.add_css_class("progress-high")
-        elif "Medium" in label:
-            self.progress.add_css_class("progress-medium")
-        elif "Low" in label:
-            self.progress.add_css_class("progress-low")
-        
-        progress_container.append(self.progress)
-        self.append(progress_container)
-    
+        self.count = count
+        self._fraction = 0.0
+
+        # label, count and bar are painted by one widget instead of a
+        # Box/Label/Label/Box/ProgressBar tree per bar
+        self._label_layout = self.create_pango_layout(label)
+        self._label_layout.set_attributes(text_attrs(weight=700))
+        self._label_layout.set_ellipsize(Pango.EllipsizeMode.END)
+
+        self._count_layout = self.create_pango_layout(str(count))
+        self._count_layout.set_attributes(text_attrs(weight=700))
+
+        self._header_height = max(
+            self._label_layout.get_pixel_size()[1],
+            self._count_layout.get_pixel_size()[1],
+        )
+        self.set_content_height(self._header_height + _HEADER_SPACING + _BAR_HEIGHT)
+
+        if severity is None:
+            words = label.split()
+            severity = words[0].lower() if words else ""
+        start, end = _SEVERITY_GRADIENTS.get(severity, (color, color))
+        self._gradient_stops = (_cairo_rgb(start), _cairo_rgb(end))
+
+        self.set_draw_func(self._draw_bar)
+
+    def _rounded_rect(self, cr, x, y, width, height):
+
+        radius = height / 2
+        cr.new_sub_path()
+        cr.arc(x + width - radius, y + radius, radius, -math.pi / 2, math.pi / 2)
+        cr.arc(x + radius, y + radius, radius, math.pi / 2, 3 * math.pi / 2)
+        cr.close_path()
+
+    def _draw_bar(self, area, cr, width, height, user_data=None):
+
+        count_width = self._count_layout.get_pixel_size()[0]
+
+        self._label_layout.set_width(
+            max(width - count_width - _HEADER_SPACING, 0) * Pango.SCALE
+        )
+        cr.set_source_rgb(*_cairo_rgb(_LABEL_COLOR))
+        cr.move_to(0, 0)
+        PangoCairo.show_layout(cr, self._label_layout)
+
+        cr.set_source_rgb(*_cairo_rgb(_COUNT_COLOR))
+        cr.move_to(width - count_width, 0)
+        PangoCairo.show_layout(cr, self._count_layout)
+
+        bar_y = self._header_height + _HEADER_SPACING
+
+        self._rounded_rect(cr, 0, bar_y, width, _BAR_HEIGHT)
+        cr.set_source_rgba(*_TRACK_RGBA)
+        cr.fill()
+
+        if self._fraction > 0:
+            fill_width = max(width * self._fraction, _BAR_HEIGHT)
+            start, end = self._gradient_stops
+
+            gradient = cairo.LinearGradient(0, 0, fill_width, 0)
+            gradient.add_color_stop_rgb(0, *start)
+            gradient.add_color_stop_rgb(1, *end)
+
+            self._rounded_rect(cr, 0, bar_y, fill_width, _BAR_HEIGHT)
+            cr.set_source(gradient)
+            cr.fill()
+
     def update(self, count, total=100):
 
-        self.count_label.set_text(str(count))
-        
+        if count != self.count:
+            self.count = count
+            self._count_layout.set_text(str(count), -1)
+
         if total > 0:
             fraction = min(count / total, 1.0)
         else:
             fraction = 0.0
-        
-        self.progress.set_fraction(fraction)
+
+        self._fraction = fraction
+        self.queue_draw()
@@ -1,58 +1,81 @@
 
 from gi.repository import Gtk
 
+from ...utils.icon_cache import emoji_image
+from ...utils.text_attrs import text_attrs
+
+_STATUS_CSS = {
+    "completed": "severity-low",
+    "failed": "severity-critical",
+    "running": "severity-medium",
+}
+_DEFAULT_STATUS_CSS = "metric-label"
+_STATUS_UPPER = {status: status.upper() for status in _STATUS_CSS}
+
 class ScanItem(Gtk.Box):
 
     def __init__(self, scan_data):
         super().__init__(spacing=16)
         self.add_css_class("scan-item")
-        self.set_margin_top(0)
-        self.set_margin_bottom(0)
         
         self.scan_data = scan_data
+        self._status_css = None
         self._build_ui()
+        self.reset(scan_data)
     
     def _build_ui(self):
 
         icon_box = Gtk.Box()
         icon_box.set_valign(Gtk.Align.CENTER)
-        icon = Gtk.Label(label="📄")
-        icon.set_markup('<span size="16000">📄</span>')
-        icon_box.append(icon)
+        icon_box.append(emoji_image("📄", 16000))
         self.append(icon_box)
         
         info_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
         info_box.set_hexpand(True)
         info_box.set_valign(Gtk.Align.CENTER)
         
-        url_label = Gtk.Label(label=self.scan_data.get('url', 'Unknown'))
-        url_label.set_halign(Gtk.Align.START)
-        url_label.set_ellipsize(3)
-        url_label.set_markup(f"<b>{self.scan_data.get('url', 'Unknown')}</b>")
-        info_box.append(url_label)
+        self.url_label = Gtk.Label()
+        self.url_label.set_halign(Gtk.Align.START)
+        self.url_label.set_ellipsize(3)
+        self.url_label.set_attributes(text_attrs(weight=700))
+        info_box.append(self.url_label)
         
-        time_label = Gtk.Label(label=self.scan_data.get('start_time', ''))
-        time_label.set_halign(Gtk.Align.START)
-        time_label.add_css_class("metric-label")
-        info_box.append(time_label)
+        self.time_label = Gtk.Label()
+        self.time_label.set_halign(Gtk.Align.START)
+        self.time_label.add_css_class("metric-label")
+        info_box.append(self.time_label)
         
         self.append(info_box)
         
         status_box = Gtk.Box()
         status_box.set_valign(Gtk.Align.CENTER)
         
-        status = self.scan_data.get('status', 'unknown')
-        status_label = Gtk.Label(label=status.upper())
-        status_label.set_margin_start(12)
-        
-        if status == "completed":
-            status_label.add_css_class("severity-low")
-        elif status == "failed":
-            status_label.add_css_class("severity-critical")
-        elif status == "running":
-            status_label.add_css_class("severity-medium")
-        else:
-             status_label.add_css_class("metric-label")
+        self.status_label = Gtk.Label()
+        self.status_label.set_margin_start(12)
         
-        status_box.append(status_label)
+        status_box.append(self.status_label)
         self.append(status_box)
+    
+    def reset(self, scan_data):
+
+        # lets list views recycle an existing item for another scan instead
+        # of building a new widget tree
+        self.scan_data = scan_data
+        
+        self._set_label_text(self.url_label, scan_data.get('url') or 'Unknown')
+        self._set_label_text(self.time_label, scan_data.get('start_time') or '')
+        
+        status = scan_data.get('status', 'unknown')
+        self._set_label_text(self.status_label, _STATUS_UPPER.get(status) or status.upper())
+        
+        status_css = _STATUS_CSS.get(status, _DEFAULT_STATUS_CSS)
+        if status_css != self._status_css:
+            if self._status_css is not None:
+                self.status_label.remove_css_class(self._status_css)
+            self.status_label.add_css_class(status_css)
+            self._status_css = status_css
+
+    def _set_label_text(self, label, text):
+
+        if label.get_text() != text:
+            label.set_text(text)
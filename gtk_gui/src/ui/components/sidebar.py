@@ -1,5 +1,42 @@
 
-from gi.repository import Gtk, Pango
+from functools import lru_cache
+
+from gi.repository import Gio, GLib, Gtk, Pango
+
+from ...utils.text_attrs import hex_to_rgb, text_attrs
+from .info_popover import connect_info_popover
+
+# (key, caption, value colour, info popover text); the order matches the
+# arguments of Sidebar.update_stats
+_STAT_ROWS = (
+    ("total_scans", "Scans", None, None),
+    ("threats", "Threats", "#9CA3AF", (
+        "Total number of findings (critical, high, medium and low) "
+        "across all stored scans."
+    )),
+)
+
+# (key, caption, ok text, failed text); the order matches the arguments of
+# Sidebar.update_system_status
+_STATUS_ROWS = (
+    ("scanner", "Scanner", "Healthy", "Degraded"),
+    ("db", "Database", "Ready", "Error"),
+)
+
+_STATUS_BULLET = "●"
+_STATUS_OK_COLOR = "#10B981"
+_STATUS_FAILED_COLOR = "#9CA3AF"
+
+@lru_cache(maxsize=None)
+def _bullet_attrs(color):
+
+    # colours only the leading bullet; Pango indices are UTF-8 byte offsets
+    attr = Pango.attr_foreground_new(*(c * 257 for c in hex_to_rgb(color)))
+    attr.start_index = 0
+    attr.end_index = len(_STATUS_BULLET.encode("utf-8"))
+    attrs = Pango.AttrList()
+    attrs.insert(attr)
+    return attrs
 
 class Sidebar(Gtk.Box):
 
@@ -11,19 +48,31 @@ class Sidebar(Gtk.Box):
         
         self.on_page_changed = on_page_changed
         self.active_button = None
+        self._nav_buttons = {}
+
+        # every nav button activates this one action with its page name as
+        # the target, instead of each button owning a Python closure
+        navigate = Gio.SimpleAction.new("navigate", GLib.VariantType.new("s"))
+        navigate.connect("activate", self._on_navigate)
+        actions = Gio.SimpleActionGroup()
+        actions.add_action(navigate)
+        self.insert_action_group("sidebar", actions)
+
+        self._stat_labels = {}
+        self._status_labels = {}
+        self._last_stats = None
+        self._last_system_status = None
         
         self._build_ui()
     
     def _build_ui(self):
 
         header = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2)
-        header.set_margin_top(20)
-        header.set_margin_bottom(20)
-        header.set_margin_start(16)
-        header.set_margin_end(16)
+        header.add_css_class("sidebar-header")
         
         logo_label = Gtk.Label()
-        logo_label.set_markup('<span size="12000" weight="800" letter_spacing="100">ShieldEye</span>')
+        logo_label.set_text("ShieldEye")
+        logo_label.set_attributes(text_attrs(size=12000, weight=800, letter_spacing=100))
         logo_label.set_halign(Gtk.Align.START)
         logo_label.set_ellipsize(Pango.EllipsizeMode.END)
         header.append(logo_label)
@@ -38,9 +87,10 @@ class Sidebar(Gtk.Box):
         self.append(header)
         
         nav_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
-        nav_box.set_margin_start(12)
-        nav_box.set_margin_end(12)
-        nav_box.set_margin_top(8)
+        nav_box.add_css_class("sidebar-nav")
+        # absorbs the free height that pushes the stats to the bottom
+        nav_box.set_vexpand(True)
+        nav_box.set_valign(Gtk.Align.START)
         
         self.dashboard_btn = self._create_nav_button("Dashboard", "dashboard", True)
         nav_box.append(self.dashboard_btn)
@@ -53,12 +103,8 @@ class Sidebar(Gtk.Box):
         
         self.append(nav_box)
         
-        spacer = Gtk.Box()
-        spacer.set_vexpand(True)
-        self.append(spacer)
-        
         self.stats_box = self._create_quick_stats()
-        self.stats_box.set_margin_top(8)
+        self.stats_box.add_css_class("sidebar-stats")
         self.append(self.stats_box)
         
         self.status_box = self._create_system_status()
@@ -81,10 +127,15 @@ class Sidebar(Gtk.Box):
             btn.add_css_class("active")
             self.active_button = btn
         
-        btn.connect("clicked", lambda b: self._on_nav_clicked(b, page_name))
+        btn.set_action_name("sidebar.navigate")
+        btn.set_action_target_value(GLib.Variant.new_string(page_name))
+        self._nav_buttons[page_name] = btn
         return btn
     
-    def _on_nav_clicked(self, button, page_name):
+    def _on_navigate(self, _action, parameter):
+
+        page_name = parameter.get_string()
+        button = self._nav_buttons[page_name]
 
         if self.active_button:
             self.active_button.remove_css_class("active")
@@ -95,142 +146,105 @@ class Sidebar(Gtk.Box):
         if self.on_page_changed:
             self.on_page_changed(page_name)
     
-    def _create_quick_stats(self):
+    def _create_section(self, title_text):
 
-        stats_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-        stats_box.set_margin_start(16)
-        stats_box.set_margin_end(16)
-        stats_box.set_margin_bottom(20)
+        section = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
+        section.add_css_class("sidebar-section")
         
-        title = Gtk.Label(label="Quick Stats")
+        title = Gtk.Label(label=title_text)
         title.set_halign(Gtk.Align.START)
         title.add_css_class("sidebar-section-title")
-        title.set_margin_bottom(4)
-        stats_box.append(title)
-        
-        self.total_scans_label = Gtk.Label()
-        self.total_scans_label.set_markup('<span size="13000" weight="bold">0</span>')
-        self.total_scans_label.set_halign(Gtk.Align.START)
-        stats_box.append(self.total_scans_label)
-        
-        scans_label = Gtk.Label(label="Scans")
-        scans_label.set_halign(Gtk.Align.START)
-        scans_label.add_css_class("sidebar-stat-label")
-        scans_label.set_margin_bottom(8)
-        stats_box.append(scans_label)
-        
-        self.threats_label = Gtk.Label()
-        self.threats_label.set_markup('<span size="13000" weight="bold" color="#9CA3AF">0</span>')
-        self.threats_label.set_halign(Gtk.Align.START)
-        stats_box.append(self.threats_label)
-        
-        threats_row = Gtk.Box(spacing=4)
-        threats_row.set_halign(Gtk.Align.START)
-
-        threats_label = Gtk.Label(label="Threats")
-        threats_label.set_halign(Gtk.Align.START)
-        threats_label.add_css_class("sidebar-stat-label")
-        threats_row.append(threats_label)
-
-        threats_button = Gtk.Button()
-        threats_button.add_css_class("flat")
-        threats_button.set_can_focus(False)
-        threats_button.set_valign(Gtk.Align.CENTER)
-
-        threats_info_label = Gtk.Label()
-        threats_info_label.set_markup('<span size="9000" color="#64748B">ⓘ</span>')
-        threats_button.set_child(threats_info_label)
-
-        popover = Gtk.Popover()
-        popover.set_has_arrow(True)
-        popover.set_parent(threats_button)
-        popover.set_autohide(True)
-
-        pop_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-        pop_box.set_margin_top(8)
-        pop_box.set_margin_bottom(8)
-        pop_box.set_margin_start(10)
-        pop_box.set_margin_end(10)
-
-        pop_text = Gtk.Label(label=(
-            "Total number of findings (critical, high, medium and low) "
-            "across all stored scans."
-        ))
-        pop_text.set_wrap(True)
-        pop_text.set_xalign(0.0)
-        pop_box.append(pop_text)
-
-        popover.set_child(pop_box)
-
-        def _on_threats_info_clicked(_button, this_popover=popover):
-            this_popover.popup()
-
-        threats_button.connect("clicked", _on_threats_info_clicked)
-        threats_row.append(threats_button)
-
-        stats_box.append(threats_row)
+        section.append(title)
+        
+        return section
+    
+    def _create_quick_stats(self):
+
+        stats_box = self._create_section("Quick Stats")
+        
+        for key, caption, color, info_text in _STAT_ROWS:
+            value_label = Gtk.Label()
+            value_label.set_text("0")
+            value_label.set_attributes(text_attrs(size=13000, weight=700, color=color))
+            value_label.set_halign(Gtk.Align.START)
+            stats_box.append(value_label)
+            self._stat_labels[key] = value_label
+            
+            caption_row = Gtk.Box(spacing=4)
+            caption_row.set_halign(Gtk.Align.START)
+            caption_row.add_css_class("sidebar-stat-caption")
+            
+            caption_label = Gtk.Label(label=caption)
+            caption_label.set_halign(Gtk.Align.START)
+            caption_label.add_css_class("sidebar-stat-label")
+            caption_row.append(caption_label)
+            
+            if info_text:
+                info_button = Gtk.Button()
+                info_button.add_css_class("flat")
+                info_button.set_can_focus(False)
+                info_button.set_valign(Gtk.Align.CENTER)
+                
+                info_label = Gtk.Label()
+                info_label.set_text("ⓘ")
+                info_label.set_attributes(text_attrs(size=9000, color="#64748B"))
+                info_button.set_child(info_label)
+                
+                connect_info_popover(info_button, info_text)
+                caption_row.append(info_button)
+            
+            stats_box.append(caption_row)
         
         return stats_box
     
     def _create_system_status(self):
 
-        status_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-        status_box.set_margin_start(16)
-        status_box.set_margin_end(16)
-        status_box.set_margin_bottom(20)
-        
-        title = Gtk.Label(label="System Status")
-        title.set_halign(Gtk.Align.START)
-        title.add_css_class("sidebar-section-title")
-        title.set_margin_bottom(4)
-        status_box.append(title)
-        
-        scanner_box = Gtk.Box(spacing=8)
-        scanner_label = Gtk.Label(label="Scanner")
-        scanner_label.set_halign(Gtk.Align.START)
-        scanner_label.set_hexpand(True)
-        scanner_label.add_css_class("sidebar-stat-label")
-        scanner_box.append(scanner_label)
-        
-        self.scanner_status_label = Gtk.Label()
-        self.scanner_status_label.set_markup('<span color="#10B981">●</span> Healthy')
-        self.scanner_status_label.add_css_class("sidebar-stat-label")
-        self.scanner_status_label.add_css_class("status-indicator")
-        scanner_box.append(self.scanner_status_label)
-        
-        status_box.append(scanner_box)
-        
-        db_box = Gtk.Box(spacing=8)
-        db_label = Gtk.Label(label="Database")
-        db_label.set_halign(Gtk.Align.START)
-        db_label.set_hexpand(True)
-        db_label.add_css_class("sidebar-stat-label")
-        db_box.append(db_label)
-        
-        self.db_status_label = Gtk.Label()
-        self.db_status_label.set_markup('<span color="#10B981">●</span> Ready')
-        self.db_status_label.add_css_class("sidebar-stat-label")
-        db_box.append(self.db_status_label)
-        
-        status_box.append(db_box)
+        status_box = self._create_section("System Status")
+        
+        for key, caption, ok_text, _failed_text in _STATUS_ROWS:
+            row = Gtk.Box(spacing=8)
+            
+            caption_label = Gtk.Label(label=caption)
+            caption_label.set_halign(Gtk.Align.START)
+            caption_label.set_hexpand(True)
+            caption_label.add_css_class("sidebar-stat-label")
+            row.append(caption_label)
+            
+            status_label = Gtk.Label()
+            status_label.set_text(f"{_STATUS_BULLET} {ok_text}")
+            status_label.set_attributes(_bullet_attrs(_STATUS_OK_COLOR))
+            status_label.add_css_class("sidebar-stat-label")
+            status_label.add_css_class("status-indicator")
+            row.append(status_label)
+            self._status_labels[key] = status_label
+            
+            status_box.append(row)
         
         return status_box
     
     def update_stats(self, total_scans, threats_found):
 
-        self.total_scans_label.set_markup(f'<span size="13000" weight="bold">{total_scans}</span>')
-        self.threats_label.set_markup(f'<span size="13000" weight="bold" color="#9CA3AF">{threats_found}</span>')
+        stats = (total_scans, threats_found)
+        if stats == self._last_stats:
+            return
+        self._last_stats = stats
+
+        # the attribute lists were attached in _create_quick_stats
+        for (key, *_rest), value in zip(_STAT_ROWS, stats):
+            self._stat_labels[key].set_text(str(value))
 
     def update_system_status(self, scanner_ok: bool, db_ok: bool) -> None:
 
-        if scanner_ok:
-            scanner_text = '<span color="#10B981">●</span> Healthy'
-        else:
-            scanner_text = '<span color="#9CA3AF">●</span> Degraded'
-        self.scanner_status_label.set_markup(scanner_text)
-
-        if db_ok:
-            db_text = '<span color="#10B981">●</span> Ready'
-        else:
-            db_text = '<span color="#9CA3AF">●</span> Error'
-        self.db_status_label.set_markup(db_text)
+        system_status = (scanner_ok, db_ok)
+        if system_status == self._last_system_status:
+            return
+        self._last_system_status = system_status
+
+        for (key, _caption, ok_text, failed_text), ok in zip(_STATUS_ROWS, system_status):
+            label = self._status_labels[key]
+            if ok:
+                label.set_text(f"{_STATUS_BULLET} {ok_text}")
+                label.set_attributes(_bullet_attrs(_STATUS_OK_COLOR))
+            else:
+                label.set_text(f"{_STATUS_BULLET} {failed_text}")
+                label.set_attributes(_bullet_attrs(_STATUS_FAILED_COLOR))
@@ -1,6 +1,16 @@
 
 from gi.repository import Gtk, Adw
 
+from ...utils.text_attrs import text_attrs
+
+# (icon, color) per InlineNotification type
+_NOTIFICATION_STYLES = {
+    "success": ("✓", "#10B981"),
+    "error": ("✗", "#EF4444"),
+    "warning": ("⚠", "#F59E0B"),
+    "info": ("ⓘ", "#3B82F6"),
+}
+
 class Toast:
 
     def __init__(self, title, timeout=3):
@@ -11,32 +21,33 @@ class Toast:
         overlay.add_toast(self._toast)
     
     @staticmethod
-    def success(overlay, message, timeout=3):
+    def _show_message(overlay, title, timeout):
 
-        toast = Adw.Toast(title=f"✓ {message}")
+        # a fresh toast per message: the overlay queues them, so nothing
+        # unread is overwritten and each window's overlay owns its own
+        toast = Adw.Toast(title=title)
         toast.set_timeout(timeout)
         overlay.add_toast(toast)
     
-    @staticmethod
-    def error(overlay, message, timeout=5):
+    @classmethod
+    def success(cls, overlay, message, timeout=3):
 
-        toast = Adw.Toast(title=f"✗ {message}")
-        toast.set_timeout(timeout)
-        overlay.add_toast(toast)
+        cls._show_message(overlay, f"✓ {message}", timeout)
     
-    @staticmethod
-    def info(overlay, message, timeout=3):
+    @classmethod
+    def error(cls, overlay, message, timeout=5):
 
-        toast = Adw.Toast(title=f"ⓘ {message}")
-        toast.set_timeout(timeout)
-        overlay.add_toast(toast)
+        cls._show_message(overlay, f"✗ {message}", timeout)
     
-    @staticmethod
-    def warning(overlay, message, timeout=4):
+    @classmethod
+    def info(cls, overlay, message, timeout=3):
 
-        toast = Adw.Toast(title=f"⚠ {message}")
-        toast.set_timeout(timeout)
-        overlay.add_toast(toast)
+        cls._show_message(overlay, f"ⓘ {message}", timeout)
+    
+    @classmethod
+    def warning(cls, overlay, message, timeout=4):
+
+        cls._show_message(overlay, f"⚠ {message}", timeout)
     
     @staticmethod
     def with_action(overlay, message, action_label, callback, timeout=5):
@@ -50,45 +61,55 @@ class Toast:
 class InlineNotification(Gtk.Box):
 
     def __init__(self, message, notification_type="info", dismissible=True):
-        super().__init__(spacing=12)
-        self.add_css_class("inline-notification")
-        self.add_css_class(f"notification-{notification_type}")
-        self.set_margin_top(8)
-        self.set_margin_bottom(8)
-        self.set_margin_start(8)
-        self.set_margin_end(8)
-        
-        icons = {
-            "success": "✓",
-            "error": "✗",
-            "warning": "⚠",
-            "info": "ⓘ"
-        }
-        
-        colors = {
-            "success": "#10B981",
-            "error": "#EF4444",
-            "warning": "#F59E0B",
-            "info": "#3B82F6"
-        }
+        super().__init__()
+
+        # the content sits in a revealer so dismissing slides it closed
+        # first; the notification leaves its parent once that finishes
+        self._revealer = Gtk.Revealer()
+        self._revealer.set_transition_type(Gtk.RevealerTransitionType.SLIDE_UP)
+        self._revealer.set_reveal_child(True)
+        self._revealer.set_hexpand(True)
+        self.append(self._revealer)
+
+        content = Gtk.Box(spacing=12)
+        content.add_css_class("inline-notification")
+        content.add_css_class(f"notification-{notification_type}")
+        content.set_margin_top(8)
+        content.set_margin_bottom(8)
+        content.set_margin_start(8)
+        content.set_margin_end(8)
+        self._revealer.set_child(content)
         
-        icon = icons.get(notification_type, "ⓘ")
-        color = colors.get(notification_type, "#3B82F6")
+        icon, color = _NOTIFICATION_STYLES.get(notification_type, _NOTIFICATION_STYLES["info"])
         
-        icon_label = Gtk.Label()
-        icon_label.set_markup(f'<span size="13000" weight="700" color="{color}">{icon}</span>')
-        self.append(icon_label)
+        icon_label = Gtk.Label(label=icon)
+        icon_label.set_attributes(text_attrs(size=13000, weight=700, color=color))
+        content.append(icon_label)
         
         message_label = Gtk.Label(label=message)
         message_label.set_halign(Gtk.Align.START)
         message_label.set_wrap(True)
         message_label.set_hexpand(True)
-        self.append(message_label)
+        content.append(message_label)
         
         if dismissible:
             dismiss_btn = Gtk.Button()
             dismiss_btn.set_icon_name("window-close-symbolic")
             dismiss_btn.add_css_class("flat")
             dismiss_btn.set_tooltip_text("Dismiss")
-            dismiss_btn.connect("clicked", lambda b: self.get_parent().remove(self))
-            self.append(dismiss_btn)
+            dismiss_btn.connect("clicked", self._on_dismiss_clicked)
+            content.append(dismiss_btn)
+
+    def _on_dismiss_clicked(self, button):
+
+        button.set_sensitive(False)
+        self._revealer.connect("notify::child-revealed", self._on_child_revealed)
+        self._revealer.set_reveal_child(False)
+
+    def _on_child_revealed(self, revealer, _pspec):
+
+        if revealer.get_child_revealed():
+            return
+        parent = self.get_parent()
+        if parent is not None:
+            parent.remove(self)
@@ -1,6 +1,180 @@
 
-from gi.repository import Gtk
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+import numpy as np
+from gi.repository import Gio, GLib, GObject, Gtk
 from ..components import MetricCard, StandardsGrid
+from ..components.info_popover import connect_info_popover
+from ...utils.text_attrs import text_attrs
+from ...utils.visibility import is_shown_page
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional: the standards column falls back to the stdlib json
+    # module.
+    orjson = None
+
+_RECENT_ACTIVITY_LIMIT = 3
+_STANDARDS_SCAN_LIMIT = 100
+_STANDARDS_CACHE_SIZE = 500
+# columns the activity list and standards breakdown read from each scan
+_SNAPSHOT_COLUMNS = (
+    "scan_id", "url", "status", "score", "standards", "start_time", "pages_scanned",
+)
+
+# (name, icon, description) of the standards shown in the coverage card
+_STANDARDS = (
+    ("ISO 27001", "▲", "Info Security"),
+    ("GDPR", "■", "Data Protection"),
+    ("HIPAA", "◆", "Healthcare Data"),
+    ("PCI-DSS", "●", "Payment Security"),
+)
+_STANDARD_INDEX = {name: row for row, (name, _icon, _desc) in enumerate(_STANDARDS)}
+
+_COMPLIANCE_INFO_TEXT = (
+    "Overall compliance percentage is based on the average risk score "
+    "of all completed scans (0–100)."
+)
+
+_STANDARDS_INFO_TEXT = (
+    "These percentages show average security scores from scans tagged "
+    "with each standard. They are NOT compliance certifications.\n\n"
+    "For real compliance, consult with certified auditors."
+)
+
+_ISSUES_INFO_TEXT = (
+    "Critical = total critical findings. Warnings = sum of high, "
+    "medium and low findings across all scans."
+)
+
+# (icon, icon color, badge, badge color) per scan status in recent activity;
+# None covers running and any other unfinished status
+_ACTIVITY_STATUS = {
+    "completed": ("●", "#10B981", "SUCCESS", "#10B981"),
+    "failed": ("●", "#EF4444", "FAILED", "#EF4444"),
+    None: ("●", "#F59E0B", "IN PROGRESS", "#F59E0B"),
+}
+
+# one recent-activity row; the static layout and styling are built by
+# Gtk.Builder in C, and only the bound labels are touched from Python
+_ACTIVITY_ROW_UI = """
+<interface>
+  <object class="GtkBox" id="item">
+    <property name="spacing">14</property>
+    <property name="margin-top">4</property>
+    <property name="margin-bottom">4</property>
+    <child>
+      <object class="GtkLabel" id="icon_label"/>
+    </child>
+    <child>
+      <object class="GtkBox">
+        <property name="orientation">vertical</property>
+        <property name="spacing">4</property>
+        <property name="hexpand">true</property>
+        <child>
+          <object class="GtkBox">
+            <property name="spacing">8</property>
+            <child>
+              <object class="GtkLabel" id="title_label">
+                <property name="halign">start</property>
+                <attributes>
+                  <attribute name="size" value="11000"/>
+                  <attribute name="weight" value="semibold"/>
+                </attributes>
+              </object>
+            </child>
+            <child>
+              <object class="GtkLabel" id="badge_label">
+                <style>
+                  <class name="status-badge"/>
+                </style>
+              </object>
+            </child>
+          </object>
+        </child>
+        <child>
+          <object class="GtkLabel" id="desc_label">
+            <property name="halign">start</property>
+            <property name="ellipsize">end</property>
+            <property name="max-width-chars">50</property>
+            <attributes>
+              <attribute name="size" value="10000"/>
+              <attribute name="foreground" value="#64748B"/>
+            </attributes>
+          </object>
+        </child>
+      </object>
+    </child>
+    <child>
+      <object class="GtkLabel" id="time_label">
+        <attributes>
+          <attribute name="size" value="10000"/>
+          <attribute name="foreground" value="#64748B"/>
+        </attributes>
+      </object>
+    </child>
+  </object>
+</interface>
+"""
+
+@lru_cache(maxsize=512)
+def _relative_time(start_time, now_minute):
+
+    # keyed on the current minute so repeated refreshes within a minute are
+    # cache hits; "now" is the start of that minute
+    try:
+        dt = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+    except Exception as e:
+        print(f"Time parse error: {e}, start_time={start_time}")
+        return "Recent"
+
+    seconds = now_minute * 60 - dt.timestamp()
+
+    if seconds < 60:
+        return "Just now"
+    elif seconds < 3600:
+        return f"{int(seconds / 60)} min ago"
+    elif seconds < 86400:
+        return f"{int(seconds / 3600)}h ago"
+    else:
+        return f"{int(seconds / 86400)}d ago"
+
+class ActivityItem(GObject.Object):
+
+    icon = GObject.Property(type=str, default="")
+    icon_color = GObject.Property(type=str, default="")
+    title = GObject.Property(type=str, default="")
+    desc = GObject.Property(type=str, default="")
+    time = GObject.Property(type=str, default="")
+    badge = GObject.Property(type=str, default="")
+    badge_color = GObject.Property(type=str, default="")
+
+@dataclass(frozen=True)
+class _DashboardSnapshot:
+    """Everything a refresh writes to the widgets, computed off the main thread."""
+
+    total_scans: int
+    completed_scans: int
+    failed_scans: int
+    average_score: float
+    total_critical: int
+    total_high: int
+    total_medium: int
+    total_low: int
+    has_demo_data: bool
+    # None means the section failed to compute and is left as it was
+    recent_activity: Optional[Tuple[Tuple[str, ...], ...]]
+    standards: Optional[List[Tuple[str, str, str, int, str]]]
 
 class DashboardView(Gtk.Box):
 
@@ -9,7 +183,16 @@ class DashboardView(Gtk.Box):
         self.db = db
         self.window = window
         self.last_update = None
+        self._standards_cache = OrderedDict()
+        self._refresh_source_id = None
+        self._has_demo_data = False
+        self._refresh_in_flight = False
+        self._refresh_queued = False
+        # set while scans changed and this view was hidden; the next map
+        # refreshes. Starts set so the first time the view is shown loads it.
+        self._pending_refresh = True
         self._build_ui()
+        self.connect("map", self._on_map)
     
     def _build_ui(self):
 
@@ -26,7 +209,8 @@ class DashboardView(Gtk.Box):
         
         title_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
         title = Gtk.Label()
-        title.set_markup('<span size="26000" weight="800" letter_spacing="-200">Compliance Overview</span>')
+        title.set_text("Compliance Overview")
+        title.set_attributes(text_attrs(size=26000, weight=800, letter_spacing=-200))
         title.set_halign(Gtk.Align.START)
         title_box.append(title)
         
@@ -36,7 +220,8 @@ class DashboardView(Gtk.Box):
         title_box.append(subtitle)
         
         self.demo_indicator = Gtk.Label()
-        self.demo_indicator.set_markup('<span size="9000" weight="600" color="#64748B">⚠ Demo Data Active</span>')
+        self.demo_indicator.set_text("⚠ Demo Data Active")
+        self.demo_indicator.set_attributes(text_attrs(size=9000, weight=600, color="#64748B"))
         self.demo_indicator.set_halign(Gtk.Align.START)
         self.demo_indicator.set_visible(False)
         title_box.append(self.demo_indicator)
@@ -50,7 +235,7 @@ class DashboardView(Gtk.Box):
         refresh_btn = Gtk.Button(label="Refresh Data")
         refresh_btn.set_icon_name("view-refresh-symbolic")
         refresh_btn.add_css_class("btn-secondary")
-        refresh_btn.connect("clicked", lambda b: self.refresh_data())
+        refresh_btn.connect("clicked", self._on_refresh_clicked)
         header_box.append(refresh_btn)
         
         main_box.append(header_box)
@@ -115,7 +300,8 @@ class DashboardView(Gtk.Box):
         header_box.set_halign(Gtk.Align.START)
 
         title = Gtk.Label()
-        title.set_markup('<span size="14000" weight="700">Overall Compliance</span>')
+        title.set_text("Overall Compliance")
+        title.set_attributes(text_attrs(size=14000, weight=700))
         title.set_halign(Gtk.Align.START)
         header_box.append(title)
 
@@ -125,34 +311,11 @@ class DashboardView(Gtk.Box):
         info_button.set_valign(Gtk.Align.CENTER)
 
         info_label = Gtk.Label()
-        info_label.set_markup('<span size="9000" color="#64748B">ⓘ</span>')
+        info_label.set_text("ⓘ")
+        info_label.set_attributes(text_attrs(size=9000, color="#64748B"))
         info_button.set_child(info_label)
 
-        popover = Gtk.Popover()
-        popover.set_has_arrow(True)
-        popover.set_parent(info_button)
-        popover.set_autohide(True)
-
-        pop_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-        pop_box.set_margin_top(8)
-        pop_box.set_margin_bottom(8)
-        pop_box.set_margin_start(10)
-        pop_box.set_margin_end(10)
-
-        pop_text = Gtk.Label(label=(
-            "Overall compliance percentage is based on the average risk score "
-            "of all completed scans (0–100)."
-        ))
-        pop_text.set_wrap(True)
-        pop_text.set_xalign(0.0)
-        pop_box.append(pop_text)
-
-        popover.set_child(pop_box)
-
-        def _on_compliance_info_clicked(_button, this_popover=popover):
-            this_popover.popup()
-
-        info_button.connect("clicked", _on_compliance_info_clicked)
+        connect_info_popover(info_button, _COMPLIANCE_INFO_TEXT)
         header_box.append(info_button)
 
         card.append(header_box)
@@ -164,12 +327,14 @@ class DashboardView(Gtk.Box):
         content_box.set_margin_bottom(12)
         
         self.compliance_metric_label = Gtk.Label()
-        self.compliance_metric_label.set_markup('<span size="48000" weight="800" color="#3B82F6" letter_spacing="-800">76%</span>')
+        self.compliance_metric_label.set_text("76%")
+        self.compliance_metric_label.set_attributes(text_attrs(size=48000, weight=800, color="#3B82F6", letter_spacing=-800))
         self.compliance_metric_label.set_halign(Gtk.Align.START)
         content_box.append(self.compliance_metric_label)
         
         self.compliance_status_label = Gtk.Label()
-        self.compliance_status_label.set_markup('<span size="11000" weight="500" color="#64748B">Compliant (76/100)</span>')
+        self.compliance_status_label.set_text("Compliant (76/100)")
+        self.compliance_status_label.set_attributes(text_attrs(size=11000, weight=500, color="#64748B"))
         self.compliance_status_label.set_halign(Gtk.Align.START)
         self.compliance_status_label.set_margin_bottom(8)
         content_box.append(self.compliance_status_label)
@@ -182,7 +347,8 @@ class DashboardView(Gtk.Box):
         content_box.append(self.compliance_progressbar)
         
         self.compliance_updated_label = Gtk.Label()
-        self.compliance_updated_label.set_markup('<span size="9000" color="#475569">Updated just now</span>')
+        self.compliance_updated_label.set_text("Updated just now")
+        self.compliance_updated_label.set_attributes(text_attrs(size=9000, color="#475569"))
         self.compliance_updated_label.set_halign(Gtk.Align.START)
         self.compliance_updated_label.set_margin_top(8)
         content_box.append(self.compliance_updated_label)
@@ -204,7 +370,8 @@ class DashboardView(Gtk.Box):
         header_box.set_halign(Gtk.Align.START)
 
         title = Gtk.Label()
-        title.set_markup('<span size="14000" weight="700">Security Scores by Standard</span>')
+        title.set_text("Security Scores by Standard")
+        title.set_attributes(text_attrs(size=14000, weight=700))
         title.set_halign(Gtk.Align.START)
         header_box.append(title)
 
@@ -214,35 +381,11 @@ class DashboardView(Gtk.Box):
         info_button.set_valign(Gtk.Align.CENTER)
 
         info_label = Gtk.Label()
-        info_label.set_markup('<span size="9000" color="#64748B">ⓘ</span>')
+        info_label.set_text("ⓘ")
+        info_label.set_attributes(text_attrs(size=9000, color="#64748B"))
         info_button.set_child(info_label)
 
-        popover = Gtk.Popover()
-        popover.set_has_arrow(True)
-        popover.set_parent(info_button)
-        popover.set_autohide(True)
-
-        pop_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-        pop_box.set_margin_top(8)
-        pop_box.set_margin_bottom(8)
-        pop_box.set_margin_start(10)
-        pop_box.set_margin_end(10)
-
-        pop_text = Gtk.Label(label=(
-            "These percentages show average security scores from scans tagged "
-            "with each standard. They are NOT compliance certifications.\n\n"
-            "For real compliance, consult with certified auditors."
-        ))
-        pop_text.set_wrap(True)
-        pop_text.set_xalign(0.0)
-        pop_box.append(pop_text)
-
-        popover.set_child(pop_box)
-
-        def _on_standards_info_clicked(_button, this_popover=popover):
-            this_popover.popup()
-
-        info_button.connect("clicked", _on_standards_info_clicked)
+        connect_info_popover(info_button, _STANDARDS_INFO_TEXT)
         header_box.append(info_button)
 
         card.append(header_box)
@@ -266,7 +409,8 @@ class DashboardView(Gtk.Box):
         header_box.set_halign(Gtk.Align.START)
 
         title = Gtk.Label()
-        title.set_markup('<span size="14000" weight="700">Issues Summary</span>')
+        title.set_text("Issues Summary")
+        title.set_attributes(text_attrs(size=14000, weight=700))
         title.set_halign(Gtk.Align.START)
         header_box.append(title)
 
@@ -276,34 +420,11 @@ class DashboardView(Gtk.Box):
         info_button.set_valign(Gtk.Align.CENTER)
 
         info_label = Gtk.Label()
-        info_label.set_markup('<span size="9000" color="#64748B">ⓘ</span>')
+        info_label.set_text("ⓘ")
+        info_label.set_attributes(text_attrs(size=9000, color="#64748B"))
         info_button.set_child(info_label)
 
-        popover = Gtk.Popover()
-        popover.set_has_arrow(True)
-        popover.set_parent(info_button)
-        popover.set_autohide(True)
-
-        pop_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-        pop_box.set_margin_top(8)
-        pop_box.set_margin_bottom(8)
-        pop_box.set_margin_start(10)
-        pop_box.set_margin_end(10)
-
-        pop_text = Gtk.Label(label=(
-            "Critical = total critical findings. Warnings = sum of high, "
-            "medium and low findings across all scans."
-        ))
-        pop_text.set_wrap(True)
-        pop_text.set_xalign(0.0)
-        pop_box.append(pop_text)
-
-        popover.set_child(pop_box)
-
-        def _on_issues_info_clicked(_button, this_popover=popover):
-            this_popover.popup()
-
-        info_button.connect("clicked", _on_issues_info_clicked)
+        connect_info_popover(info_button, _ISSUES_INFO_TEXT)
         header_box.append(info_button)
 
         card.append(header_box)
@@ -317,15 +438,18 @@ class DashboardView(Gtk.Box):
         critical_box.set_halign(Gtk.Align.CENTER)
 
         self.critical_count_label = Gtk.Label()
-        self.critical_count_label.set_markup('<span size="56000" weight="800" color="#DC2626" letter_spacing="-1000">0</span>')
+        self.critical_count_label.set_text("0")
+        self.critical_count_label.set_attributes(text_attrs(size=56000, weight=800, color="#DC2626", letter_spacing=-1000))
         critical_box.append(self.critical_count_label)
 
         critical_label = Gtk.Label()
-        critical_label.set_markup('<span size="10000" weight="600" color="#64748B" letter_spacing="200">CRITICAL</span>')
+        critical_label.set_text("CRITICAL")
+        critical_label.set_attributes(text_attrs(size=10000, weight=600, color="#64748B", letter_spacing=200))
         critical_box.append(critical_label)
 
         critical_sub = Gtk.Label()
-        critical_sub.set_markup('<span size="9000" color="#94A3B8">High impact issues</span>')
+        critical_sub.set_text("High impact issues")
+        critical_sub.set_attributes(text_attrs(size=9000, color="#94A3B8"))
         critical_box.append(critical_sub)
 
         container_box.append(critical_box)
@@ -337,15 +461,18 @@ class DashboardView(Gtk.Box):
         other_box.set_halign(Gtk.Align.CENTER)
 
         self.warnings_count_label = Gtk.Label()
-        self.warnings_count_label.set_markup('<span size="56000" weight="800" color="#D97706" letter_spacing="-1000">0</span>')
+        self.warnings_count_label.set_text("0")
+        self.warnings_count_label.set_attributes(text_attrs(size=56000, weight=800, color="#D97706", letter_spacing=-1000))
         other_box.append(self.warnings_count_label)
 
         other_label = Gtk.Label()
-        other_label.set_markup('<span size="10000" weight="600" color="#64748B" letter_spacing="200">WARNINGS</span>')
+        other_label.set_text("WARNINGS")
+        other_label.set_attributes(text_attrs(size=10000, weight=600, color="#64748B", letter_spacing=200))
         other_box.append(other_label)
 
         other_sub = Gtk.Label()
-        other_sub.set_markup('<span size="9000" color="#94A3B8">Medium &amp; low impact</span>')
+        other_sub.set_text("Medium & low impact")
+        other_sub.set_attributes(text_attrs(size=9000, color="#94A3B8"))
         other_box.append(other_sub)
 
         container_box.append(other_box)
@@ -358,7 +485,8 @@ class DashboardView(Gtk.Box):
         ratio_box.set_halign(Gtk.Align.FILL)
 
         ratio_label = Gtk.Label()
-        ratio_label.set_markup('<span size="9000" color="#64748B">Critical share</span>')
+        ratio_label.set_text("Critical share")
+        ratio_label.set_attributes(text_attrs(size=9000, color="#64748B"))
         ratio_label.set_halign(Gtk.Align.START)
         ratio_box.append(ratio_label)
 
@@ -382,7 +510,8 @@ class DashboardView(Gtk.Box):
 
         header_box = Gtk.Box(spacing=12)
         title = Gtk.Label()
-        title.set_markup('<span size="14000" weight="700">Recent Activity</span>')
+        title.set_text("Recent Activity")
+        title.set_attributes(text_attrs(size=14000, weight=700))
         title.set_halign(Gtk.Align.START)
         header_box.append(title)
 
@@ -398,154 +527,270 @@ class DashboardView(Gtk.Box):
 
         card.append(header_box)
 
-        self.activity_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-        card.append(self.activity_box)
+        self.activity_empty_label = Gtk.Label()
+        self.activity_empty_label.set_text("No recent activity")
+        self.activity_empty_label.set_attributes(text_attrs(size=11000, color="#64748B"))
+        self.activity_empty_label.set_visible(False)
+        card.append(self.activity_empty_label)
+
+        # the list view recycles its row widgets; a refresh only swaps the
+        # items in the store and rebinds the labels
+        self.activity_store = Gio.ListStore.new(ActivityItem)
+        self._activity_rows = {}
+
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self._on_activity_setup)
+        factory.connect("bind", self._on_activity_bind)
+        factory.connect("teardown", self._on_activity_teardown)
+
+        self.activity_list = Gtk.ListView.new(Gtk.NoSelection.new(self.activity_store), factory)
+        self.activity_list.add_css_class("activity-list")
+        card.append(self.activity_list)
 
         return card
     
     
+    def _on_refresh_clicked(self, _button):
+
+        # an explicit Refresh always re-reads the database
+        self.db.invalidate_cache()
+
+        # rapid clicks collapse into one refresh on the next idle cycle
+        if self._refresh_source_id is None:
+            self._refresh_source_id = GLib.idle_add(self._on_refresh_idle)
+
+    def _on_refresh_idle(self):
+
+        self._refresh_source_id = None
+        self.refresh_data()
+        return GLib.SOURCE_REMOVE
+
+    def on_scans_changed(self, _bus):
+
+        if is_shown_page(self):
+            self.refresh_data()
+        else:
+            self._pending_refresh = True
+
+    def _on_map(self, _widget):
+
+        self.refresh_if_pending()
+
+    def refresh_if_pending(self):
+
+        if self._pending_refresh and is_shown_page(self):
+            self.refresh_data()
+
     def refresh_data(self):
 
-        try:
-            from datetime import datetime, timezone
-            
-            self.last_update = datetime.now(timezone.utc)
-            
-            stats = self.db.get_statistics()
-
-            total_scans = stats.get("total_scans", 0)
-            total_critical = stats.get("total_critical_findings", 0)
-            total_high = stats.get("total_high_findings", 0)
-            total_medium = stats.get("total_medium_findings", 0)
-            total_low = stats.get("total_low_findings", 0)
-            avg_score = stats.get("average_score", 0.0)
-            completed = stats.get("completed_scans", 0)
-            failed = stats.get("failed_scans", 0)
-
-            self.total_scans_card.update(
-                str(total_scans),
-                f"{completed} completed • {failed} failed"
-            )
+        self._pending_refresh = False
 
-            total_vulns = total_critical + total_high
-            vuln_status = "Requires attention" if total_vulns > 0 else "No issues found"
-            self.vulnerabilities_card.update(
-                str(total_vulns),
-                vuln_status
-            )
+        # the database reads and aggregation run on a worker thread; only the
+        # finished snapshot is handed back to the main loop. A refresh asked
+        # for while one is running is queued and run once it lands.
+        if self._refresh_in_flight:
+            self._refresh_queued = True
+            return
 
-            threat_status = "System at risk" if total_critical > 0 else "System secure"
-            self.active_threats_card.update(
-                str(total_critical),
-                threat_status
-            )
+        self._refresh_in_flight = True
+        thread = threading.Thread(target=self._refresh_worker)
+        thread.daemon = True
+        thread.start()
 
-            risk_level = "High Risk" if avg_score < 50 else "Medium Risk" if avg_score < 75 else "Low Risk"
-            
-            score_color = "#60A5FA"
-            
-            self.risk_score_card.update(
-                f"{avg_score:.1f}",
-                risk_level,
-                color=score_color
-            )
+    def _refresh_worker(self):
 
-            compliance_percentage = int(avg_score) if total_scans > 0 else 0
-            
-            if compliance_percentage >= 75:
-                status_text = "Compliant"
-            elif compliance_percentage >= 50:
-                status_text = "Partial"
-            else:
-                status_text = "Critical"
-            
-            self.compliance_metric_label.set_markup(
-                f'<span size="48000" weight="800" color="#3B82F6" letter_spacing="-800">{compliance_percentage}%</span>'
-            )
-            self.compliance_status_label.set_markup(
-                f'<span size="11000" weight="500" color="#64748B">{status_text} ({compliance_percentage}/100)</span>'
-            )
-            self.compliance_progressbar.set_fraction(compliance_percentage / 100.0)
-            
-            self.compliance_updated_label.set_markup(
-                '<span size="9000" color="#475569">Updated just now</span>'
-            )
+        try:
+            snapshot = self._compute_snapshot()
+        except Exception as e:
+            print(f"Error refreshing dashboard: {e}")
+            import traceback
+            traceback.print_exc()
+            snapshot = None
+        GLib.idle_add(self._on_snapshot_ready, snapshot)
 
-            self.critical_count_label.set_markup(
-                f'<span size="56000" weight="800" color="#DC2626" letter_spacing="-1000">{total_critical}</span>'
-            )
+    def _on_snapshot_ready(self, snapshot):
 
-            warnings_count = total_high + total_medium + total_low
-            self.warnings_count_label.set_markup(
-                f'<span size="56000" weight="800" color="#D97706" letter_spacing="-1000">{warnings_count}</span>'
-            )
+        self._refresh_in_flight = False
+        if snapshot is not None:
+            self._apply_snapshot(snapshot)
+
+        if self._refresh_queued:
+            self._refresh_queued = False
+            self.refresh_data()
+        return GLib.SOURCE_REMOVE
 
-            total_issues = total_critical + warnings_count
-            if total_issues > 0:
-                critical_share = total_critical / total_issues
-                self.issues_severity_bar.set_fraction(critical_share)
-                self.issues_severity_bar.set_text(f"{int(critical_share * 100)}% critical")
-            else:
-                self.issues_severity_bar.set_fraction(0.0)
-                self.issues_severity_bar.set_text("No issues")
+    def _compute_snapshot(self):
 
-            self._update_recent_activity()
+        # one round-trip for the counters, the activity list and the
+        # standards breakdown
+        stats, scans = self.db.get_dashboard_snapshot(
+            limit=_STANDARDS_SCAN_LIMIT, columns=_SNAPSHOT_COLUMNS
+        )
 
-            self._update_standards_coverage()
+        return _DashboardSnapshot(
+            total_scans=stats.get("total_scans", 0),
+            completed_scans=stats.get("completed_scans", 0),
+            failed_scans=stats.get("failed_scans", 0),
+            average_score=stats.get("average_score", 0.0),
+            total_critical=stats.get("total_critical_findings", 0),
+            total_high=stats.get("total_high_findings", 0),
+            total_medium=stats.get("total_medium_findings", 0),
+            total_low=stats.get("total_low_findings", 0),
+            has_demo_data=stats.get("has_demo_data", False),
+            recent_activity=self._compute_recent_activity(scans[:_RECENT_ACTIVITY_LIMIT]),
+            standards=self._compute_standards_coverage(scans),
+        )
 
+    def _apply_snapshot(self, snapshot):
+
+        # hold back property notifications on everything refresh touches
+        # until all of it has been updated
+        widgets = (
+            self.total_scans_card,
+            self.vulnerabilities_card,
+            self.active_threats_card,
+            self.risk_score_card,
+            self.compliance_metric_label,
+            self.compliance_status_label,
+            self.compliance_progressbar,
+            self.critical_count_label,
+            self.warnings_count_label,
+            self.issues_severity_bar,
+            self.standards_grid,
+        )
+        for widget in widgets:
+            widget.freeze_notify()
+        try:
+            self._apply_snapshot_widgets(snapshot)
         except Exception as e:
             print(f"Error refreshing dashboard: {e}")
             import traceback
             traceback.print_exc()
+        finally:
+            for widget in widgets:
+                widget.thaw_notify()
+
+    def _apply_snapshot_widgets(self, snapshot):
+
+        self.last_update = datetime.now(timezone.utc)
+
+        total_scans = snapshot.total_scans
+        total_critical = snapshot.total_critical
+        total_high = snapshot.total_high
+        total_medium = snapshot.total_medium
+        total_low = snapshot.total_low
+        avg_score = snapshot.average_score
+
+        if snapshot.has_demo_data != self._has_demo_data:
+            self._has_demo_data = snapshot.has_demo_data
+            self.demo_indicator.set_visible(snapshot.has_demo_data)
+
+        self.total_scans_card.update(
+            str(total_scans),
+            f"{snapshot.completed_scans} completed • {snapshot.failed_scans} failed"
+        )
+
+        total_vulns = total_critical + total_high
+        vuln_status = "Requires attention" if total_vulns > 0 else "No issues found"
+        self.vulnerabilities_card.update(
+            str(total_vulns),
+            vuln_status
+        )
+
+        threat_status = "System at risk" if total_critical > 0 else "System secure"
+        self.active_threats_card.update(
+            str(total_critical),
+            threat_status
+        )
+
+        risk_level = "High Risk" if avg_score < 50 else "Medium Risk" if avg_score < 75 else "Low Risk"
+        
+        score_color = "#60A5FA"
+        
+        self.risk_score_card.update(
+            f"{avg_score:.1f}",
+            risk_level,
+            color=score_color
+        )
+
+        compliance_percentage = int(avg_score) if total_scans > 0 else 0
+        
+        if compliance_percentage >= 75:
+            status_text = "Compliant"
+        elif compliance_percentage >= 50:
+            status_text = "Partial"
+        else:
+            status_text = "Critical"
+        
+        # the label styles were attached at construction; only the text
+        # is rewritten, and only when the value actually changed
+        self._set_label_text(self.compliance_metric_label, f"{compliance_percentage}%")
+        self._set_label_text(
+            self.compliance_status_label,
+            f"{status_text} ({compliance_percentage}/100)"
+        )
+        self._set_fraction(self.compliance_progressbar, compliance_percentage / 100.0)
+
+        self._set_label_text(self.critical_count_label, str(total_critical))
+
+        warnings_count = total_high + total_medium + total_low
+        self._set_label_text(self.warnings_count_label, str(warnings_count))
+
+        total_issues = total_critical + warnings_count
+        if total_issues > 0:
+            critical_share = total_critical / total_issues
+            self._set_fraction(self.issues_severity_bar, critical_share)
+            self._set_bar_text(self.issues_severity_bar, f"{int(critical_share * 100)}% critical")
+        else:
+            self._set_fraction(self.issues_severity_bar, 0.0)
+            self._set_bar_text(self.issues_severity_bar, "No issues")
+
+        if snapshot.recent_activity is not None:
+            self._update_recent_activity(snapshot.recent_activity)
+
+        if snapshot.standards is not None:
+            self.standards_grid.update_standards(snapshot.standards)
+
+    # the _set_* helpers skip the GTK call when the widget already shows the
+    # value, so a refresh with unchanged data doesn't invalidate anything
+
+    def _set_label_text(self, label, text):
+
+        if label.get_text() != text:
+            label.set_text(text)
+
+    def _set_bar_text(self, bar, text):
+
+        if bar.get_text() != text:
+            bar.set_text(text)
+
+    def _set_fraction(self, bar, fraction):
+
+        if abs(bar.get_fraction() - fraction) > 1e-4:
+            bar.set_fraction(fraction)
+
+    def _set_visible(self, widget, visible):
+
+        if widget.get_visible() != visible:
+            widget.set_visible(visible)
 
     def _on_view_all_clicked(self, button):
 
         if self.window and hasattr(self.window, '_on_page_changed'):
             self.window._on_page_changed('history')
     
-    def _update_recent_activity(self):
+    def _compute_recent_activity(self, recent_scans):
 
+        # runs on the refresh worker: returns plain tuples, the ActivityItem
+        # objects are created on the main thread
         try:
-            max_iterations = 1000
-            iterations = 0
-            while iterations < max_iterations:
-                child = self.activity_box.get_first_child()
-                if child is None:
-                    break
-                self.activity_box.remove(child)
-                iterations += 1
-
-            recent_scans = self.db.get_scans(limit=3)
-
-            if not recent_scans:
-                empty_label = Gtk.Label()
-                empty_label.set_markup('<span size="11000" color="#64748B">No recent activity</span>')
-                self.activity_box.append(empty_label)
-                return
-            
-            has_demo_data = any(scan.get('scan_id', '').startswith('demo-') for scan in recent_scans)
-            if has_demo_data and hasattr(self, 'demo_indicator'):
-                self.demo_indicator.set_visible(True)
-            elif hasattr(self, 'demo_indicator'):
-                self.demo_indicator.set_visible(False)
-
+            now_minute = int(time.time() // 60)
+            rows = []
             for scan in recent_scans:
                 status = scan.get("status", "unknown")
-                if status == "completed":
-                    icon = "●"
-                    icon_color = "#10B981"
-                    status_badge = "SUCCESS"
-                    badge_color = "#10B981"
-                elif status == "failed":
-                    icon = "●"
-                    icon_color = "#EF4444"
-                    status_badge = "FAILED"
-                    badge_color = "#EF4444"
-                else:
-                    icon = "●"
-                    icon_color = "#F59E0B"
-                    status_badge = "IN PROGRESS"
-                    badge_color = "#F59E0B"
+                icon, icon_color, status_badge, badge_color = _ACTIVITY_STATUS.get(
+                    status, _ACTIVITY_STATUS[None]
+                )
 
                 title = f"Scan {status}"
                 url = scan.get("url", "Unknown")
@@ -554,131 +799,139 @@ class DashboardView(Gtk.Box):
 
                 start_time = scan.get("start_time", "")
                 if start_time:
-                    try:
-                        from datetime import datetime, timezone
-                        dt = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
-                        if dt.tzinfo is None:
-                            dt = dt.replace(tzinfo=timezone.utc)
-                        now = datetime.now(timezone.utc)
-                        diff = now - dt
-                        
-                        if diff.total_seconds() < 60:
-                            time_str = "Just now"
-                        elif diff.total_seconds() < 3600:
-                            mins = int(diff.total_seconds() / 60)
-                            time_str = f"{mins} min ago"
-                        elif diff.total_seconds() < 86400:
-                            hours = int(diff.total_seconds() / 3600)
-                            time_str = f"{hours}h ago"
-                        else:
-                            days = int(diff.total_seconds() / 86400)
-                            time_str = f"{days}d ago"
-                    except Exception as e:
-                        print(f"Time parse error: {e}, start_time={start_time}")
-                        time_str = "Recent"
+                    time_str = _relative_time(start_time, now_minute)
                 else:
                     time_str = "Recent"
 
-                item = self._create_activity_item(icon, icon_color, title, desc, time_str, status_badge, badge_color)
-                self.activity_box.append(item)
+                rows.append((icon, icon_color, title, desc, time_str, status_badge, badge_color))
+            return tuple(rows)
 
         except Exception as e:
             print(f"Error updating recent activity: {e}")
             import traceback
             traceback.print_exc()
+            return None
 
-    def _create_activity_item(self, icon, icon_color, title, desc, time, status_badge, badge_color):
+    def _update_recent_activity(self, activity):
 
-        item = Gtk.Box(spacing=14)
-        item.set_margin_top(4)
-        item.set_margin_bottom(4)
+        self._set_visible(self.activity_empty_label, not activity)
+        self._set_visible(self.activity_list, bool(activity))
 
-        icon_label = Gtk.Label(label=icon)
-        icon_label.set_markup(f'<span size="14000" weight="700" color="{icon_color}">{icon}</span>')
-        item.append(icon_label)
+        if not activity:
+            self.activity_store.remove_all()
+            return
 
-        info_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
-        
-        title_box = Gtk.Box(spacing=8)
-        title_label = Gtk.Label(label=title)
-        title_label.set_halign(Gtk.Align.START)
-        title_label.set_markup(f'<span size="11000" weight="600">{title}</span>')
-        title_box.append(title_label)
-        
-        badge = Gtk.Label()
-        badge.set_markup(f'<span size="8500" weight="700" color="{badge_color}">{status_badge}</span>')
-        badge.add_css_class("status-badge")
-        title_box.append(badge)
-        
-        info_box.append(title_box)
+        items = [
+            ActivityItem(
+                icon=icon, icon_color=icon_color, title=title, desc=desc,
+                time=time_str, badge=badge, badge_color=badge_color,
+            )
+            for icon, icon_color, title, desc, time_str, badge, badge_color in activity
+        ]
+        self.activity_store.splice(0, self.activity_store.get_n_items(), items)
 
-        desc_label = Gtk.Label(label=desc)
-        desc_label.set_halign(Gtk.Align.START)
-        desc_label.set_markup(f'<span size="10000" color="#64748B">{desc}</span>')
-        desc_label.set_ellipsize(3)
-        desc_label.set_max_width_chars(50)
-        info_box.append(desc_label)
-        item.append(info_box)
+    def _create_activity_item(self):
 
-        spacer = Gtk.Box()
-        spacer.set_hexpand(True)
-        item.append(spacer)
+        builder = Gtk.Builder.new_from_string(_ACTIVITY_ROW_UI, -1)
+        return {
+            "item": builder.get_object("item"),
+            "icon": builder.get_object("icon_label"),
+            "title": builder.get_object("title_label"),
+            "badge": builder.get_object("badge_label"),
+            "desc": builder.get_object("desc_label"),
+            "time": builder.get_object("time_label"),
+        }
+
+    def _on_activity_setup(self, _factory, list_item):
+
+        row = self._create_activity_item()
+        self._activity_rows[row["item"]] = row
+        list_item.set_child(row["item"])
 
-        time_label = Gtk.Label(label=time)
-        time_label.set_markup(f'<span size="10000" color="#64748B">{time}</span>')
-        item.append(time_label)
+    def _on_activity_bind(self, _factory, list_item):
 
-        return item
+        row = self._activity_rows[list_item.get_child()]
+        activity = list_item.get_item()
 
-    def _update_standards_coverage(self):
+        row["icon"].set_text(activity.icon)
+        row["icon"].set_attributes(text_attrs(size=14000, weight=700, color=activity.icon_color))
+        row["title"].set_text(activity.title)
+        row["badge"].set_text(activity.badge)
+        row["badge"].set_attributes(text_attrs(size=8500, weight=700, color=activity.badge_color))
+        row["desc"].set_text(activity.desc)
+        row["time"].set_text(activity.time)
+
+    def _on_activity_teardown(self, _factory, list_item):
+
+        self._activity_rows.pop(list_item.get_child(), None)
+
+    def _parse_standards(self, scan_id, raw):
+
+        # a scan's standards never change after it is created, so the decoded
+        # list is cached per scan_id (bounded LRU) across refreshes
+        if not isinstance(raw, str):
+            return raw
+
+        cached = self._standards_cache.get(scan_id)
+        if cached is not None:
+            self._standards_cache.move_to_end(scan_id)
+            return cached
 
         try:
-            scans = self.db.get_scans(limit=100)
+            standards = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except (json.JSONDecodeError, TypeError, ValueError):
+            standards = []
+
+        if scan_id is not None:
+            self._standards_cache[scan_id] = standards
+            if len(self._standards_cache) > _STANDARDS_CACHE_SIZE:
+                self._standards_cache.popitem(last=False)
+        return standards
 
+    def _compute_standards_coverage(self, scans):
+
+        try:
             if not scans:
-                return
-
-            standards_data = {
-                "ISO 27001": {"icon": "▲", "desc": "Info Security", "scores": []},
-                "GDPR": {"icon": "■", "desc": "Data Protection", "scores": []},
-                "HIPAA": {"icon": "◆", "desc": "Healthcare Data", "scores": []},
-                "PCI-DSS": {"icon": "●", "desc": "Payment Security", "scores": []}
-            }
-
-            for scan in scans:
-                if scan.get("status") == "completed" and scan.get("score"):
-                    score = scan.get("score", 0)
-                    standards = scan.get("standards", "")
-                    
-                    if isinstance(standards, str):
-                        try:
-                            import json
-                            standards = json.loads(standards)
-                        except (json.JSONDecodeError, TypeError, ValueError):
-                            standards = []
-                    
-                    if not standards:
-                        for std in standards_data.values():
-                            std["scores"].append(score)
-                    else:
-                        for std_name in standards:
-                            if std_name in standards_data:
-                                standards_data[std_name]["scores"].append(score)
+                return None
+
+            completed = [
+                scan for scan in scans
+                if scan.get("status") == "completed" and scan.get("score")
+            ]
+            scores = np.fromiter(
+                (scan["score"] for scan in completed), dtype=np.float64, count=len(completed)
+            )
 
-            updated_standards = []
-            for name, data in standards_data.items():
-                if data["scores"]:
-                    avg_score = sum(data["scores"]) / len(data["scores"])
+            # applies[i, j] is set when completed scan j counts towards
+            # standard i; scans without standards count towards all of them
+            applies = np.zeros((len(_STANDARDS), len(completed)), dtype=bool)
+            for column, scan in enumerate(completed):
+                standards = self._parse_standards(scan.get("scan_id"), scan.get("standards", ""))
+                
+                if not standards:
+                    applies[:, column] = True
                 else:
-                    avg_score = 0
+                    for std_name in standards:
+                        row = _STANDARD_INDEX.get(std_name)
+                        if row is not None:
+                            applies[row, column] = True
+
+            counts = applies.sum(axis=1)
+            totals = applies @ scores
+            averages = np.divide(
+                totals, counts, out=np.zeros(len(_STANDARDS)), where=counts > 0
+            )
 
+            updated_standards = []
+            for (name, icon, desc), avg_score in zip(_STANDARDS, averages.tolist()):
                 status = "compliant" if avg_score >= 80 else "partial" if avg_score >= 50 else "non-compliant"
-                updated_standards.append((name, data["icon"], status, int(avg_score), data["desc"]))
+                updated_standards.append((name, icon, status, int(avg_score), desc))
 
-            self.standards_grid.update_standards(updated_standards)
+            return updated_standards
 
         except Exception as e:
             print(f"Error updating standards coverage: {e}")
             import traceback
             traceback.print_exc()
+            return None
     
@@ -1,69 +1,222 @@
 
-from gi.repository import Gtk
+import threading
+
+from gi.repository import Gio, GLib, GObject, Gtk
 from ..components import ScanItem
+from ...utils.text_attrs import text_attrs
+from ...utils.visibility import is_shown_page
+
+_HISTORY_LIMIT = 50
+
+# ScanRow fields between scan_id and the row id, in order
+_ROW_FIELDS = ('url', 'start_time', 'status', 'score', 'pages_scanned')
+
+class ScanItemData(GObject.Object):
 
-class HistoryView(Gtk.ScrolledWindow):
+    scan_id = GObject.Property(type=str, default="")
+    url = GObject.Property(type=str, default="Unknown")
+    start_time = GObject.Property(type=str, default="Unknown")
+    status = GObject.Property(type=str, default="unknown")
+    score = GObject.Property(type=float, default=0.0)
+    pages_scanned = GObject.Property(type=int, default=0)
+
+class HistoryView(Gtk.Box):
 
     def __init__(self, db):
-        super().__init__()
-        self.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
-        
+        super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=24)
+
         self.db = db
+        # scan_id -> ScanItemData currently in the store
+        self._items = {}
+        # bound list item -> (ScanItemData, notify handler id)
+        self._bindings = {}
+        self._refresh_in_flight = False
+        self._refresh_queued = False
+        # set while scans changed and this view was hidden; the next map
+        # refreshes. Starts set so the first time the view is shown loads it.
+        self._pending_refresh = True
         self._build_ui()
-    
+        self.connect("map", self._on_map)
+
     def _build_ui(self):
 
-        main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=24)
-        main_box.set_margin_top(32)
-        main_box.set_margin_bottom(32)
-        main_box.set_margin_start(32)
-        main_box.set_margin_end(32)
-        
+        self.set_margin_top(32)
+        self.set_margin_bottom(32)
+        self.set_margin_start(32)
+        self.set_margin_end(32)
+
         title_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
-        title = Gtk.Label()
-        title.set_markup('<span size="28000" weight="800">Scan History</span>')
+        title = Gtk.Label(label="Scan History")
+        title.set_attributes(text_attrs(size=28000, weight=800))
         title.set_halign(Gtk.Align.START)
         title_box.append(title)
-        
+
         subtitle = Gtk.Label(label="View and manage previous security scans")
         subtitle.set_halign(Gtk.Align.START)
         subtitle.add_css_class("dashboard-subtitle")
         title_box.append(subtitle)
-        
-        main_box.append(title_box)
-        
-        self.history_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=16)
-        self.history_box.set_margin_top(8)
-        main_box.append(self.history_box)
-        
-        self.set_child(main_box)
-    
+
+        self.append(title_box)
+
+        self.no_scans_label = Gtk.Label(label="No scans in history yet.")
+        self.no_scans_label.add_css_class("metric-label")
+        self.no_scans_label.set_visible(False)
+        self.append(self.no_scans_label)
+
+        # the list view only realizes ScanItems for rows in the viewport and
+        # rebinds them while scrolling
+        self.store = Gio.ListStore.new(ScanItemData)
+
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self._on_scan_setup)
+        factory.connect("bind", self._on_scan_bind)
+        factory.connect("unbind", self._on_scan_unbind)
+
+        self.list_view = Gtk.ListView.new(Gtk.NoSelection.new(self.store), factory)
+        self.list_view.add_css_class("history-list")
+
+        scrolled = Gtk.ScrolledWindow()
+        scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
+        scrolled.set_vexpand(True)
+        scrolled.set_child(self.list_view)
+        self.append(scrolled)
+
+    def _on_scan_setup(self, _factory, list_item):
+
+        list_item.set_child(ScanItem({}))
+
+    def _on_scan_bind(self, _factory, list_item):
+
+        # a refresh that changes a scan's fields only notifies its
+        # ScanItemData; the bound row follows without the store changing
+        scan = list_item.get_item()
+        handler_id = scan.connect("notify", self._on_scan_notify, list_item)
+        self._bindings[list_item] = (scan, handler_id)
+        self._reset_scan_item(list_item, scan)
+
+    def _on_scan_unbind(self, _factory, list_item):
+
+        binding = self._bindings.pop(list_item, None)
+        if binding is not None:
+            scan, handler_id = binding
+            scan.disconnect(handler_id)
+
+    def _on_scan_notify(self, scan, _pspec, list_item):
+
+        self._reset_scan_item(list_item, scan)
+
+    def _reset_scan_item(self, list_item, scan):
+
+        list_item.get_child().reset({
+            'url': scan.url,
+            'start_time': scan.start_time,
+            'status': scan.status,
+            'score': scan.score,
+            'pages_scanned': scan.pages_scanned
+        })
+
+    def on_scans_changed(self, _bus):
+
+        if is_shown_page(self):
+            self.refresh_data()
+        else:
+            self._pending_refresh = True
+
+    def _on_map(self, _widget):
+
+        self.refresh_if_pending()
+
+    def refresh_if_pending(self):
+
+        if self._pending_refresh and is_shown_page(self):
+            self.refresh_data()
+
     def refresh_data(self):
 
-        try:
-            scans = self.db.get_scans(limit=50)
-
-            while child := self.history_box.get_first_child():
-                self.history_box.remove(child)
-
-            if not scans:
-                no_scans = Gtk.Label(label="No scans in history yet.")
-                no_scans.add_css_class("metric-label")
-                self.history_box.append(no_scans)
-                return
-
-            for scan in scans:
-                scan_data = {
-                    'url': scan.get('url', 'Unknown'),
-                    'start_time': scan.get('start_time', 'Unknown'),
-                    'status': scan.get('status', 'unknown'),
-                    'score': scan.get('score', 0),
-                    'pages_scanned': scan.get('pages_scanned', 0)
-                }
-                scan_item = ScanItem(scan_data)
-                self.history_box.append(scan_item)
+        self._pending_refresh = False
+
+        # the query and row normalization run on a worker thread; the main
+        # thread only diffs the finished rows into the store. A refresh asked
+        # for while one is running is queued and run once it lands.
+        if self._refresh_in_flight:
+            self._refresh_queued = True
+            return
+
+        self._refresh_in_flight = True
+        thread = threading.Thread(target=self._refresh_worker)
+        thread.daemon = True
+        thread.start()
 
+    def _refresh_worker(self):
+
+        try:
+            rows = self._load_rows()
         except Exception as e:
             print(f"Error loading history: {e}")
             import traceback
             traceback.print_exc()
+            rows = None
+        GLib.idle_add(self._on_rows_ready, rows)
+
+    def _load_rows(self):
+
+        # ScanRow tuples come back with their display defaults filled in
+        return self.db.get_scan_rows(limit=_HISTORY_LIMIT)
+
+    def _on_rows_ready(self, rows):
+
+        self._refresh_in_flight = False
+        if rows is not None:
+            try:
+                self._apply_rows(rows)
+            except Exception as e:
+                print(f"Error loading history: {e}")
+                import traceback
+                traceback.print_exc()
+
+        if self._refresh_queued:
+            self._refresh_queued = False
+            self.refresh_data()
+        return GLib.SOURCE_REMOVE
+
+    def _apply_rows(self, rows):
+
+        self.no_scans_label.set_visible(not rows)
+
+        # existing scans keep their ScanItemData and only have changed
+        # fields written; the store is then patched in place
+        items = []
+        reused = set()
+        for scan_id, *values, _row_id in rows:
+            item = self._items.get(scan_id)
+            if item is None:
+                item = ScanItemData(scan_id=scan_id, **dict(zip(_ROW_FIELDS, values)))
+            else:
+                reused.add(scan_id)
+                item.freeze_notify()
+                for name, value in zip(_ROW_FIELDS, values):
+                    if item.get_property(name) != value:
+                        item.set_property(name, value)
+                item.thaw_notify()
+            items.append(item)
+
+        self._patch_store(items, reused)
+        self._items = {item.scan_id: item for item in items}
+
+    def _patch_store(self, items, reused):
+
+        store = self.store
+
+        for position in range(store.get_n_items() - 1, -1, -1):
+            if store.get_item(position).scan_id not in reused:
+                store.remove(position)
+
+        # scans are ordered newest first, so new ones are normally inserted
+        # at the top; anything else falls back to replacing the tail
+        for position, item in enumerate(items):
+            if position < store.get_n_items() and store.get_item(position) is item:
+                continue
+            if item.scan_id in reused:
+                store.splice(position, store.get_n_items() - position, items[position:])
+                break
+            store.insert(position, item)
@@ -1,7 +1,56 @@
 
-from gi.repository import Gtk, GLib
+from functools import lru_cache
+from gi.repository import Gio, GLib, GObject, Gtk
 import threading
 
+from ..components import FindingRow
+from ...utils.text_attrs import text_attrs
+
+# scan progress may arrive faster than it is worth drawing; at most one UI
+# update per interval is pushed to the main loop
+_PROGRESS_INTERVAL_MS = 100
+
+# findings at these severities get their own FindingRow; everything else is
+# listed in one markup label, which keeps large informational results to a
+# single widget
+_ROW_SEVERITIES = frozenset({"critical", "high"})
+_LIGHT_SEVERITY_COLORS = {
+    "medium": "#FCD34D",
+    "low": "#34D399",
+}
+_LIGHT_DEFAULT_COLOR = "#9CA3AF"
+
+# the finding list scrolls on its own past this height, so only the rows in
+# its viewport are realized
+_FINDINGS_MAX_HEIGHT = 480
+
+@lru_cache(maxsize=None)
+def _light_severity_prefix(sev):
+
+    # the coloured severity tag only depends on the severity, so it is
+    # built once per severity rather than once per finding
+    color = _LIGHT_SEVERITY_COLORS.get(sev, _LIGHT_DEFAULT_COLOR)
+    text = GLib.markup_escape_text(sev.upper() or "INFO")
+    return f'<span foreground="{color}" weight="bold">{text}</span>  '
+
+def _light_findings_markup(findings):
+
+    lines = []
+    for finding in findings:
+        sev = (finding.severity or "").lower()
+        line = _light_severity_prefix(sev) + GLib.markup_escape_text(finding.message or "")
+        meta = " • ".join(part for part in (finding.category, finding.location) if part)
+        if meta:
+            line += f'<span foreground="{_LIGHT_DEFAULT_COLOR}">  • {GLib.markup_escape_text(meta)}</span>'
+        lines.append(line)
+    return f'<span size="10500">{chr(10).join(lines)}</span>'
+
+class FindingItem(GObject.Object):
+
+    def __init__(self, finding):
+        super().__init__()
+        self.finding = finding
+
 class ScanView(Gtk.ScrolledWindow):
 
     def __init__(self, db, scanner_callback=None, window=None):
@@ -11,6 +60,9 @@ class ScanView(Gtk.ScrolledWindow):
         self.db = db
         self.scanner_callback = scanner_callback
         self.window = window
+        self._progress_lock = threading.Lock()
+        self._pending_progress = None
+        self._progress_source_id = None
         self._build_ui()
     
     def _build_ui(self):
@@ -24,8 +76,8 @@ class ScanView(Gtk.ScrolledWindow):
         main_box.set_size_request(900, -1)
         
         title_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
-        title = Gtk.Label()
-        title.set_markup('<span size="28000" weight="800">New Security Scan</span>')
+        title = Gtk.Label(label="New Security Scan")
+        title.set_attributes(text_attrs(size=28000, weight=800))
         title.set_halign(Gtk.Align.START)
         title_box.append(title)
         
@@ -121,7 +173,7 @@ class ScanView(Gtk.ScrolledWindow):
         
         progress_label = Gtk.Label(label="Scan in progress...")
         progress_label.set_halign(Gtk.Align.START)
-        progress_label.set_markup("<b>Scan in progress...</b>")
+        progress_label.set_attributes(text_attrs(weight=700))
         progress_header.append(progress_label)
         self.progress_box.append(progress_header)
         
@@ -140,8 +192,8 @@ class ScanView(Gtk.ScrolledWindow):
         self.result_box.add_css_class("card")
         self.result_box.set_visible(False)
 
-        result_header = Gtk.Label()
-        result_header.set_markup("<b>Last Scan Results</b>")
+        result_header = Gtk.Label(label="Last Scan Results")
+        result_header.set_attributes(text_attrs(weight=700))
         result_header.set_halign(Gtk.Align.START)
         self.result_box.append(result_header)
 
@@ -150,7 +202,9 @@ class ScanView(Gtk.ScrolledWindow):
         self.result_summary_label.add_css_class("metric-label")
         self.result_box.append(self.result_summary_label)
 
+        # styled once; each result only sets the text
         self.result_score_label = Gtk.Label(label="")
+        self.result_score_label.set_attributes(text_attrs(size=18000, weight=700, color="#60A5FA"))
         self.result_score_label.set_halign(Gtk.Align.START)
         self.result_box.append(self.result_score_label)
 
@@ -181,9 +235,49 @@ class ScanView(Gtk.ScrolledWindow):
         self.findings_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
         self.result_box.append(self.findings_box)
 
+        self.findings_header = Gtk.Label(label="Detected issues")
+        self.findings_header.set_attributes(text_attrs(size=12000, weight=600))
+        self.findings_header.set_halign(Gtk.Align.START)
+        self.findings_header.set_visible(False)
+        self.findings_box.append(self.findings_header)
+
+        # the list view creates FindingRows for the visible rows only and
+        # rebinds them while scrolling
+        self._findings_store = Gio.ListStore.new(FindingItem)
+
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self._on_finding_setup)
+        factory.connect("bind", self._on_finding_bind)
+
+        self.findings_view = Gtk.ListView.new(Gtk.NoSelection.new(self._findings_store), factory)
+        self.findings_view.add_css_class("findings-list")
+
+        self.findings_scroller = Gtk.ScrolledWindow()
+        self.findings_scroller.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
+        self.findings_scroller.set_propagate_natural_height(True)
+        self.findings_scroller.set_max_content_height(_FINDINGS_MAX_HEIGHT)
+        self.findings_scroller.set_child(self.findings_view)
+        self.findings_scroller.set_visible(False)
+        self.findings_box.append(self.findings_scroller)
+
+        self.light_findings_label = Gtk.Label()
+        self.light_findings_label.set_halign(Gtk.Align.START)
+        self.light_findings_label.set_xalign(0.0)
+        self.light_findings_label.set_wrap(True)
+        self.light_findings_label.set_visible(False)
+        self.findings_box.append(self.light_findings_label)
+
         main_box.append(self.result_box)
         
         self.set_child(main_box)
+
+    def _on_finding_setup(self, _factory, list_item):
+
+        list_item.set_child(FindingRow())
+
+    def _on_finding_bind(self, _factory, list_item):
+
+        list_item.get_child().update(list_item.get_item().finding)
     
     def _on_cancel_clicked(self, button):
 
@@ -221,21 +315,48 @@ class ScanView(Gtk.ScrolledWindow):
         self.progress_box.set_visible(True)
         self.start_scan_btn.set_sensitive(False)
         
+        # the callback only submits the scan; it runs in a worker process
         if self.scanner_callback:
-            thread = threading.Thread(
-                target=self.scanner_callback,
-                args=(url, standards, mode, self._on_scan_progress, self._on_scan_complete)
+            self.scanner_callback(
+                url, standards, mode, self._on_scan_progress, self._on_scan_complete
             )
-            thread.daemon = True
-            thread.start()
     
     def _on_scan_progress(self, progress, message):
 
-        GLib.idle_add(self.progress_bar.set_fraction, progress)
-        GLib.idle_add(self.progress_text.set_text, message)
+        # only the latest (progress, message) is kept; one timeout flushes it
+        with self._progress_lock:
+            self._pending_progress = (progress, message)
+            if self._progress_source_id is None:
+                self._progress_source_id = GLib.timeout_add(
+                    _PROGRESS_INTERVAL_MS, self._flush_progress
+                )
+
+    def _flush_progress(self):
+
+        with self._progress_lock:
+            pending = self._pending_progress
+            self._pending_progress = None
+            self._progress_source_id = None
+
+        if pending is not None:
+            progress, message = pending
+            self.progress_bar.set_fraction(progress)
+            self.progress_text.set_text(message)
+        return GLib.SOURCE_REMOVE
+
+    def _cancel_pending_progress(self):
+
+        with self._progress_lock:
+            self._pending_progress = None
+            if self._progress_source_id is not None:
+                GLib.source_remove(self._progress_source_id)
+                self._progress_source_id = None
     
     def _on_scan_complete(self, success, message, result_data):
 
+        # a progress flush landing after this would overwrite the final state
+        self._cancel_pending_progress()
+
         if success:
             GLib.idle_add(self.progress_text.set_text, "Scan completed!")
             GLib.idle_add(self.progress_bar.set_fraction, 1.0)
@@ -266,9 +387,7 @@ class ScanView(Gtk.ScrolledWindow):
         summary = result_data.get("summary", {}) or {}
 
         self.result_summary_label.set_text(f"{url} • {pages} pages • Standards: {standards}")
-        self.result_score_label.set_markup(
-            f'<span size="18000" weight="700" color="#60A5FA">Score: {score}/100</span>'
-        )
+        self.result_score_label.set_text(f"Score: {score}/100")
 
         critical = summary.get("critical", 0)
         high = summary.get("high", 0)
@@ -280,68 +399,25 @@ class ScanView(Gtk.ScrolledWindow):
         self.medium_label.set_text(f"Medium: {medium}")
         self.low_label.set_text(f"Low: {low}")
 
-        max_iterations = 1000
-        iterations = 0
-        while iterations < max_iterations:
-            child = self.findings_box.get_first_child()
-            if child is None:
-                break
-            self.findings_box.remove(child)
-            iterations += 1
-
         findings = result_data.get("findings", []) or []
 
-        if findings:
-            header = Gtk.Label()
-            header.set_markup('<span size="12000" weight="600">Detected issues</span>')
-            header.set_halign(Gtk.Align.START)
-            self.findings_box.append(header)
-
-            for f in findings:
-                row = Gtk.Box(spacing=10)
-                row.add_css_class("finding-row")
-
-                sev = (f.get("severity") or "").lower()
-                sev_label = Gtk.Label()
-                sev_text = sev.upper() or "INFO"
-                if sev == "critical":
-                    sev_label.add_css_class("severity-critical")
-                elif sev == "high":
-                    sev_label.add_css_class("severity-high")
-                elif sev == "medium":
-                    sev_label.add_css_class("severity-medium")
-                elif sev == "low":
-                    sev_label.add_css_class("severity-low")
-                else:
-                    sev_label.add_css_class("metric-label")
-                sev_label.set_text(sev_text)
-                row.append(sev_label)
-
-                text_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2)
-
-                msg = f.get("message") or ""
-                msg_label = Gtk.Label()
-                msg_label.set_halign(Gtk.Align.START)
-                msg_label.set_wrap(True)
-                msg_label.set_xalign(0.0)
-                msg_label.set_markup(f'<span size="10500">{Gtk.utils.escape_markup(msg)}</span>' if hasattr(Gtk, 'utils') else msg)
-                text_box.append(msg_label)
-
-                meta_parts = []
-                category = f.get("category")
-                location = f.get("location")
-                if category:
-                    meta_parts.append(category)
-                if location:
-                    meta_parts.append(location)
-                if meta_parts:
-                    meta_label = Gtk.Label(label=" • ".join(meta_parts))
-                    meta_label.set_halign(Gtk.Align.START)
-                    meta_label.add_css_class("metric-label")
-                    text_box.append(meta_label)
-
-                row.append(text_box)
-                self.findings_box.append(row)
+        self.findings_header.set_visible(bool(findings))
+
+        heavy = []
+        light = []
+        for finding in findings:
+            sev = (finding.severity or "").lower()
+            (heavy if sev in _ROW_SEVERITIES else light).append(finding)
+
+        # the whole result replaces the model in one change
+        self._findings_store.splice(
+            0, self._findings_store.get_n_items(), [FindingItem(f) for f in heavy]
+        )
+        self.findings_scroller.set_visible(bool(heavy))
+
+        if light:
+            self.light_findings_label.set_markup(_light_findings_markup(light))
+        self.light_findings_label.set_visible(bool(light))
 
         self.result_box.set_visible(True)
         return False
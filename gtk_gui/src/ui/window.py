@@ -1,25 +1,48 @@
 
 from gi.repository import Gtk, Adw, GLib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import multiprocessing
+import queue
 import time
 from datetime import datetime, timezone
 
-from backend.core.scanner import Scanner
-from backend.core.backend import analyze_scan_results
 from backend.storage.database import ScanDatabase
 from backend.utils.monitoring import get_health_checker
 
+from ..core.app_bus import AppBus
+from ..core.scan_worker import run_scan_job, shown_findings, stored_findings
 from .components import Sidebar
 from .views import DashboardView, ScanView, HistoryView
 from ..utils.styles import apply_css
 
+_REFRESH_INTERVAL_S = 30
+# without new scans the periodic refresh (and its scanner health check)
+# only runs this often, to pick up changes made outside the GUI
+_STALE_AFTER_S = 120
+# how often scan progress is pulled from the worker process
+_SCAN_POLL_INTERVAL_MS = 100
+
 class MainWindow(Adw.ApplicationWindow):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         
         db_path = Path.home() / ".shieldeye" / "scans.db"
-        self.db = ScanDatabase(db_path)
+        # page switches and the periodic refresh re-read the same queries;
+        # they are answered from memory until a scan writes to the database
+        self.db = ScanDatabase(db_path, cache_reads=True)
+        # finished scans are stored in the background, one at a time
+        self._db_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scan-db")
+        # each scan runs in its own worker process so its CPU work never
+        # holds the GIL the main loop needs; progress and the result come
+        # back over queues
+        self._scan_context = multiprocessing.get_context("spawn")
+        self._scan_progress = self._scan_context.Queue()
+        self._scan_results = self._scan_context.Queue()
+        self._scan_process = None
+        self._closing = False
+        self.connect("close-request", self._on_close_request)
         
         self.set_title("ShieldEye ComplianceScan")
         self.set_default_size(1600, 1200)
@@ -27,13 +50,18 @@ class MainWindow(Adw.ApplicationWindow):
         
         apply_css(self)
         
+        self.bus = AppBus()
+        
         self._create_header_bar()
         
         self._build_ui()
         
+        self._ui_dirty = False
+        self._ui_refresh_source_id = None
+        self._last_refresh = 0.0
         self._load_initial_data()
 
-        GLib.timeout_add_seconds(30, self._refresh_periodic)
+        GLib.timeout_add_seconds(_REFRESH_INTERVAL_S, self._refresh_periodic)
     
     def _create_header_bar(self):
 
@@ -70,20 +98,45 @@ class MainWindow(Adw.ApplicationWindow):
         self.content_stack.set_vexpand(True)
         main_box.append(self.content_stack)
         
-        self.dashboard_view = DashboardView(self.db, window=self)
-        self.content_stack.add_named(self.dashboard_view, "dashboard")
-        
-        self.scan_view = ScanView(self.db, scanner_callback=self._run_scan, window=self)
-        self.content_stack.add_named(self.scan_view, "scan")
-        
-        self.history_view = HistoryView(self.db)
-        self.content_stack.add_named(self.history_view, "history")
-        
+        # only the landing page is built up front; the other views are
+        # created and added to the stack the first time they are opened
+        self._view_factories = {
+            "dashboard": lambda: DashboardView(self.db, window=self),
+            "scan": lambda: ScanView(self.db, scanner_callback=self._run_scan, window=self),
+            "history": lambda: HistoryView(self.db),
+        }
+        self._views = {}
+        self.scan_view = None
+        self.history_view = None
+
+        self.dashboard_view = self._get_view("dashboard")
         self.content_stack.set_visible_child_name("dashboard")
+
+    def _get_view(self, page_name):
+
+        view = self._views.get(page_name)
+        if view is None:
+            view = self._view_factories[page_name]()
+            self._views[page_name] = view
+            setattr(self, f"{page_name}_view", view)
+            self.content_stack.add_named(view, page_name)
+
+            # views refresh from the bus; hidden views defer the work until
+            # they are shown, and a new view loads on its first map
+            if hasattr(view, "on_scans_changed"):
+                self.bus.connect("scans-changed", view.on_scans_changed)
+        return view
     
     def _on_page_changed(self, page_name):
 
+        view = self._get_view(page_name) if page_name in self._view_factories else None
         self.content_stack.set_visible_child_name(page_name)
+
+        # hidden views only note that scans changed; a page that comes back
+        # before its slide-out finished is never re-mapped, so it is
+        # caught up here instead of in its map handler
+        if hasattr(view, "refresh_if_pending"):
+            view.refresh_if_pending()
         
         subtitles = {
             "dashboard": "Compliance Overview",
@@ -91,14 +144,10 @@ class MainWindow(Adw.ApplicationWindow):
             "history": "Scan History"
         }
         self.window_title.set_subtitle(subtitles.get(page_name, ""))
-        
-        if page_name == "dashboard":
-            self.dashboard_view.refresh_data()
-        elif page_name == "history":
-            self.history_view.refresh_data()
     
     def _load_initial_data(self):
 
+        self._last_refresh = time.monotonic()
         try:
             scanner_ok = True
             try:
@@ -122,7 +171,6 @@ class MainWindow(Adw.ApplicationWindow):
                 threats_found = total_critical + total_high + total_medium + total_low
 
                 self.sidebar.update_stats(total_scans, threats_found)
-                self.dashboard_view.refresh_data()
             except Exception as e:
                 print(f"Error loading statistics from database: {e}")
                 db_ok = False
@@ -134,94 +182,200 @@ class MainWindow(Adw.ApplicationWindow):
     def _refresh_periodic(self) -> bool:
 
         try:
-            self._load_initial_data()
+            if self._ui_dirty or time.monotonic() - self._last_refresh >= _STALE_AFTER_S:
+                self._refresh_ui()
         except Exception as e:
             print(f"Error during periodic refresh: {e}")
         return True
+
+    def _mark_ui_dirty(self):
+
+        # callable from the scan thread; however many writes land, the
+        # sidebar is reloaded and scans-changed emitted once on the next
+        # idle cycle
+        self._ui_dirty = True
+        if self._ui_refresh_source_id is None:
+            self._ui_refresh_source_id = GLib.idle_add(self._on_ui_refresh_idle)
+
+    def _on_ui_refresh_idle(self):
+
+        self._ui_refresh_source_id = None
+        if self._ui_dirty:
+            self._refresh_ui()
+        return GLib.SOURCE_REMOVE
+
+    def _refresh_ui(self):
+
+        self._ui_dirty = False
+        self._load_initial_data()
+        self.bus.emit("scans-changed")
     
+    def _on_close_request(self, _window):
+
+        self._closing = True
+        # a running scan is abandoned; the worker is ours to stop, so the
+        # app exits without waiting for it
+        process = self._scan_process
+        if process is not None and process.is_alive():
+            process.terminate()
+            process.join(timeout=1)
+        # scans already handed over are still written before exit; nothing
+        # new is accepted
+        self._db_executor.shutdown(wait=False)
+        return False
+
     def _run_scan(self, url, standards, mode, progress_callback, complete_callback):
 
-        scan_id = None
+        # called on the main thread; the scan is started in a worker process
+        # and polled from a main-loop timeout
+        progress_callback(0.1, "Initializing scanner...")
+
+        start_ts = time.time()
         try:
-            progress_callback(0.1, "Initializing scanner...")
-            
-            start_ts = time.time()
-            
-            scanner = Scanner(url, standards, mode)
-            
-            progress_callback(0.3, "Scanning target...")
-            
-            results = scanner.run_scan()
-            scan_id = results.get("scan_id", "unknown")
-            
-            progress_callback(0.7, "Analyzing results...")
-            
-            analysis = analyze_scan_results(results)
-            summary = analysis.summary_counts
-            
-            self.db.create_scan(
-                scan_id=scan_id,
-                url=url,
-                mode=mode,
-                standards=standards
-            )
-            duration = time.time() - start_ts
-            end_time = datetime.now(timezone.utc).isoformat()
-
-            self.db.update_scan(
-                scan_id=scan_id,
-                status="completed",
-                end_time=end_time,
-                duration=duration,
-                score=analysis.score,
-                counts=summary,
-                pages_scanned=len(results.get("pages", {})),
-                results=results,
+            process = self._scan_context.Process(
+                target=run_scan_job,
+                args=(url, standards, mode, self._scan_progress, self._scan_results),
+                name="shieldeye-scan",
+                daemon=True,
             )
+            process.start()
+        except Exception as e:
+            complete_callback(False, str(e), None)
+            return
+        self._scan_process = process
+
+        GLib.timeout_add(
+            _SCAN_POLL_INTERVAL_MS,
+            self._poll_scan,
+            process,
+            (url, standards, mode, start_ts),
+            progress_callback,
+            complete_callback,
+        )
+
+    def _drain_scan_progress(self):
+
+        latest = None
+        while True:
+            try:
+                latest = self._scan_progress.get_nowait()
+            except queue.Empty:
+                return latest
+
+    def _poll_scan(self, process, scan, progress_callback, complete_callback):
 
-            for finding in analysis.findings:
-                if finding.severity != "pass":
-                    self.db.add_finding(
-                        scan_id,
-                        finding.severity,
-                        finding.message,
-                        finding.category,
-                        finding.location,
-                        finding.standards,
-                    )
-            
+        if self._closing:
+            return GLib.SOURCE_REMOVE
+
+        # everything queued since the last poll collapses into one update
+        latest = self._drain_scan_progress()
+        if latest is not None:
+            progress_callback(*latest)
+
+        # the result is read before the worker is joined: a large result
+        # keeps the worker alive until its pipe has been drained
+        try:
+            ok, payload, scan_id = self._scan_results.get_nowait()
+        except queue.Empty:
+            if process.is_alive():
+                return GLib.SOURCE_CONTINUE
+            try:
+                ok, payload, scan_id = self._scan_results.get(timeout=0.5)
+            except queue.Empty:
+                ok, payload, scan_id = (
+                    False, f"Scan worker exited unexpectedly (code {process.exitcode})", None
+                )
+
+        process.join()
+        self._scan_process = None
+
+        if not ok:
+            if scan_id:
+                self._db_executor.submit(self._persist_failed_scan, scan_id, *scan[:3], payload)
+            complete_callback(False, payload, None)
+            return GLib.SOURCE_REMOVE
+
+        try:
+            result_data = self._finish_scan(*scan, *payload)
+        except Exception as e:
+            complete_callback(False, str(e), None)
+        else:
             progress_callback(1.0, "Scan completed!")
-            
-            GLib.idle_add(self._load_initial_data)
-            GLib.idle_add(self.history_view.refresh_data)
-            
-            result_data = {
-                "scan_id": scan_id,
-                "url": url,
-                "mode": mode,
-                "standards": standards,
-                "score": analysis.score,
-                "summary": summary,
-                "pages_scanned": len(results.get("pages", {})),
-                "findings": [
-                    {
-                        "severity": f.severity,
-                        "message": f.message,
-                        "category": f.category,
-                        "location": f.location,
-                        "standards": f.standards or [],
-                    }
-                    for f in analysis.findings
-                    if f.severity and f.severity.lower() != "pass"
+            complete_callback(True, "Scan completed successfully", result_data)
+        return GLib.SOURCE_REMOVE
+
+    def _finish_scan(self, url, standards, mode, start_ts, results, analysis):
+
+        scan_id = results.get("scan_id", "unknown")
+        summary = analysis.summary_counts
+        pages_scanned = len(results.get("pages", {}))
+
+        # the FindingDetail objects are handed over as they are;
+        # the results view only reads their attributes
+        findings = shown_findings(analysis.findings)
+
+        result_data = {
+            "scan_id": scan_id,
+            "url": url,
+            "mode": mode,
+            "standards": standards,
+            "score": analysis.score,
+            "summary": summary,
+            "pages_scanned": pages_scanned,
+            "findings": findings,
+        }
+
+        # results are shown as soon as analysis is done; storing them
+        # runs behind on the single database writer thread
+        self._db_executor.submit(
+            self._persist_scan,
+            scan_id,
+            url,
+            mode,
+            standards,
+            duration=time.time() - start_ts,
+            end_time=datetime.now(timezone.utc).isoformat(),
+            score=analysis.score,
+            counts=summary,
+            pages_scanned=pages_scanned,
+            results=results,
+            findings=stored_findings(analysis.findings),
+        )
+        return result_data
+
+    def _persist_scan(self, scan_id, url, mode, standards, *, findings, **fields):
+
+        # runs on self._db_executor; the scan row, its counters and all
+        # findings are written in one transaction
+        try:
+            self.db.save_completed_scan(
+                scan_id,
+                url,
+                mode,
+                standards,
+                findings=[
+                    (f.severity, f.message, f.category, f.location, f.standards)
+                    for f in findings
                 ],
-            }
+                **fields,
+            )
+        except Exception as e:
+            print(f"Error saving scan {scan_id}: {e}")
+            import traceback
+            traceback.print_exc()
+            self._persist_failed_scan(scan_id, url, mode, standards, str(e))
+            return
 
-            complete_callback(True, "Scan completed successfully", result_data)
-            
+        self._mark_ui_dirty()
+
+    def _persist_failed_scan(self, scan_id, url, mode, standards, error_message):
+
+        # runs on self._db_executor; a scan that got an id but didn't
+        # complete is kept as a failed row
+        try:
+            self.db.record_failed_scan(scan_id, url, mode, standards, error_message)
         except Exception as e:
-            if scan_id:
-                try:
-                    self.db.update_scan(scan_id, status="failed", error_message=str(e))
-                except Exception:
-                    pass
-            complete_callback(False, str(e), None)
+            print(f"Error recording failed scan {scan_id}: {e}")
+            return
+
+        self._mark_ui_dirty()
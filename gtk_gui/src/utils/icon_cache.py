@@ -0,0 +1,60 @@
+"""Emoji icons rasterised once and shared as textures between widgets."""
+
+import sys
+from functools import lru_cache
+
+import cairo
+from gi.repository import Gdk, GLib, Gtk, Pango, PangoCairo
+
+# cairo's ARGB32 is premultiplied and stored in native byte order
+_MEMORY_FORMAT = (
+    Gdk.MemoryFormat.B8G8R8A8_PREMULTIPLIED
+    if sys.byteorder == "little"
+    else Gdk.MemoryFormat.A8R8G8B8_PREMULTIPLIED
+)
+
+# render at twice the logical size so the texture stays sharp on HiDPI
+_RENDER_SCALE = 2
+
+
+@lru_cache(maxsize=None)
+def _emoji_texture(icon, size):
+    font = Pango.FontDescription()
+    font.set_size(size)
+
+    measure_cr = cairo.Context(cairo.ImageSurface(cairo.FORMAT_ARGB32, 1, 1))
+    layout = PangoCairo.create_layout(measure_cr)
+    layout.set_font_description(font)
+    layout.set_text(icon, -1)
+    width, height = layout.get_pixel_size()
+    width, height = max(width, 1), max(height, 1)
+
+    surface = cairo.ImageSurface(
+        cairo.FORMAT_ARGB32, width * _RENDER_SCALE, height * _RENDER_SCALE
+    )
+    cr = cairo.Context(surface)
+    cr.scale(_RENDER_SCALE, _RENDER_SCALE)
+    PangoCairo.update_layout(cr, layout)
+    PangoCairo.show_layout(cr, layout)
+    surface.flush()
+
+    texture = Gdk.MemoryTexture.new(
+        surface.get_width(),
+        surface.get_height(),
+        _MEMORY_FORMAT,
+        GLib.Bytes.new(bytes(surface.get_data())),
+        surface.get_stride(),
+    )
+    return texture, max(width, height)
+
+
+def emoji_image(icon, size):
+    """Return a ``Gtk.Image`` showing ``icon`` as ``<span size="{size}">`` would.
+
+    The glyph is shaped and rasterised once per ``(icon, size)``; every
+    image created afterwards shares the same texture.
+    """
+    texture, pixel_size = _emoji_texture(icon, size)
+    image = Gtk.Image.new_from_paintable(texture)
+    image.set_pixel_size(pixel_size)
+    return image
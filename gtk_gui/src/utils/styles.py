@@ -1,6 +1,8 @@
 """CSS Styles for the application."""
 
-from gi.repository import Gtk, Gdk
+import re
+
+from gi.repository import Gtk, Gdk, GLib
 
 CSS_STYLES = """
 /* Modern Dark Theme Colors */
@@ -26,13 +28,17 @@ window {
     min-width: 220px;
 }
 
+/* Transitions name only the properties their :hover/.active states change,
+   rather than "all", so a state change doesn't diff every property. */
 .card {
     background-color: #1E293B;
     border-radius: 12px;
     padding: 24px;
     border: 1px solid #334155;
     box-shadow: 0 1px 3px rgba(0, 0, 0, 0.2);
-    transition: all 300ms cubic-bezier(0.4, 0, 0.2, 1);
+    transition-property: border-color, box-shadow, transform;
+    transition-duration: 300ms;
+    transition-timing-function: cubic-bezier(0.4, 0, 0.2, 1);
 }
 
 .card:hover {
@@ -67,7 +73,9 @@ window {
     padding: 20px;
     border: 1px solid #334155;
     box-shadow: 0 1px 3px rgba(0, 0, 0, 0.2);
-    transition: all 300ms cubic-bezier(0.4, 0, 0.2, 1);
+    transition-property: border-color, box-shadow, transform;
+    transition-duration: 300ms;
+    transition-timing-function: cubic-bezier(0.4, 0, 0.2, 1);
 }
 
 .metric-card:hover {
@@ -97,19 +105,23 @@ window {
 .status-warning { color: #FBBF24; } /* Amber 400 */
 .status-critical { color: #F87171; } /* Red 400 */
 
+/* Buttons and sidebar items repaint on every hover, so they use a solid
+   fill (the midpoint of the former gradient) instead of a gradient node. */
 .btn-primary {
-    background: linear-gradient(135deg, #3B82F6 0%, #2563EB 100%);
+    background: #3072F0;
     color: white;
     border: none;
     border-radius: 10px;
     padding: 10px 24px;
     font-weight: 600;
     box-shadow: 0 2px 4px rgba(37, 99, 235, 0.2);
-    transition: all 250ms cubic-bezier(0.4, 0, 0.2, 1);
+    transition-property: background-color, box-shadow, transform;
+    transition-duration: 250ms;
+    transition-timing-function: cubic-bezier(0.4, 0, 0.2, 1);
 }
 
 .btn-primary:hover {
-    background: linear-gradient(135deg, #60A5FA 0%, #3B82F6 100%);
+    background: #4D93F8;
     box-shadow: 0 6px 12px rgba(37, 99, 235, 0.4);
     transform: translateY(-2px);
 }
@@ -126,7 +138,9 @@ window {
     border-radius: 10px;
     padding: 10px 20px;
     font-weight: 500;
-    transition: all 250ms cubic-bezier(0.4, 0, 0.2, 1);
+    transition-property: background-color, color, border-color, box-shadow, transform;
+    transition-duration: 250ms;
+    transition-timing-function: cubic-bezier(0.4, 0, 0.2, 1);
 }
 
 .btn-secondary:hover {
@@ -149,18 +163,21 @@ window {
     border: none;
     color: #9CA3AF;
     font-weight: 500;
-    transition: all 200ms cubic-bezier(0.4, 0, 0.2, 1);
+    transition-property: background-color, color, box-shadow;
+    transition-duration: 200ms;
+    transition-timing-function: cubic-bezier(0.4, 0, 0.2, 1);
     font-size: 13px;
 }
 
+/* no transform on hover: moving the item re-snapshots the sidebar on
+   every hover in and out */
 .sidebar-item:hover {
     background-color: #101827;
     color: #F3F4F6;
-    transform: translateX(3px);
 }
 
 .sidebar-item.active {
-    background: linear-gradient(90deg, #3B82F6 0%, #2563EB 100%);
+    background: #3072F0;
     color: white;
     box-shadow: 0 2px 8px rgba(37, 99, 235, 0.3);
 }
@@ -172,7 +189,24 @@ window {
     letter-spacing: 0.3px;
 }
 
+.sidebar-header {
+    margin: 20px 16px;
+}
+
+.sidebar-nav {
+    margin: 8px 12px 0 12px;
+}
+
+.sidebar-section {
+    margin: 0 16px 20px 16px;
+}
+
+.sidebar-stats {
+    margin-top: 8px;
+}
+
 .sidebar-section-title {
+    margin-bottom: 4px;
     font-size: 9px;
     font-weight: 600;
     color: #94A3B8;
@@ -185,6 +219,14 @@ window {
     color: #94A3B8;
 }
 
+.sidebar-stat-caption {
+    margin-bottom: 8px;
+}
+
+.sidebar-stat-caption:last-child {
+    margin-bottom: 0;
+}
+
 headerbar,
 .header-bar {
     background-color: #0F172A;
@@ -228,44 +270,49 @@ entry:focus {
     border: 1px solid rgba(59, 130, 246, 0.2);
 }
 
-.severity-critical {
-    background-color: rgba(239, 68, 68, 0.2);
-    color: #F87171;
+/* Severity badges share one base rule; the variants only set colours */
+@define-color severity_critical #F87171;
+@define-color severity_critical_tint rgb(239, 68, 68);
+@define-color severity_high #FBBF24;
+@define-color severity_high_tint rgb(245, 158, 11);
+@define-color severity_medium #FCD34D;
+@define-color severity_medium_tint rgb(251, 191, 36);
+@define-color severity_low #34D399;
+@define-color severity_low_tint rgb(16, 185, 129);
+
+.severity-critical,
+.severity-high,
+.severity-medium,
+.severity-low {
     padding: 4px 12px;
     border-radius: 20px;
     font-size: 12px;
     font-weight: 700;
-    border: 1px solid rgba(239, 68, 68, 0.3);
+    border: 1px solid transparent;
+}
+
+.severity-critical {
+    color: @severity_critical;
+    background-color: alpha(@severity_critical_tint, 0.2);
+    border-color: alpha(@severity_critical_tint, 0.3);
 }
 
 .severity-high {
-    background-color: rgba(245, 158, 11, 0.2);
-    color: #FBBF24;
-    padding: 4px 12px;
-    border-radius: 20px;
-    font-size: 12px;
-    font-weight: 700;
-    border: 1px solid rgba(245, 158, 11, 0.3);
+    color: @severity_high;
+    background-color: alpha(@severity_high_tint, 0.2);
+    border-color: alpha(@severity_high_tint, 0.3);
 }
 
 .severity-medium {
-    background-color: rgba(251, 191, 36, 0.2);
-    color: #FCD34D;
-    padding: 4px 12px;
-    border-radius: 20px;
-    font-size: 12px;
-    font-weight: 700;
-    border: 1px solid rgba(251, 191, 36, 0.3);
+    color: @severity_medium;
+    background-color: alpha(@severity_medium_tint, 0.2);
+    border-color: alpha(@severity_medium_tint, 0.3);
 }
 
 .severity-low {
-    background-color: rgba(16, 185, 129, 0.2);
-    color: #34D399;
-    padding: 4px 12px;
-    border-radius: 20px;
-    font-size: 12px;
-    font-weight: 700;
-    border: 1px solid rgba(16, 185, 129, 0.3);
+    color: @severity_low;
+    background-color: alpha(@severity_low_tint, 0.2);
+    border-color: alpha(@severity_low_tint, 0.3);
 }
 
 /* Progress Bars */
@@ -307,6 +354,12 @@ progressbar progress {
     border-radius: 3px;
 }
 
+.progress-card-status {
+    margin: 8px 0;
+    border-left: 1px solid rgba(148, 163, 184, 0.2);
+    padding-left: 12px;
+}
+
 /* Issues severity bar (critical share) */
 .issues-severity-bar {
     min-height: 8px;
@@ -321,6 +374,7 @@ progressbar progress {
 /* Standards Progress Bar - same style as compliance */
 .standard-progress {
     min-height: 6px;
+    margin-top: 8px;
 }
 
 .standard-progress progress {
@@ -331,9 +385,12 @@ progressbar progress {
 
 /* Standards Grid Styling */
 .standard-item {
+    margin: 4px 0;
     padding: 4px 0;
     border-radius: 8px;
-    transition: all 250ms cubic-bezier(0.4, 0, 0.2, 1);
+    transition-property: background-color, transform;
+    transition-duration: 250ms;
+    transition-timing-function: cubic-bezier(0.4, 0, 0.2, 1);
 }
 
 .standard-item:hover {
@@ -341,13 +398,49 @@ progressbar progress {
     transform: translateX(4px);
 }
 
+/* Severity risk bars */
+.risk-bar {
+    margin: 8px 0;
+}
+
+/* Recent activity list on the dashboard */
+.activity-list {
+    background: transparent;
+}
+
+.activity-list > row {
+    padding: 4px 0;
+    background: transparent;
+}
+
+/* Scan History list; rows are spaced like the old 16px box spacing */
+.history-list {
+    background: transparent;
+}
+
+.history-list > row {
+    padding: 8px 0;
+    background: transparent;
+}
+
+.findings-list {
+    background: transparent;
+}
+
+.findings-list > row {
+    padding: 3px 0;
+    background: transparent;
+}
+
 /* Scan Item in History View */
 .scan-item {
     background-color: #1E293B;
     border-radius: 10px;
     padding: 16px 20px;
     border: 1px solid #334155;
-    transition: all 250ms cubic-bezier(0.4, 0, 0.2, 1);
+    transition-property: background-color, border-color, box-shadow, transform;
+    transition-duration: 250ms;
+    transition-timing-function: cubic-bezier(0.4, 0, 0.2, 1);
 }
 
 .scan-item:hover {
@@ -389,6 +482,41 @@ progressbar progress {
     padding: 2px 8px;
 }
 
+/* Misc helpers */
+.empty-state {
+    opacity: 0.6;
+    transition: opacity 300ms ease;
+}
+
+.empty-state:hover {
+    opacity: 0.8;
+}
+
+.empty-state button {
+    margin-top: 8px;
+}
+
+/* Scoped to the widgets that take focus or get disabled; a universal
+   selector is matched against every node on each state change. An entry's
+   focus lands on its inner text node, hence :focus-within. */
+button:focus,
+checkbutton:focus,
+row:focus,
+entry:focus-within {
+    outline: 2px solid #3B82F6;
+    outline-offset: 2px;
+}
+
+button:disabled,
+checkbutton:disabled,
+entry:disabled {
+    opacity: 0.5;
+}
+"""
+
+# animations, tooltips and hover-only decoration are not needed for the first
+# frame; this sheet is parsed and installed once the main loop is idle
+DEFERRED_CSS_STYLES = """
 /* Loading and Skeleton States */
 .skeleton {
     background: linear-gradient(90deg, #1E293B 25%, #2D3748 50%, #1E293B 75%);
@@ -429,35 +557,70 @@ tooltip {
     box-shadow: 0 4px 12px rgba(0, 0, 0, 0.3);
 }
 
-/* Misc helpers */
 .glow-on-hover:hover {
     box-shadow: 0 0 20px rgba(59, 130, 246, 0.3);
 }
+"""
 
-.empty-state {
-    opacity: 0.6;
-    transition: opacity 300ms ease;
-}
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_CSS_SPACE_RE = re.compile(r"\s+")
+# whitespace next to these never matters; ':' is left alone because a
+# space before it is a descendant combinator in selectors
+_CSS_PUNCT_SPACE_RE = re.compile(r"\s*([{};,>])\s*")
 
-.empty-state:hover {
-    opacity: 0.8;
-}
+def _minify_css(css: str) -> str:
 
-*:focus {
-    outline: 2px solid #3B82F6;
-    outline-offset: 2px;
-}
+    css = _CSS_COMMENT_RE.sub("", css)
+    css = _CSS_SPACE_RE.sub(" ", css)
+    return _CSS_PUNCT_SPACE_RE.sub(r"\1", css).strip()
 
-*:disabled {
-    opacity: 0.5;
-}
-"""
+# the provider parses the minified sheet, without comments and indentation
+_CSS_BYTES = _minify_css(CSS_STYLES).encode("utf-8")
+_DEFERRED_CSS_BYTES = _minify_css(DEFERRED_CSS_STYLES).encode("utf-8")
+
+# the stylesheet is parsed once per process; further windows reuse the
+# provider, and it is registered once per display
+_css_provider = None
+_deferred_css_provider = None
+_styled_displays = set()
+
+def _on_display_closed(display, _is_error):
+
+    _styled_displays.discard(display)
+
+def apply_css(widget=None, *_args, **_kwargs) -> None:
+    global _css_provider
+
+    display = widget.get_display() if widget is not None else Gdk.Display.get_default()
+    if display in _styled_displays:
+        return
+
+    if _css_provider is None:
+        _css_provider = Gtk.CssProvider()
+        _css_provider.load_from_data(_CSS_BYTES)
 
-def apply_css(*_args, **_kwargs) -> None:
-    css_provider = Gtk.CssProvider()
-    css_provider.load_from_data(CSS_STYLES.encode())
     Gtk.StyleContext.add_provider_for_display(
-        Gdk.Display.get_default(),
-        css_provider,
+        display,
+        _css_provider,
         Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
     )
+    _styled_displays.add(display)
+    # a closed display is dropped rather than kept alive by the set
+    display.connect("closed", _on_display_closed)
+
+    GLib.idle_add(_install_deferred_css, display, priority=GLib.PRIORITY_LOW)
+
+def _install_deferred_css(display):
+    global _deferred_css_provider
+
+    if display in _styled_displays:
+        if _deferred_css_provider is None:
+            _deferred_css_provider = Gtk.CssProvider()
+            _deferred_css_provider.load_from_data(_DEFERRED_CSS_BYTES)
+
+        Gtk.StyleContext.add_provider_for_display(
+            display,
+            _deferred_css_provider,
+            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+        )
+    return GLib.SOURCE_REMOVE
@@ -0,0 +1,33 @@
+"""Shared Pango attribute lists for labels whose text changes often."""
+
+from functools import lru_cache
+
+from gi.repository import Pango
+
+
+@lru_cache(maxsize=None)
+def hex_to_rgb(color):
+    """Return the 0-255 ``(r, g, b)`` channels of a ``#RRGGBB`` color."""
+    color = color.lstrip("#")
+    return tuple(int(color[i:i + 2], 16) for i in (0, 2, 4))
+
+
+@lru_cache(maxsize=None)
+def text_attrs(size=None, weight=None, color=None, letter_spacing=None):
+    """Return a cached AttrList equivalent to a ``<span>`` with these attributes.
+
+    Values use the same units as the markup they replace (Pango units for
+    ``size`` and ``letter_spacing``, CSS-style numeric weights, ``#RRGGBB``
+    colors). Pairing ``Gtk.Label.set_text`` with one of these lists avoids
+    re-parsing markup on every update.
+    """
+    attrs = Pango.AttrList()
+    if size is not None:
+        attrs.insert(Pango.attr_size_new(size))
+    if weight is not None:
+        attrs.insert(Pango.attr_weight_new(Pango.Weight(weight)))
+    if color is not None:
+        attrs.insert(Pango.attr_foreground_new(*(c * 257 for c in hex_to_rgb(color))))
+    if letter_spacing is not None:
+        attrs.insert(Pango.attr_letter_spacing_new(letter_spacing))
+    return attrs
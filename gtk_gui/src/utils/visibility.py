@@ -0,0 +1,15 @@
+"""Visibility checks for views that defer work while they are hidden."""
+
+from gi.repository import Gtk
+
+
+def is_shown_page(widget):
+    """Return whether ``widget`` is mapped and, inside a stack, its visible child.
+
+    A page that is being slid out during a ``Gtk.Stack`` transition stays
+    mapped until the animation ends, so being mapped alone is not enough.
+    """
+    if not widget.get_mapped():
+        return False
+    parent = widget.get_parent()
+    return not isinstance(parent, Gtk.Stack) or parent.get_visible_child() is widget
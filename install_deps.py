@@ -10,43 +10,55 @@ if sys.version_info < (3, 10):
 
 from distro_utils import detect_distro, get_distro_name
 
+# only the end of a failing command's stderr is kept; that is where pip
+# reports what went wrong
+_STDERR_TAIL_BYTES = 512
+
 def run_command(cmd, check=True):
 
-    try:
-        if isinstance(cmd, str):
-            cmd = cmd.split()
-        result = subprocess.run(
-            cmd,
-            shell=False,
-            check=check,
-            capture_output=True,
-            text=True
-        )
-        return result.returncode == 0, result.stdout, result.stderr
-    except subprocess.CalledProcessError as e:
-        return False, e.stdout, e.stderr
+    # stdout is discarded and stderr streamed through a bounded buffer, so
+    # a long pip log is neither held in memory nor decoded
+    if isinstance(cmd, str):
+        cmd = cmd.split()
+    with subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE) as proc:
+        stderr_tail = b""
+        for chunk in iter(lambda: proc.stderr.read(4096), b""):
+            stderr_tail = (stderr_tail + chunk)[-_STDERR_TAIL_BYTES:]
+        returncode = proc.wait()
+
+    # a failure is reported through the return value whether or not check
+    # is set, as before
+    return returncode == 0, "", stderr_tail.decode("utf-8", "replace")
 
 def install_pip_requirements(files):
 
     print("\n[*] Installing Python dependencies...")
     
+    found = []
     for req_file in files:
         if not os.path.exists(req_file):
             print(f"[WARN] {req_file} not found, skipping...")
             continue
-        
+        found.append(req_file)
+
+    if not found:
+        return
+
+    # one pip run resolves and downloads every file's requirements together;
+    # separate pip processes installing into the same environment could race
+    cmd = [sys.executable, "-m", "pip", "install", "--prefer-binary"]
+    for req_file in found:
         print(f"   Installing from {req_file}...")
-        success, stdout, stderr = run_command(
-            f"{sys.executable} -m pip install -r {req_file}",
-            check=False
-        )
-        
-        if not success:
-            print(f"[WARN] Some packages from {req_file} failed to install.")
-            print("   This is normal for system packages on Fedora/RHEL.")
-            print(f"   Error details: {stderr[:200]}")
-        else:
-            print(f"[OK] Successfully installed from {req_file}")
+        cmd += ["-r", req_file]
+
+    success, stdout, stderr = run_command(cmd, check=False)
+
+    if not success:
+        print(f"[WARN] Some packages from {', '.join(found)} failed to install.")
+        print("   This is normal for system packages on Fedora/RHEL.")
+        print(f"   Error details: {stderr[-200:]}")
+    else:
+        print(f"[OK] Successfully installed from {', '.join(found)}")
 
 def install_arch_system_deps():
 
@@ -88,13 +100,8 @@ def install_fedora_system_deps():
     print(f"   Run: sudo dnf install {' '.join(packages)}")
     print("   (Skipping automatic installation - requires sudo)")
 
-def main():
-    print("=" * 70)
-    print("ShieldEye ComplianceScan - Dependency Installer")
-    print("=" * 70)
-    
-    print(f"\n[OK] Python version: {sys.version.split()[0]}")
-    
+def install_linux_deps(req_files):
+
     distro = detect_distro()
     distro_name = get_distro_name()
     print(f"[OK] Detected distribution: {distro_name}")
@@ -103,8 +110,6 @@ def main():
         print("\n[WARN] Unknown Linux distribution detected.")
         print("   Proceeding with base requirements only.")
         print("   Some features may not work correctly.\n")
-    
-    req_files = ['requirements.txt']
 
     print("\n[*] Installing Python dependencies from requirements.txt ...")
     install_pip_requirements(req_files)
@@ -119,6 +124,23 @@ def main():
 
     else:
         print("\n[*] No specific distro integration. Installed base Python requirements only.")
+
+def main():
+    print("=" * 70)
+    print("ShieldEye ComplianceScan - Dependency Installer")
+    print("=" * 70)
+    
+    print(f"\n[OK] Python version: {sys.version.split()[0]}")
+    
+    req_files = ['requirements.txt']
+
+    # distro detection and the system package hints only apply to Linux;
+    # elsewhere the installer just installs the pip requirements
+    if not sys.platform.startswith('linux'):
+        print("[OK] Non-Linux host: installing pip requirements only")
+        install_pip_requirements(req_files)
+    else:
+        install_linux_deps(req_files)
     
     print("\n" + "=" * 70)
     print("[OK] Installation complete!")
@@ -1,16 +1,38 @@
 
 from __future__ import annotations
 
-from locust import HttpUser, task, between, events
+from locust import FastHttpUser, HttpUser, task, between, events
 import random
 
+import numpy as np
+
+_TEMPLATES = (
+    "quick_gdpr",
+    "full_gdpr",
+    "pci_dss_ecommerce",
+    "iso_27001_security",
+    "security_headers",
+)
+
+_READ_ENDPOINTS = ("/health", "/templates", "/stats")
+
+# per-user random task parameters are drawn in one batch at start and
+# cycled through; the mask wraps the counter
+_SAMPLE_SIZE = 4096
+_SAMPLE_MASK = _SAMPLE_SIZE - 1
+
 class ShieldEyeUser(HttpUser):
 
     wait_time = between(1, 5)
     
     def on_start(self):
 
-        pass
+        # each simulated user sticks to one template; across users the
+        # requests still cover all of them
+        self._template = random.choice(_TEMPLATES)
+        self._limits = np.random.randint(5, 21, size=_SAMPLE_SIZE).tolist()
+        self._offsets = np.random.randint(0, 11, size=_SAMPLE_SIZE).tolist()
+        self._sample = 0
     
     @task(10)
     def health_check(self):
@@ -20,9 +42,11 @@ class ShieldEyeUser(HttpUser):
     @task(5)
     def list_scans(self):
 
+        i = self._sample & _SAMPLE_MASK
+        self._sample += 1
         params = {
-            "limit": random.randint(5, 20),
-            "offset": random.randint(0, 10)
+            "limit": self._limits[i],
+            "offset": self._offsets[i]
         }
         self.client.get("/scans", params=params)
     
@@ -34,15 +58,7 @@ class ShieldEyeUser(HttpUser):
     @task(2)
     def get_specific_template(self):
 
-        templates = [
-            "quick_gdpr",
-            "full_gdpr",
-            "pci_dss_ecommerce",
-            "iso_27001_security",
-            "security_headers"
-        ]
-        template = random.choice(templates)
-        self.client.get(f"/templates/{template}")
+        self.client.get(f"/templates/{self._template}")
     
     @task(2)
     def get_stats(self):
@@ -95,7 +111,10 @@ class AdminUser(HttpUser):
             if response.status_code in [401, 403]:
                 response.success()
 
-class StressTestUser(HttpUser):
+# the rapid-fire users run on the geventhttpclient-based FastHttpUser, which
+# keeps its connections alive and spends far less CPU per request than the
+# requests session, so the load generator is not the bottleneck
+class StressTestUser(FastHttpUser):
 
     wait_time = between(0.1, 0.5)
     
@@ -114,18 +133,23 @@ def on_test_stop(environment, **kwargs):
 
     print("Load test completed!")
     
-    stats = environment.stats
-    print("\n" + "=" * 80)
-    print("LOAD TEST SUMMARY")
-    print("=" * 80)
-    print(f"Total Requests:     {stats.total.num_requests}")
-    print(f"Failed Requests:    {stats.total.num_failures}")
-    print(f"Success Rate:       {(1 - stats.total.fail_ratio) * 100:.2f}%")
-    print(f"Avg Response Time:  {stats.total.avg_response_time:.2f}ms")
-    print(f"Min Response Time:  {stats.total.min_response_time:.2f}ms")
-    print(f"Max Response Time:  {stats.total.max_response_time:.2f}ms")
-    print(f"Requests/sec:       {stats.total.total_rps:.2f}")
-    print("=" * 80)
+    # fail_ratio, avg_response_time and total_rps are computed properties;
+    # each is read once
+    total = environment.stats.total
+    summary = (
+        ("Total Requests:", f"{total.num_requests}"),
+        ("Failed Requests:", f"{total.num_failures}"),
+        ("Success Rate:", f"{(1 - total.fail_ratio) * 100:.2f}%"),
+        ("Avg Response Time:", f"{total.avg_response_time:.2f}ms"),
+        ("Min Response Time:", f"{total.min_response_time:.2f}ms"),
+        ("Max Response Time:", f"{total.max_response_time:.2f}ms"),
+        ("Requests/sec:", f"{total.total_rps:.2f}"),
+    )
+
+    lines = ["", "=" * 80, "LOAD TEST SUMMARY", "=" * 80]
+    lines += [f"{label:<20}{value}" for label, value in summary]
+    lines.append("=" * 80)
+    print("\n".join(lines))
 
 class QuickLoadTest(HttpUser):
 
@@ -142,19 +166,24 @@ class SustainedLoadTest(HttpUser):
     
     @task(3)
     def read_operations(self):
-        endpoints = ["/health", "/templates", "/stats"]
-        endpoint = random.choice(endpoints)
-        self.client.get(endpoint)
+        self.client.get(random.choice(_READ_ENDPOINTS))
     
     @task(1)
     def list_operations(self):
         self.client.get("/scans", params={"limit": 10})
 
-class SpikeTest(HttpUser):
+class SpikeTest(FastHttpUser):
 
     wait_time = between(0.1, 1)
+
+    def on_start(self):
+
+        self._bursts = np.random.randint(1, 6, size=_SAMPLE_SIZE).tolist()
+        self._sample = 0
     
     @task
     def burst_requests(self):
-        for _ in range(random.randint(1, 5)):
+        burst = self._bursts[self._sample & _SAMPLE_MASK]
+        self._sample += 1
+        for _ in range(burst):
             self.client.get("/health")
@@ -1,13 +1,21 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+import io
+import sys
+from contextlib import redirect_stdout
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 
 from backend import AnalysisResult, analyze_results, analyze_scan_results
 
 
-def _build_sample_results() -> Dict[str, Any]:
+@lru_cache(maxsize=1)
+def _sample_results() -> Mapping[str, Any]:
 
-    return {
+    # built once and shared read-only; a test that needs to modify the
+    # sample must take a copy.deepcopy first
+    return MappingProxyType({
         "start_url": "https://example.com",
         "standards": ["GDPR"],
         "pages": {
@@ -25,7 +33,7 @@ def _build_sample_results() -> Dict[str, Any]:
                 },
             },
         },
-    }
+    })
 
 
 def test_analyze_results_empty() -> None:
@@ -54,7 +62,7 @@ def test_analyze_results_sample_data() -> None:
     print("BACKEND TEST 2: analyze_results on sample findings")
     print("=" * 70)
 
-    results = _build_sample_results()
+    results = _sample_results()
     analysis = analyze_results(results)
 
     assert isinstance(analysis, AnalysisResult), "Expected AnalysisResult instance"
@@ -80,7 +88,7 @@ def test_analyze_scan_results_wrapper() -> None:
     print("BACKEND TEST 3: analyze_scan_results wrapper parity")
     print("=" * 70)
 
-    results = _build_sample_results()
+    results = _sample_results()
 
     direct = analyze_results(results)
     wrapped = analyze_scan_results(results)
@@ -106,14 +114,18 @@ def main() -> int:
 
     all_ok = True
     for name, func in tests:
+        # each test's report is collected and written out in one go
+        buf = io.StringIO()
         try:
-            func()
+            with redirect_stdout(buf):
+                func()
         except AssertionError as e:
             all_ok = False
-            print(f"{name} FAILED: {e}")
+            buf.write(f"{name} FAILED: {e}\n")
         except Exception as e:
             all_ok = False
-            print(f"{name} ERROR: {e}")
+            buf.write(f"{name} ERROR: {e}\n")
+        sys.stdout.write(buf.getvalue())
 
     print("\n" + "=" * 70)
     if all_ok:
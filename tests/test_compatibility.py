@@ -1,6 +1,9 @@
 
+import importlib.util
+import io
 import sys
 import os
+from contextlib import redirect_stdout
 
 def test_python_version():
 
@@ -47,8 +50,11 @@ def test_requirements_files():
     ]
     
     for filename in required_files:
-        assert os.path.exists(filename), f"{filename} is missing"
-        size = os.path.getsize(filename)
+        # one stat answers both "does it exist" and "how big is it"
+        try:
+            size = os.stat(filename).st_size
+        except FileNotFoundError:
+            raise AssertionError(f"{filename} is missing") from None
         print(f"{filename} exists ({size} bytes)")
     
     print("PASS: requirements.txt present")
@@ -59,12 +65,22 @@ def test_main_imports():
     print("TEST 4: Main Module Import")
     print("=" * 70)
     
+    # locating the entry point is cheap; importing it loads the whole GTK
+    # stack, which is only worth doing where a display is available
+    spec = importlib.util.find_spec("main_gtk")
+    assert spec is not None, "main_gtk.py not found"
+
+    if not (os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY")):
+        print("PASS: main_gtk.py found (no display, import skipped)")
+        return
+
     try:
-        print("PASS: main.py imported successfully")
+        import main_gtk  # noqa: F401
+        print("PASS: main_gtk.py imported successfully")
         print("   (Python version check passed)")
     except SystemExit as e:
         if sys.version_info < (3, 10):
-            print("PASS: main.py correctly rejected Python < 3.10")
+            print("PASS: main_gtk.py correctly rejected Python < 3.10")
         else:
             raise AssertionError(f"Unexpected SystemExit: {e}")
     except Exception as e:
@@ -121,12 +137,17 @@ def main():
     
     results = []
     for test_func in tests:
+        # each test's report is collected and written out in one go; a test
+        # passes when it returns without raising
+        buf = io.StringIO()
         try:
-            result = test_func()
-            results.append(result)
+            with redirect_stdout(buf):
+                test_func()
+            results.append(True)
         except Exception as e:
-            print(f"\nEXCEPTION in {test_func.__name__}: {e}")
+            buf.write(f"\nEXCEPTION in {test_func.__name__}: {e}\n")
             results.append(False)
+        sys.stdout.write(buf.getvalue())
     
     print("\n" + "=" * 70)
     print("TEST SUMMARY")
@@ -1,19 +1,33 @@
 from __future__ import annotations
 
+import os
 import pytest
 import tempfile
+from datetime import datetime, timezone
 from pathlib import Path
+from unittest.mock import patch
 from backend.storage.database import ScanDatabase
 
 
-class TestScanDatabase:
+# one database (file, connection setup and schema) serves the whole
+# module; _clean empties it after every test
+@pytest.fixture(scope="module")
+def db():
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "test.db"
+        yield ScanDatabase(db_path)
+
+
+@pytest.fixture(autouse=True)
+def _clean(request):
+
+    yield
+    if "db" in request.fixturenames:
+        request.getfixturevalue("db").reset()
 
-    @pytest.fixture
-    def db(self):
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test.db"
-            yield ScanDatabase(db_path)
+class TestScanDatabase:
 
     def test_create_scan(self, db):
 
@@ -78,6 +92,73 @@ class TestScanDatabase:
         scans = db.get_scans(limit=10)
         assert len(scans) == 2
 
+    def test_get_scans_keyset_pagination(self, db):
+
+        for i in range(3):
+            db.create_scan(f"scan-{i}", "https://example.com", "Quick/Safe", [])
+            db.update_scan(f"scan-{i}", status="completed")
+
+        first_page = db.get_scans(limit=2, status="completed")
+        assert [s["scan_id"] for s in first_page] == ["scan-2", "scan-1"]
+
+        last = first_page[-1]
+        next_page = db.get_scans(
+            limit=2, status="completed", before=(last["start_time"], last["id"])
+        )
+        assert [s["scan_id"] for s in next_page] == ["scan-0"]
+
+    def test_keyset_pagination_with_equal_start_times(self, db):
+
+        frozen = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        with patch("backend.storage.database.datetime") as clock:
+            clock.now.return_value = frozen
+            for i in range(5):
+                db.create_scan(f"scan-{i}", "https://example.com", "Quick/Safe", [])
+
+        seen = []
+        before = None
+        while True:
+            page = db.get_scans(limit=2, before=before, columns=("id", "scan_id", "start_time"))
+            if not page:
+                break
+            seen += [s["scan_id"] for s in page]
+            before = (page[-1]["start_time"], page[-1]["id"])
+        assert seen == [f"scan-{i}" for i in range(4, -1, -1)]
+
+        rows = []
+        before = None
+        while True:
+            page = db.get_scan_rows(limit=2, before=before)
+            if not page:
+                break
+            rows += [row.scan_id for row in page]
+            before = (page[-1].start_time, page[-1].id)
+        assert rows == seen
+        assert {row.start_time for row in db.get_scan_rows(limit=10)} == {frozen.isoformat()}
+
+    def test_reset(self, db):
+
+        db.create_scan("scan-1", "https://example.com", "Quick/Safe", [])
+        db.add_finding("scan-1", "high", "Missing header", "security", "/", ["GDPR"])
+        db.get_scans(limit=10)
+
+        db.reset()
+
+        assert db.get_scans(limit=10) == []
+        assert db.get_findings("scan-1") == []
+
+    def test_record_failed_scan(self, db):
+
+        db.record_failed_scan("scan-1", "https://example.com", "Quick/Safe", ["GDPR"], "boom")
+        scan = db.get_scan("scan-1")
+        assert (scan["status"], scan["error_message"]) == ("failed", "boom")
+
+        db.create_scan("scan-2", "https://example.com", "Quick/Safe", [])
+        db.record_failed_scan("scan-2", "https://example.com", "Quick/Safe", [], "timeout")
+        scan = db.get_scan("scan-2")
+        assert (scan["status"], scan["error_message"]) == ("failed", "timeout")
+        assert len(db.get_scans(limit=10)) == 2
+
     def test_delete_scan(self, db):
 
         db.create_scan("test-123", "https://example.com", "Quick/Safe", [])
@@ -96,6 +177,165 @@ class TestScanDatabase:
         stats = db.get_statistics()
         assert stats["total_scans"] == 1
         assert stats["completed_scans"] == 1
+        assert stats["has_demo_data"] is False
+
+    def test_get_statistics_has_demo_data(self, db):
+
+        db.create_scan("demo-1", "https://example.com", "Quick/Safe", [])
+        db.create_scan("scan-1", "https://example.com", "Quick/Safe", [])
+
+        assert db.get_statistics()["has_demo_data"] is True
+
+    def test_get_scans_columns(self, db):
+
+        db.create_scan("scan-1", "https://example.com", "Quick/Safe", [])
+
+        scans = db.get_scans(limit=10, columns=("scan_id", "status"))
+        assert scans == [{"scan_id": "scan-1", "status": "running"}]
+
+        with pytest.raises(ValueError):
+            db.get_scans(limit=10, columns=("scan_id; DROP TABLE scans",))
+
+    def test_get_scan_rows(self, db):
+
+        db.create_scan("scan-1", "https://example.com", "Quick/Safe", [])
+        db.update_scan("scan-1", status="completed", score=85, pages_scanned=3)
+
+        rows = db.get_scan_rows(limit=10)
+
+        assert len(rows) == 1
+        row = rows[0]
+        assert (row.scan_id, row.url, row.status) == ("scan-1", "https://example.com", "completed")
+        assert row.score == 85.0 and isinstance(row.score, float)
+        assert row.pages_scanned == 3
+
+    def test_history_projection_uses_covering_index(self, db):
+
+        with db._get_connection() as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT scan_id, url, start_time, status, score, "
+                "pages_scanned, id FROM scans ORDER BY start_time DESC, id DESC LIMIT 50"
+            ).fetchall()
+
+        assert any(
+            "COVERING INDEX idx_scans_start_time_listing" in row["detail"] for row in plan
+        )
+
+    def test_create_scans_bulk(self, db):
+
+        inserted = db.create_scans_bulk([
+            ("scan-1", "https://example1.com", "Quick/Safe", ["GDPR"]),
+            ("scan-2", "https://example2.com", "Quick/Safe", None),
+        ])
+
+        assert inserted == 2
+        scan = db.get_scan("scan-1")
+        assert scan["status"] == "running"
+        assert scan["standards"] == '["GDPR"]'
+        assert db.get_scan("scan-2")["standards"] == "[]"
+
+    def test_add_findings_bulk(self, db):
+
+        db.create_scan("scan-1", "https://example.com", "Quick/Safe", [])
+        inserted = db.add_findings_bulk(
+            "scan-1",
+            [
+                ("high", "Missing HSTS", "headers", "/", ["PCI-DSS"]),
+                ("low", "Server banner", None, None, None),
+            ],
+        )
+
+        assert inserted == 2
+        findings = {f["message"]: f for f in db.get_findings("scan-1")}
+        assert findings["Missing HSTS"]["standards"] == '["PCI-DSS"]'
+        assert findings["Server banner"]["category"] is None
+
+    def test_save_completed_scan(self, db):
+
+        db.save_completed_scan(
+            "scan-1",
+            "https://example.com",
+            "Quick/Safe",
+            ["GDPR"],
+            end_time="2024-01-01T00:00:00+00:00",
+            duration=1.5,
+            score=70,
+            counts={"critical": 1, "high": 0, "medium": 2, "low": 0},
+            pages_scanned=3,
+            results={"pages": {}},
+            findings=[
+                ("critical", "Missing CSP", "headers", "/", ["GDPR"]),
+                ("medium", "Cookie without SameSite", None, None, None),
+            ],
+        )
+
+        scan = db.get_scan("scan-1")
+        assert scan["status"] == "completed"
+        assert scan["score"] == 70
+        assert scan["critical_count"] == 1
+        assert scan["pages_scanned"] == 3
+
+        findings = db.get_findings("scan-1")
+        assert {f["message"] for f in findings} == {"Missing CSP", "Cookie without SameSite"}
+
+    def test_cached_reads_follow_writes(self, tmp_path):
+
+        db = ScanDatabase(tmp_path / "cached.db", cache_reads=True)
+        db.create_scan("scan-1", "https://example.com", "Quick/Safe", [])
+
+        scans = db.get_scans(limit=10)
+        assert db.get_scans(limit=10) is scans
+
+        db.update_scan("scan-1", status="completed", score=80)
+        assert db.get_scans(limit=10) is not scans
+        assert db.get_statistics()["completed_scans"] == 1
+
+        stats = db.get_statistics()
+        db.invalidate_cache()
+        assert db.get_statistics() is not stats
+
+    def test_cached_reads_see_other_connections(self, tmp_path):
+
+        db_path = tmp_path / "shared.db"
+        cached = ScanDatabase(db_path, cache_reads=True)
+        assert cached.get_statistics()["total_scans"] == 0
+
+        ScanDatabase(db_path).create_scan("scan-1", "https://example.com", "Quick/Safe", [])
+        assert cached.get_statistics()["total_scans"] == 1
+
+    def test_cached_reads_see_same_size_updates(self, tmp_path):
+
+        db_path = tmp_path / "shared.db"
+        cached = ScanDatabase(db_path, cache_reads=True)
+        cached.create_scan("scan-1", "https://example.com", "Quick/Safe", [])
+        assert cached.get_scans(limit=10)[0]["status"] == "running"
+
+        # an in-place update from another connection that leaves the file's
+        # size and mtime as they were
+        st = db_path.stat()
+        ScanDatabase(db_path).update_scan("scan-1", status="failed")
+        os.utime(db_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert db_path.stat().st_size == st.st_size
+
+        assert cached.get_scans(limit=10)[0]["status"] == "failed"
+
+    def test_get_dashboard_snapshot(self, db):
+
+        for i in range(3):
+            db.create_scan(f"scan-{i}", "https://example.com", "Quick/Safe", [])
+        db.update_scan("scan-0", status="failed")
+
+        stats, scans = db.get_dashboard_snapshot(limit=2)
+        assert stats == db.get_statistics()
+        assert stats["failed_scans"] == 1
+        assert [s["scan_id"] for s in scans] == [
+            s["scan_id"] for s in db.get_scans(limit=2)
+        ]
+
+        # the dashboard takes its recent-activity rows from the head of this
+        # list, so it has to be newest first
+        start_times = [s["start_time"] for s in scans]
+        assert start_times == sorted(start_times, reverse=True)
 
 
 if __name__ == "__main__":
@@ -1,15 +1,23 @@
 
 from __future__ import annotations
 
+import asyncio
+import io
+import sys
 import time
 import json
-import statistics
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Any, Callable
-import requests
+from collections import deque
+from contextlib import redirect_stdout
+from dataclasses import dataclass, fields
+from typing import List, Deque, Dict, Any, Awaitable, Callable
+import httpx
+import numpy as np
 from datetime import datetime
 
+_pc = time.perf_counter_ns
+
+_ERROR_SAMPLE_SIZE = 10
+
 @dataclass
 class LoadTestResult:
 
@@ -28,57 +36,72 @@ class LoadTestResult:
     errors: List[str]
     timestamp: str
 
+_RESULT_FIELDS = tuple(f.name for f in fields(LoadTestResult))
+
+def _result_dict(result: LoadTestResult) -> Dict[str, Any]:
+
+    # a shallow read of the fields; the dict is only serialized, so the
+    # errors list doesn't need the deep copy asdict() makes
+    return {name: getattr(result, name) for name in _RESULT_FIELDS}
+
 class LoadTester:
 
     def __init__(self, base_url: str = "http://localhost:8000"):
         self.base_url = base_url
-        self.session = requests.Session()
+        # endpoint URLs are built once; the request callables run per request
+        self._health_url = f"{base_url}/health"
+        self._scans_url = f"{base_url}/scans"
+        self._templates_url = f"{base_url}/templates"
+        self._stats_url = f"{base_url}/stats"
+        self._scans_params = {"limit": 10}
+        # created per run, on that run's event loop; a tester runs one load
+        # test at a time, so overlapping tests each get their own tester
+        self.client: httpx.AsyncClient | None = None
     
     def run_load_test(
         self,
         test_name: str,
-        test_func: Callable,
+        test_func: Callable[[], Awaitable[None]],
         num_requests: int = 100,
         concurrent_users: int = 10,
         timeout: int = 30
     ) -> LoadTestResult:
 
-        response_times: List[float] = []
-        errors: List[str] = []
-        successful = 0
-        failed = 0
+        return asyncio.run(
+            self.run_load_test_async(test_name, test_func, num_requests, concurrent_users, timeout)
+        )
+    
+    async def run_load_test_async(
+        self,
+        test_name: str,
+        test_func: Callable[[], Awaitable[None]],
+        num_requests: int = 100,
+        concurrent_users: int = 10,
+        timeout: int = 30
+    ) -> LoadTestResult:
+
+        # request i writes its duration (integer ns) and outcome at index i
+        durations = np.empty(num_requests, dtype=np.int64)
+        ok = np.zeros(num_requests, dtype=bool)
+        # only a sample of errors is reported, so only that many are kept
+        errors: Deque[str] = deque(maxlen=_ERROR_SAMPLE_SIZE)
         
-        start_time = time.time()
+        start_time = _pc()
         
-        with ThreadPoolExecutor(max_workers=concurrent_users) as executor:
-            futures = [
-                executor.submit(self._execute_request, test_func, timeout)
-                for _ in range(num_requests)
-            ]
-            
-            for future in as_completed(futures):
-                try:
-                    duration, error = future.result()
-                    if error:
-                        failed += 1
-                        errors.append(error)
-                    else:
-                        successful += 1
-                        response_times.append(duration)
-                except Exception as e:
-                    failed += 1
-                    errors.append(str(e))
+        await self._run(test_func, num_requests, concurrent_users, timeout, durations, ok, errors)
         
-        total_duration = time.time() - start_time
+        total_duration = (_pc() - start_time) / 1e9
+
+        successful = int(ok.sum())
+        failed = num_requests - successful
         
-        if response_times:
-            sorted_times = sorted(response_times)
-            min_time = min(response_times)
-            max_time = max(response_times)
-            avg_time = statistics.mean(response_times)
-            median_time = statistics.median(response_times)
-            p95_time = sorted_times[int(len(sorted_times) * 0.95)]
-            p99_time = sorted_times[int(len(sorted_times) * 0.99)]
+        if successful:
+            # one vectorized pass; percentiles are linearly interpolated
+            times = durations[ok]
+            min_time, median_time, p95_time, p99_time, max_time = (
+                (np.percentile(times, [0, 50, 95, 99, 100]) / 1e9).tolist()
+            )
+            avg_time = float(times.mean()) / 1e9
         else:
             min_time = max_time = avg_time = median_time = p95_time = p99_time = 0.0
         
@@ -97,122 +120,147 @@ class LoadTester:
             p95_response_time=p95_time,
             p99_response_time=p99_time,
             requests_per_second=rps,
-            errors=errors[:10],
+            errors=list(errors),
             timestamp=datetime.utcnow().isoformat()
         )
     
-    def _execute_request(
+    async def _run(
+        self,
+        test_func: Callable[[], Awaitable[None]],
+        num_requests: int,
+        concurrent_users: int,
+        timeout: int,
+        durations: np.ndarray,
+        ok: np.ndarray,
+        errors: Deque[str]
+    ) -> None:
+
+        # one event loop multiplexes every simulated user; the semaphore and
+        # the connection pool both cap in-flight requests at concurrent_users
+        limits = httpx.Limits(
+            max_connections=concurrent_users,
+            max_keepalive_connections=concurrent_users
+        )
+        semaphore = asyncio.Semaphore(concurrent_users)
+        async with httpx.AsyncClient(limits=limits, timeout=timeout) as client:
+            self.client = client
+            try:
+                await asyncio.gather(*[
+                    self._execute_request(test_func, semaphore, i, durations, ok, errors)
+                    for i in range(num_requests)
+                ])
+            finally:
+                self.client = None
+    
+    async def _execute_request(
         self,
-        test_func: Callable,
-        timeout: int
-    ) -> tuple[float, str | None]:
+        test_func: Callable[[], Awaitable[None]],
+        semaphore: asyncio.Semaphore,
+        index: int,
+        durations: np.ndarray,
+        ok: np.ndarray,
+        errors: Deque[str]
+    ) -> None:
 
-        start = time.time()
-        try:
-            test_func()
-            duration = time.time() - start
-            return duration, None
-        except Exception as e:
-            duration = time.time() - start
-            return duration, str(e)
+        async with semaphore:
+            start = _pc()
+            try:
+                await test_func()
+                ok[index] = True
+            except Exception as e:
+                errors.append(str(e))
+            durations[index] = _pc() - start
     
     
-    def test_health_check(self):
+    async def test_health_check(self):
 
-        response = self.session.get(f"{self.base_url}/health", timeout=5)
+        response = await self.client.get(self._health_url, timeout=5)
         response.raise_for_status()
     
-    def test_list_scans(self):
+    async def test_list_scans(self):
 
-        response = self.session.get(
-            f"{self.base_url}/scans",
-            params={"limit": 10},
+        response = await self.client.get(
+            self._scans_url,
+            params=self._scans_params,
             timeout=10
         )
         response.raise_for_status()
     
-    def test_get_templates(self):
+    async def test_get_templates(self):
 
-        response = self.session.get(f"{self.base_url}/templates", timeout=10)
+        response = await self.client.get(self._templates_url, timeout=10)
         response.raise_for_status()
     
-    def test_stats_endpoint(self):
+    async def test_stats_endpoint(self):
 
-        response = self.session.get(f"{self.base_url}/stats", timeout=10)
+        response = await self.client.get(self._stats_url, timeout=10)
         response.raise_for_status()
 
-def run_all_load_tests(base_url: str = "http://localhost:8000") -> Dict[str, Any]:
+# (title, result key, LoadTester method, num_requests, concurrent_users, timeout)
+_ENDPOINT_TESTS = [
+    ("Test 1: Health Check (High Load)", "health_check_high_load", "test_health_check", 1000, 50, 5),
+    ("Test 2: List Scans (Moderate Load)", "list_scans_moderate", "test_list_scans", 200, 20, 10),
+    ("Test 3: Get Templates (Light Load)", "get_templates_light", "test_get_templates", 100, 10, 10),
+    ("Test 4: Stats Endpoint (Sustained Load)", "stats_sustained", "test_stats_endpoint", 500, 25, 10),
+]
+_SPIKE_TEST = ("Test 5: Spike Test (Sudden High Load)", "spike_test", "test_health_check", 500, 100, 5)
+
+async def _run_spec(base_url: str, spec) -> LoadTestResult:
 
+    _title, name, method, num_requests, concurrent_users, timeout = spec
     tester = LoadTester(base_url)
+    return await tester.run_load_test_async(
+        test_name=name,
+        test_func=getattr(tester, method),
+        num_requests=num_requests,
+        concurrent_users=concurrent_users,
+        timeout=timeout
+    )
+
+async def _run_specs(base_url: str, specs, overlap: bool) -> List[LoadTestResult]:
+
+    if overlap:
+        return list(await asyncio.gather(*[_run_spec(base_url, spec) for spec in specs]))
+    return [await _run_spec(base_url, spec) for spec in specs]
+
+def run_all_load_tests(base_url: str = "http://localhost:8000", overlap: bool = False) -> Dict[str, Any]:
+    """Run the load tests against ``base_url``.
+
+    By default each test runs alone so its numbers are measured in
+    isolation. With ``overlap`` the four endpoint tests run at the same time
+    to stress the backend; the spike test always runs on its own afterwards.
+    """
     results = {}
     
     print("Starting Load Tests...")
     print(f"Target: {base_url}")
     print("-" * 80)
     
-    print("\nTest 1: Health Check (High Load)")
-    result = tester.run_load_test(
-        test_name="health_check_high_load",
-        test_func=tester.test_health_check,
-        num_requests=1000,
-        concurrent_users=50,
-        timeout=5
-    )
-    results["health_check_high_load"] = asdict(result)
-    print_result_summary(result)
+    specs = _ENDPOINT_TESTS + [_SPIKE_TEST]
+    runs = asyncio.run(_run_specs(base_url, _ENDPOINT_TESTS, overlap))
+    runs.append(asyncio.run(_run_spec(base_url, _SPIKE_TEST)))
     
-    print("\nTest 2: List Scans (Moderate Load)")
-    result = tester.run_load_test(
-        test_name="list_scans_moderate",
-        test_func=tester.test_list_scans,
-        num_requests=200,
-        concurrent_users=20,
-        timeout=10
-    )
-    results["list_scans_moderate"] = asdict(result)
-    print_result_summary(result)
-    
-    print("\nTest 3: Get Templates (Light Load)")
-    result = tester.run_load_test(
-        test_name="get_templates_light",
-        test_func=tester.test_get_templates,
-        num_requests=100,
-        concurrent_users=10,
-        timeout=10
-    )
-    results["get_templates_light"] = asdict(result)
-    print_result_summary(result)
-    
-    print("\nTest 4: Stats Endpoint (Sustained Load)")
-    result = tester.run_load_test(
-        test_name="stats_sustained",
-        test_func=tester.test_stats_endpoint,
-        num_requests=500,
-        concurrent_users=25,
-        timeout=10
-    )
-    results["stats_sustained"] = asdict(result)
-    print_result_summary(result)
-    
-    print("\nTest 5: Spike Test (Sudden High Load)")
-    result = tester.run_load_test(
-        test_name="spike_test",
-        test_func=tester.test_health_check,
-        num_requests=500,
-        concurrent_users=100,
-        timeout=5
-    )
-    results["spike_test"] = asdict(result)
-    print_result_summary(result)
+    # summaries are assembled once all tests finish and written in one go
+    out = io.StringIO()
+    with redirect_stdout(out):
+        for (title, name, *_), result in zip(specs, runs):
+            results[name] = _result_dict(result)
+            print(f"\n{title}")
+            print_result_summary(result)
+    sys.stdout.write(out.getvalue())
     
     print("\n" + "=" * 80)
     print("OVERALL LOAD TEST SUMMARY")
     print("=" * 80)
     
-    total_requests = sum(r["total_requests"] for r in results.values())
-    total_successful = sum(r["successful_requests"] for r in results.values())
-    total_failed = sum(r["failed_requests"] for r in results.values())
-    avg_rps = statistics.mean(r["requests_per_second"] for r in results.values())
+    total_requests = total_successful = total_failed = 0
+    rps_sum = 0.0
+    for r in results.values():
+        total_requests += r["total_requests"]
+        total_successful += r["successful_requests"]
+        total_failed += r["failed_requests"]
+        rps_sum += r["requests_per_second"]
+    avg_rps = rps_sum / len(results)
     
     print(f"Total Requests:     {total_requests}")
     print(f"Successful:         {total_successful} ({total_successful/total_requests*100:.1f}%)")
@@ -233,8 +281,9 @@ def run_all_load_tests(base_url: str = "http://localhost:8000") -> Dict[str, Any
     print("=" * 80)
     
     output_file = "load_test_results.json"
+    # compact, and serialized in one piece before a single write
     with open(output_file, "w") as f:
-        json.dump(results, f, indent=2)
+        f.write(json.dumps(results, separators=(",", ":")))
     print(f"\nResults saved to: {output_file}")
     
     return results
@@ -257,12 +306,11 @@ def print_result_summary(result: LoadTestResult):
         print(f"  Errors (sample):   {result.errors[0]}")
 
 if __name__ == "__main__":
-    import sys
-    
-    base_url = sys.argv[1] if len(sys.argv) > 1 else "http://localhost:8000"
+    args = [arg for arg in sys.argv[1:] if arg != "--overlap"]
+    base_url = args[0] if args else "http://localhost:8000"
     
     try:
-        run_all_load_tests(base_url)
+        run_all_load_tests(base_url, overlap="--overlap" in sys.argv[1:])
     except KeyboardInterrupt:
         print("\n\n️  Load test interrupted by user")
         sys.exit(1)
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import pytest
+import time
+from backend.utils.monitoring import MetricsCollector, HealthChecker, _SystemSampler
+
+
+def _burn_cpu(seconds):
+
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        pass
+
+
+class TestMetricsCollector:
+
+    def test_request_average_before_wrap(self):
+
+        collector = MetricsCollector(max_history=4)
+
+        for duration in (0.1, 0.2, 0.3):
+            collector.record_request(duration)
+
+        summary = collector.get_summary()
+        assert summary["average_request_time_ms"] == pytest.approx(200.0)
+        assert summary["p50_request_time_ms"] == pytest.approx(200.0)
+
+    def test_request_average_after_wrap(self):
+
+        collector = MetricsCollector(max_history=4)
+
+        # the first two durations are overwritten once the buffer wraps, and
+        # the average is over the four that remain
+        for duration in (10.0, 20.0, 0.1, 0.2, 0.3, 0.4):
+            collector.record_request(duration)
+
+        summary = collector.get_summary()
+        assert summary["average_request_time_ms"] == pytest.approx(250.0)
+        assert summary["p50_request_time_ms"] == pytest.approx(250.0)
+        assert summary["p95_request_time_ms"] == pytest.approx(385.0)
+
+    def test_no_requests(self):
+
+        summary = MetricsCollector().get_summary()
+
+        assert summary["average_request_time_ms"] == 0.0
+        assert summary["p95_request_time_ms"] == 0.0
+
+    def test_scan_moves_from_active_to_completed(self):
+
+        collector = MetricsCollector()
+
+        collector.start_scan("scan-1", "https://example.com")
+        collector.update_scan_metrics("scan-1", pages_scanned=3)
+        assert collector.get_summary()["active_scans"] == 1
+
+        collector.end_scan("scan-1", "completed")
+
+        summary = collector.get_summary()
+        assert summary["active_scans"] == 0
+        assert summary["successful_scans"] == 1
+        assert summary["success_rate"] == 100
+
+        metrics = collector.get_scan_metrics("scan-1")
+        assert metrics.status == "completed"
+        assert metrics.pages_scanned == 3
+        assert metrics.duration is not None and metrics.duration >= 0
+
+    def test_failed_and_unknown_scans(self):
+
+        collector = MetricsCollector()
+
+        collector.start_scan("scan-1", "https://example.com")
+        collector.end_scan("scan-1", "failed")
+        collector.end_scan("missing", "completed")
+
+        summary = collector.get_summary()
+        assert summary["failed_scans"] == 1
+        assert summary["successful_scans"] == 0
+        assert collector.get_scan_metrics("missing") is None
+
+    def test_completed_scans_capped_at_max_history(self):
+
+        collector = MetricsCollector(max_history=2)
+
+        for i in range(3):
+            collector.start_scan(f"scan-{i}", "https://example.com")
+            collector.end_scan(f"scan-{i}")
+
+        assert collector.get_scan_metrics("scan-0") is None
+        assert collector.get_scan_metrics("scan-1") is not None
+        assert collector.get_scan_metrics("scan-2") is not None
+        assert collector.get_summary()["total_scans"] == 3
+
+    def test_error_breakdown(self):
+
+        collector = MetricsCollector()
+
+        collector.record_error("timeout")
+        collector.record_error("timeout")
+        collector.record_error("dns")
+
+        summary = collector.get_summary()
+        assert summary["total_errors"] == 3
+        assert summary["error_breakdown"] == {"timeout": 2, "dns": 1}
+        assert "error_breakdown" not in collector.get_summary(include_breakdown=False)
+
+
+class TestSystemSampler:
+
+    def test_interval_follows_cpu_load(self):
+
+        sampler = _SystemSampler(interval=1.0, min_interval=0.5, max_interval=5.0)
+
+        assert sampler._next_interval(95.0) == 0.5
+        assert sampler._next_interval(50.0) == 1.0
+        assert sampler._next_interval(5.0) == 5.0
+
+    def test_first_published_snapshot_sees_load(self):
+
+        # one busy process per CPU, so the host is saturated while the
+        # sampler takes its first tick
+        context = multiprocessing.get_context("spawn")
+        burners = [
+            context.Process(target=_burn_cpu, args=(3.0,), daemon=True)
+            for _ in range(os.cpu_count() or 1)
+        ]
+        for process in burners:
+            process.start()
+        time.sleep(0.5)
+
+        sampler = _SystemSampler(interval=0.5, min_interval=0.5, max_interval=0.5)
+        try:
+            sampler.start()
+            deadline = time.monotonic() + 2.0
+            while sampler._snapshot is None and time.monotonic() < deadline:
+                time.sleep(0.05)
+            snapshot = sampler._snapshot
+        finally:
+            sampler.stop()
+            for process in burners:
+                process.terminate()
+                process.join()
+
+        assert snapshot is not None
+        assert snapshot["cpu_percent"] > 50
+
+    def test_latest_returns_snapshot(self):
+
+        sampler = _SystemSampler(interval=60.0)
+        try:
+            snapshot = sampler.latest()
+            assert set(snapshot) >= {"cpu_percent", "memory_percent", "disk_percent"}
+            assert sampler.latest() is snapshot
+        finally:
+            sampler.stop()
+
+
+class TestHealthChecker:
+
+    def test_application_health_uses_collector(self):
+
+        collector = MetricsCollector()
+        collector.start_scan("scan-1", "https://example.com")
+        collector.end_scan("scan-1", "failed")
+
+        healthy, data = HealthChecker(collector).check_application_health()
+
+        assert healthy is False
+        assert data["checks"]["reasonable_success_rate"] is False
+        assert data["checks"]["active_scans_ok"] is True
+
+    def test_application_checks_are_not_shared_between_calls(self):
+
+        checker = HealthChecker(MetricsCollector())
+
+        _, first = checker.check_application_health()
+        _, second = checker.check_application_health()
+
+        assert first["checks"] is not second["checks"]
+        assert first["checks"] == second["checks"]
@@ -1,6 +1,8 @@
 
 from __future__ import annotations
 
+import gc
+import os
 import pytest
 import time
 from backend.core.scanner import Scanner
@@ -10,18 +12,21 @@ from backend.security.rate_limiter import RateLimiter, DomainRateLimiter
 import tempfile
 from pathlib import Path
 
+# integer nanoseconds from a monotonic clock, unaffected by NTP steps
+_pc = time.perf_counter_ns
+
 class TestScannerPerformance:
 
     def test_scanner_initialization_time(self):
 
-        start = time.time()
+        start = _pc()
         scanner = Scanner(
             "https://example.com",
             ["GDPR"],
             "Quick/Safe",
             enable_metrics=False
         )
-        duration = time.time() - start
+        duration = (_pc() - start) / 1e9
 
         assert scanner is not None
         assert duration < 0.1, f"Scanner initialization took {duration:.3f}s (should be < 0.1s)"
@@ -30,12 +35,12 @@ class TestScannerPerformance:
 
         limiter = RateLimiter(requests_per_second=100.0)
         
-        start = time.time()
+        start = _pc()
         for _ in range(100):
             limiter.acquire()
-        duration = time.time() - start
+        duration = (_pc() - start) / 1e9
         
-        assert duration < 2.0, f"Rate limiter took {duration:.3f}s for 100 requests"
+        assert duration < 1.1, f"Rate limiter took {duration:.3f}s for 100 requests"
     
     def test_domain_rate_limiter_performance(self):
 
@@ -43,30 +48,69 @@ class TestScannerPerformance:
         
         domains = [f"domain{i}.com" for i in range(10)]
         
-        start = time.time()
+        start = _pc()
         for domain in domains:
             for _ in range(10):
                 limiter.acquire(domain)
-        duration = time.time() - start
+        duration = (_pc() - start) / 1e9
         
         assert duration < 3.0, f"Domain rate limiter took {duration:.3f}s"
 
-class TestDatabasePerformance:
+# the database (file, schema and indexes) is created once for the module;
+# each test that used it leaves it empty for the next
+@pytest.fixture(scope="module")
+def temp_db():
 
-    @pytest.fixture
-    def temp_db(self):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield ScanDatabase(Path(tmpdir) / "perf.db")
 
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-            db_path = f.name
-        
-        db = ScanDatabase(db_path)
-        yield db
-        
-        Path(db_path).unlink(missing_ok=True)
+
+@pytest.fixture(autouse=True)
+def _empty_temp_db(request):
+
+    yield
+    if "temp_db" in request.fixturenames:
+        request.getfixturevalue("temp_db").reset()
+
+@pytest.fixture(scope="class")
+def _stable_timing():
+
+    # the cache benchmarks measure microseconds: keep them on one CPU, at a
+    # higher priority where allowed, and without a GC pass mid-measurement
+    old_affinity = None
+    if hasattr(os, "sched_setaffinity"):
+        old_affinity = os.sched_getaffinity(0)
+        os.sched_setaffinity(0, {min(old_affinity)})
+    try:
+        os.nice(-5)
+        reniced = True
+    except (AttributeError, PermissionError):
+        reniced = False
+    gc.collect()
+    gc.disable()
+
+    yield
+
+    gc.enable()
+    if reniced:
+        os.nice(5)
+    if old_affinity is not None:
+        os.sched_setaffinity(0, old_affinity)
+
+def _seed(db, n):
+
+    # the read benchmarks only need rows to exist; one batch insert instead
+    # of n create_scan calls
+    db.create_scans_bulk([
+        (f"scan_{i}", f"https://example{i}.com", "Quick/Safe", ["GDPR"])
+        for i in range(n)
+    ])
+
+class TestDatabasePerformance:
     
     def test_bulk_insert_performance(self, temp_db):
 
-        start = time.time()
+        start = _pc()
         
         for i in range(100):
             temp_db.create_scan(
@@ -76,44 +120,33 @@ class TestDatabasePerformance:
                 standards=["GDPR"]
             )
         
-        duration = time.time() - start
+        duration = (_pc() - start) / 1e9
         
         assert duration < 1.0, f"Bulk insert took {duration:.3f}s (should be < 1s)"
     
     def test_query_performance(self, temp_db):
 
-        for i in range(100):
-            temp_db.create_scan(
-                scan_id=f"scan_{i}",
-                url=f"https://example{i}.com",
-                mode="Quick/Safe",
-                standards=["GDPR"]
-            )
+        _seed(temp_db, 100)
         
-        start = time.time()
+        start = _pc()
         scans = temp_db.get_scans(limit=50)
-        duration = time.time() - start
+        duration = (_pc() - start) / 1e9
         
         assert len(scans) == 50
         assert duration < 0.1, f"Query took {duration:.3f}s (should be < 0.1s)"
     
     def test_statistics_performance(self, temp_db):
 
-        for i in range(100):
-            temp_db.create_scan(
-                scan_id=f"scan_{i}",
-                url=f"https://example{i}.com",
-                mode="Quick/Safe",
-                standards=["GDPR"]
-            )
+        _seed(temp_db, 100)
         
-        start = time.time()
+        start = _pc()
         stats = temp_db.get_statistics()
-        duration = time.time() - start
+        duration = (_pc() - start) / 1e9
         
         assert stats["total_scans"] == 100
         assert duration < 0.2, f"Statistics took {duration:.3f}s (should be < 0.2s)"
 
+@pytest.mark.usefixtures("_stable_timing")
 class TestCachePerformance:
 
     def test_cache_hit_performance(self):
@@ -123,23 +156,23 @@ class TestCachePerformance:
         for i in range(100):
             cache.set(f"key_{i}", f"value_{i}")
         
-        start = time.time()
+        start = _pc()
         for i in range(100):
             value = cache.get(f"key_{i}")
             assert value == f"value_{i}"
-        duration = time.time() - start
+        duration = (_pc() - start) / 1e9
         
-        assert duration < 0.01, f"100 cache hits took {duration:.3f}s (should be < 0.01s)"
+        assert duration < 0.002, f"100 cache hits took {duration:.4f}s (should be < 0.002s)"
     
     def test_cache_miss_performance(self):
 
         cache = Cache(default_ttl=60)
         
-        start = time.time()
+        start = _pc()
         for i in range(100):
             value = cache.get(f"nonexistent_{i}")
             assert value is None
-        duration = time.time() - start
+        duration = (_pc() - start) / 1e9
         
         assert duration < 0.01, f"100 cache misses took {duration:.3f}s"
     
@@ -147,10 +180,10 @@ class TestCachePerformance:
 
         cache = Cache(default_ttl=60)
         
-        start = time.time()
+        start = _pc()
         for i in range(200):
             cache.set(f"key_{i}", f"value_{i}")
-        duration = time.time() - start
+        duration = (_pc() - start) / 1e9
         
         assert duration < 0.1, f"Cache operations took {duration:.3f}s"
         assert cache.size() == 200
@@ -202,14 +235,33 @@ class TestConcurrency:
             limiter.acquire()
             return True
         
-        start = time.time()
+        start = _pc()
         with ThreadPoolExecutor(max_workers=10) as executor:
             futures = [executor.submit(acquire_token) for _ in range(100)]
             results = [f.result() for f in futures]
-        duration = time.time() - start
+        duration = (_pc() - start) / 1e9
         
         assert all(results)
         assert duration < 3.0, f"Concurrent rate limiting took {duration:.3f}s"
+
+    def test_concurrent_domain_rate_limiter(self):
+
+        from concurrent.futures import ThreadPoolExecutor
+        
+        limiter = DomainRateLimiter(requests_per_second=100.0)
+        domains = [f"domain{i}.com" for i in range(100)]
+        
+        def acquire_tokens(domain):
+            return all(limiter.acquire(domain) for _ in range(10))
+        
+        start = _pc()
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            results = list(executor.map(acquire_tokens, domains))
+        duration = (_pc() - start) / 1e9
+        
+        assert all(results)
+        assert len({id(limiter.get_limiter(d)) for d in domains}) == len(domains)
+        assert duration < 1.0, f"Concurrent domain rate limiting took {duration:.3f}s"
     
     def test_concurrent_cache_access(self):
 
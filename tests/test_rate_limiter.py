@@ -35,6 +35,35 @@ class TestRateLimiter:
 
         assert limiter.acquire(blocking=False) is True
 
+    def test_blocking_acquire_past_burst_sleeps_for_deficit(self):
+
+        limiter = RateLimiter(requests_per_second=20.0, burst_size=1)
+        limiter.acquire()
+
+        start = time.monotonic()
+        assert limiter.acquire() is True
+        first_wait = time.monotonic() - start
+
+        # the token is reserved up front, leaving the bucket in debt, so the
+        # next caller queues behind it for another full interval
+        assert limiter.tokens < 0
+        assert limiter.acquire() is True
+        total_wait = time.monotonic() - start
+
+        assert 0.04 <= first_wait < 0.09
+        assert 0.09 <= total_wait < 0.14
+
+    def test_blocking_acquire_gives_up_when_deficit_exceeds_timeout(self):
+
+        limiter = RateLimiter(requests_per_second=1.0, burst_size=1)
+        limiter.acquire()
+
+        start = time.monotonic()
+        assert limiter.acquire(timeout=0.5) is False
+        assert time.monotonic() - start < 0.05
+        # nothing was reserved for the call that gave up
+        assert limiter.tokens >= 0
+
     def test_reset(self):
 
         limiter = RateLimiter(requests_per_second=1.0, burst_size=1)
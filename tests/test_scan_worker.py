@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import multiprocessing
+import queue
+import subprocess
+import sys
+from pathlib import Path
+
+from backend.core.analysis import FindingDetail
+from gtk_gui.src.core.scan_worker import run_scan_job, shown_findings, stored_findings
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+class TestScanWorker:
+
+    def test_worker_imports_skip_gtk(self):
+
+        # a spawned worker re-runs the launcher as __mp_main__ and imports
+        # this module; neither may load GTK
+        code = (
+            "import runpy, sys\n"
+            "runpy.run_path('main_gtk.py', run_name='__mp_main__')\n"
+            "runpy.run_path('gtk_gui/main.py', run_name='__mp_main__')\n"
+            "import gtk_gui.src.core.scan_worker\n"
+            "assert not [m for m in sys.modules if m == 'gi' or m.startswith('gi.')]\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=REPO_ROOT, capture_output=True, text=True
+        )
+        assert result.returncode == 0, result.stderr
+
+    def test_failed_scan_reports_error(self):
+
+        progress, results = queue.Queue(), queue.Queue()
+
+        run_scan_job("not a url", ["GDPR"], "Quick/Safe", progress, results)
+
+        ok, message, scan_id = results.get_nowait()
+        assert ok is False
+        assert message
+        assert scan_id is None
+
+    def test_result_comes_back_from_spawned_worker(self):
+
+        context = multiprocessing.get_context("spawn")
+        progress, results = context.Queue(), context.Queue()
+        process = context.Process(
+            target=run_scan_job,
+            args=("not a url", ["GDPR"], "Quick/Safe", progress, results),
+            daemon=True,
+        )
+        process.start()
+        try:
+            ok, message, _scan_id = results.get(timeout=30)
+        finally:
+            process.join(timeout=5)
+
+        assert ok is False and message
+        assert process.exitcode == 0
+
+    def test_finding_filters(self):
+
+        findings = [
+            FindingDetail(severity="high", message="a"),
+            FindingDetail(severity="pass", message="b"),
+            FindingDetail(severity="PASS", message="c"),
+            FindingDetail(severity="", message="d"),
+        ]
+
+        # the database keeps everything but an exact "pass"; the results
+        # view also drops empty and differently cased passes
+        assert [f.message for f in stored_findings(findings)] == ["a", "c", "d"]
+        assert [f.message for f in shown_findings(findings)] == ["a"]